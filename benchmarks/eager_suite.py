@@ -0,0 +1,222 @@
+"""
+Microbenchmark suite of the eager bridge, with stored baselines and regression reports.
+
+Benchmarks (all run on CPU, no GPU or network required):
+- apply/<op>/{jit,cached,fastpath}: eager calls (of `hilt.eager.api`, and `load` of a
+  fragment) compiled from scratch, served from the cache, and served by the pure-Python
+  engine (where supported)
+- pack/depth=<d>, unpack/depth=<d>: pytree (de)serialization vs. tree depth
+- make_pointer/{virtual,torch}/numel=<n>: `ReferenceTensor.make_pointer` vs. tensor size
+- import/<module>/{cold,warm}: importing in a fresh interpreter, without (cold)
+  and with (warm) compiled bytecode
+
+Usage:
+# records the baseline of this machine
+python benchmarks/eager_suite.py --save-baseline
+# compares against it (which must have been recorded first), exiting with 1 on regressions
+python benchmarks/eager_suite.py --compare
+"""
+import re
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import torch
+import cutlass.cute
+import hilt
+import hilt.eager.api as cute
+from hilt.eager import fastpath
+from hilt.eager.core import (
+    cute_apply,
+    cache_clear,
+    create_rapier_tensor_from_tensor_struct,
+    create_tensor_struct_from_rapier_tensor_with_signature,
+)
+from hilt.eager.tensor import ReferenceTensor, from_torch
+from hilt.eager.layout import CuTeLayout
+
+import import_time
+from serialization import make_tree
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "eager.json"
+IMPORT_STATEMENTS = {
+    "hilt": "import hilt",
+    "hilt.eager.api": "import hilt.eager.api",
+}
+
+
+def measure(fn: Callable[[], Any], repeats: int, setup: Callable[[], Any] | None = None) -> list[float]:
+    timings = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+@cute_apply()
+def load(fragment: cutlass.cute.Tensor) -> cutlass.cute.TensorSSA:
+    # `fragment.load()` on eager tensors only builds the SSA value in Python,
+    # this loads within the JIT instead
+    return fragment.load()
+
+
+def _apply_cases() -> dict[str, Callable[[], Any]]:
+    layout0 = CuTeLayout(shape=(2, 3), stride=(1, 3))
+    layout1 = CuTeLayout(shape=(3, 2), stride=(2, 1))
+    tensor = from_torch(torch.empty(7, 15, dtype=torch.bfloat16), memspace="gmem")
+    fragment = ReferenceTensor(shape=(7, 15), stride=(1, 7), dtype=cute.Float16, memspace="rmem")
+    return {
+        "make_layout": lambda: cute.make_layout(shape=(2, 3), stride=(1, 3)),
+        "composition": lambda: cute.composition(layout0, layout1),
+        "blocked_product": lambda: cute.blocked_product(layout0, layout1),
+        "make_fragment_like": lambda: cute.make_fragment_like(tensor, cute.Float16),
+        "load": lambda: load(fragment),
+    }
+
+
+def bench_apply(repeats: int) -> Iterator[tuple[str, list[float]]]:
+    for name, fn in _apply_cases().items():
+        previous = fastpath.is_fastpath_enabled()
+        try:
+            fastpath.set_fastpath_enabled(False)
+            yield f"apply/{name}/jit", measure(fn, repeats=repeats, setup=cache_clear)
+            fn()
+            yield f"apply/{name}/cached", measure(fn, repeats=repeats * 20)
+            if name in fastpath.FASTPATH_FUNCTIONS:
+                fastpath.set_fastpath_enabled(True)
+                yield f"apply/{name}/fastpath", measure(fn, repeats=repeats * 20)
+        finally:
+            fastpath.set_fastpath_enabled(previous)
+
+
+def bench_serialization(repeats: int, depths: list[int], width: int) -> Iterator[tuple[str, list[float]]]:
+    for depth in depths:
+        tree = make_tree(depth, width, counter=[0])
+        serialized, _ = create_tensor_struct_from_rapier_tensor_with_signature(tree)
+        yield f"pack/depth={depth}", measure(
+            lambda: create_tensor_struct_from_rapier_tensor_with_signature(tree),
+            repeats=repeats * 20,
+        )
+        yield f"unpack/depth={depth}", measure(
+            lambda: create_rapier_tensor_from_tensor_struct(serialized),
+            repeats=repeats * 20,
+        )
+
+
+def bench_make_pointer(repeats: int, sizes: list[int]) -> Iterator[tuple[str, list[float]]]:
+    for numel in sizes:
+        tensor = ReferenceTensor(shape=(numel,), stride=(1,), dtype=cute.Float32, memspace="gmem")
+        for virtual, name in ((True, "virtual"), (False, "torch")):
+            yield f"make_pointer/{name}/numel={numel}", measure(
+                lambda: tensor.make_pointer(virtual=virtual),
+                repeats=repeats * 20,
+            )
+
+
+def bench_import(repeats: int) -> Iterator[tuple[str, list[float]]]:
+    for name, statement in IMPORT_STATEMENTS.items():
+        # a fresh bytecode cache per run forces every module to be compiled
+        timings = []
+        for _ in range(repeats):
+            with tempfile.TemporaryDirectory() as directory:
+                timings.extend(import_time.measure(statement, repeats=1, env={"PYTHONPYCACHEPREFIX": directory}))
+        yield f"import/{name}/cold", timings
+        import_time.measure(statement, repeats=1)
+        yield f"import/{name}/warm", import_time.measure(statement, repeats=repeats)
+
+
+def run(args: argparse.Namespace) -> dict[str, dict[str, float]]:
+    benchmarks = [
+        bench_apply(args.repeats),
+        bench_serialization(args.repeats, depths=args.depth, width=args.width),
+        bench_make_pointer(args.repeats, sizes=args.numel),
+    ]
+    if not args.skip_import:
+        benchmarks.append(bench_import(args.repeats))
+
+    pattern = re.compile(args.filter)
+    results = {}
+    for benchmark in benchmarks:
+        for name, timings in benchmark:
+            if not pattern.search(name):
+                continue
+            results[name] = {
+                "median": statistics.median(timings),
+                "min": min(timings),
+            }
+            print(f"{name:<48} median {results[name]['median'] * 1e6:12.2f} us  (min {results[name]['min'] * 1e6:12.2f} us)")
+    return results
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], threshold: float) -> list[str]:
+    """Prints the ratio of each median to its baseline, returning the names of regressions."""
+    regressions = []
+    print(f"\n{'benchmark':<48} {'baseline (us)':>14} {'current (us)':>14} {'ratio':>8}")
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:<48} {'-':>14} {result['median'] * 1e6:>14.2f} {'new':>8}")
+            continue
+        ratio = result["median"] / baseline[name]["median"]
+        flag = ""
+        if ratio > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<48} {baseline[name]['median'] * 1e6:>14.2f} {result['median'] * 1e6:>14.2f} {ratio:>7.2f}x{flag}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--filter", type=str, default="", help="Only runs benchmarks whose names match this regex")
+    parser.add_argument("--depth", type=int, nargs="+", default=[2, 4, 6])
+    parser.add_argument("--width", type=int, default=3)
+    parser.add_argument("--numel", type=int, nargs="+", default=[1 << 10, 1 << 20, 1 << 26])
+    parser.add_argument("--skip-import", action="store_true")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Stores the results as the baseline")
+    parser.add_argument("--compare", action="store_true", help="Compares the results against the baseline")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Slowdown ratio reported as a regression")
+    parser.add_argument("--output", type=Path, default=None, help="Also writes the results as JSON")
+    args = parser.parse_args()
+    if args.compare and not args.save_baseline and not args.baseline.exists():
+        parser.error(
+            f"No baseline at {args.baseline}: baselines are machine-specific and not committed, "
+            f"record one on this machine with `python {Path(__file__).name} --save-baseline` first"
+        )
+
+    results = run(args)
+    document = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "hilt": hilt.__version__,
+            "torch": torch.__version__,
+        },
+        "results": results,
+    }
+    if args.output is not None:
+        args.output.write_text(json.dumps(document, indent=2))
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(document, indent=2))
+        print(f"\nSaved baseline to {args.baseline}")
+    if args.compare:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(results, baseline["results"], threshold=args.threshold)
+        if len(regressions) > 0:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.2f}x")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
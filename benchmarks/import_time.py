@@ -0,0 +1,60 @@
+"""
+Cold-start benchmark of `import hilt` and `import hilt.eager.api`.
+
+Each statement runs in a fresh interpreter. The "all" variants touch every
+public name, which is what importing used to cost before names were
+resolved on first access.
+
+Usage:
+python benchmarks/import_time.py --repeats 5
+"""
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+
+STATEMENTS = {
+    "import hilt": "import hilt",
+    "import hilt + one name": "import hilt; hilt.make_inverse_tv",
+    "import hilt + all names": "import hilt; [getattr(hilt, name) for name in hilt.__all__]",
+    "import hilt.eager.api": "import hilt.eager.api",
+    "import hilt.eager.api + one name": "import hilt.eager.api as cute; cute.composition",
+    "import hilt.eager.api + all names": "import hilt.eager.api as cute; [getattr(cute, name) for name in cute.__all__]",
+}
+
+# measured within the child, so that interpreter startup is excluded
+TEMPLATE = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(statement: str, repeats: int, env: dict[str, str] | None = None) -> list[float]:
+    timings = []
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, "-W", "ignore", "-c", TEMPLATE.format(statement=statement)],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=None if env is None else {**os.environ, **env},
+        )
+        timings.append(float(output.stdout.strip().splitlines()[-1]))
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, statement in STATEMENTS.items():
+        timings = measure(statement, repeats=args.repeats)
+        print(f"{name:<36} median {statistics.median(timings) * 1000:8.1f} ms  (min {min(timings) * 1000:8.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Time and memory of building the inverse of TV layouts, as dictionaries
+(`make_inverse_tv`) and as arrays (`make_compact_inverse_tv`).
+
+Memory is measured with `tracemalloc`: "retained" is what the inverse holds
+once built, "peak" includes temporaries.
+
+Usage:
+python benchmarks/inverse_tv.py --repeats 3
+"""
+import time
+import argparse
+import statistics
+import tracemalloc
+from typing import Any, Callable
+from hilt.pycute_utils import Layout
+from hilt.layout_tv import make_inverse_tv, make_compact_inverse_tv
+
+# name -> (layout_tv, maybe_duplicates), over column-major tiles
+LAYOUTS_TV = {
+    # 128 threads x 128 values over a 128x128 tile
+    "128x128 tile, 128 thr x 128 val": (Layout(((32, 4), (4, 32)), ((4, 128), (1, 512))), False),
+    # 256 threads x 64 values over a 128x128 tile
+    "128x128 tile, 256 thr x 64 val": (Layout(((32, 8), (4, 16)), ((4, 128), (1, 1024))), False),
+    # 128 threads x 256 values over a 256x128 tile
+    "256x128 tile, 128 thr x 256 val": (Layout(((32, 4), (8, 32)), ((8, 256), (1, 1024))), False),
+    # groups of 4 threads holding the same values, over a 32x32 tile
+    "32x32 tile, 128 thr x 32 val (4x duplicates)": (Layout(((32, 4), (4, 8)), ((4, 0), (1, 128))), True),
+}
+
+
+def measure(build: Callable[[], Any], repeats: int) -> tuple[float, int, int]:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        build()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    inverse_tv = build()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del inverse_tv
+    return statistics.median(timings), retained, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    for name, (layout_tv, maybe_duplicates) in LAYOUTS_TV.items():
+        print(name)
+        for kind, make in (("dict", make_inverse_tv), ("compact", make_compact_inverse_tv)):
+            seconds, retained, peak = measure(
+                lambda: make(layout_tv, maybe_duplicates=maybe_duplicates),
+                repeats=args.repeats,
+            )
+            print(f"  {kind:<8} {seconds * 1e3:10.2f} ms  retained {retained / 2 ** 20:8.2f} MiB  peak {peak / 2 ** 20:8.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Sweep over tile configurations, evaluated serially (`batch`) and with `parallel_map`.
+
+Both run with a cold cache, the pool is started (and warmed up) before timing.
+
+Usage:
+python benchmarks/parallel_map.py --num-configs 256 --workers 8
+"""
+import time
+import argparse
+import itertools
+import cutlass.cute as cute
+from typing import Any
+import hilt.eager
+from hilt.eager.core import cute_apply, cache_clear
+from hilt.eager.parallel import get_pool, shutdown_pools
+from hilt.eager.layout import CuTeLayout
+
+
+def tile_and_partition(layout: Any, tiler: Any, coord: Any) -> Any:
+    return cute.zipped_divide(cute.composition(layout, layout), tiler), cute.size(layout), coord
+
+
+def make_configs(num_configs: int) -> list[tuple]:
+    configs = []
+    for m, n, tm, tn in itertools.product([64, 128, 256, 512], [32, 64, 128, 256], [2, 4, 8, 16], [2, 4, 8, 16]):
+        layout = CuTeLayout(shape=(m, n), stride=(n, 1))
+        configs.append((layout, (tm, tn), len(configs)))
+    return configs[:num_configs]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--num-configs", type=int, default=256)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--chunksize", type=int, default=None)
+    args = parser.parse_args()
+
+    configs = make_configs(args.num_configs)
+    fn = cute_apply()(tile_and_partition)
+
+    start = time.perf_counter()
+    serial_outputs = fn.batch(configs)
+    serial_time = time.perf_counter() - start
+
+    # warms up the workers with an unrelated sweep
+    cache_clear()
+    hilt.eager.parallel_map(fn, make_configs(2 * args.workers)[::-1], workers=args.workers, chunksize=1)
+    cache_clear()
+    get_pool(args.workers)
+
+    start = time.perf_counter()
+    parallel_outputs = hilt.eager.parallel_map(fn, configs, workers=args.workers, chunksize=args.chunksize)
+    parallel_time = time.perf_counter() - start
+    shutdown_pools()
+
+    assert [str(output) for output in serial_outputs] == [str(output) for output in parallel_outputs]
+    print(f"{len(configs)} configs: batch {serial_time:.2f}s, parallel_map ({args.workers} workers) {parallel_time:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Overhead of serializing eager arguments and outputs on deep nested trees.
+
+Times cache hits of `cute_apply`, which consist of serializing the inputs,
+building the cache key and deserializing the cached outputs (the JIT runs
+once per tree, before timing).
+
+Usage:
+python benchmarks/serialization.py --depth 6 --width 3
+"""
+import time
+import argparse
+import statistics
+from typing import Any
+from hilt.eager.core import cute_apply
+from hilt.eager.layout import CuTeLayout
+
+
+def make_tree(depth: int, width: int, counter: list[int]) -> Any:
+    if depth == 0:
+        counter[0] += 1
+        if counter[0] % 2 == 0:
+            return CuTeLayout(shape=(counter[0], 2), stride=(2, 1))
+        return counter[0]
+    children = [make_tree(depth - 1, width, counter) for _ in range(width)]
+    if depth % 3 == 0:
+        return {f"key{index}": child for index, child in enumerate(children)}
+    if depth % 3 == 1:
+        return list(children)
+    return tuple(children)
+
+
+def identity(tree: Any) -> Any:
+    return tree
+
+
+def measure(fn: Any, tree: Any, repeats: int) -> list[float]:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(tree)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--depth", type=int, nargs="+", default=[2, 4, 6])
+    parser.add_argument("--width", type=int, default=3)
+    parser.add_argument("--repeats", type=int, default=50)
+    args = parser.parse_args()
+
+    fn = cute_apply()(identity)
+    for depth in args.depth:
+        tree = make_tree(depth, args.width, counter=[0])
+        # compiles once, the timed calls are cache hits
+        fn(tree)
+        timings = measure(fn, tree, repeats=args.repeats)
+        num_leaves = args.width ** depth
+        print(
+            f"depth={depth} leaves={num_leaves:>5}: "
+            f"median {statistics.median(timings) * 1e3:8.3f} ms "
+            f"({statistics.median(timings) / num_leaves * 1e6:6.2f} us/leaf)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Time of mapping every (m, n) coordinate of a tile to its thread and value, one
+coordinate at a time (`tiler_crd_to_layout_tv_crd`) and as arrays
+(`tiler_crds_to_layout_tv_crds`).
+
+Usage:
+python benchmarks/tiler_crds.py --repeats 3
+"""
+import time
+import argparse
+import statistics
+import numpy as np
+from typing import Any, Callable
+from hilt.pycute_utils import Layout, flatten, crd2idx
+from hilt.layout_tv import tiler_crd_to_layout_tv_crd, tiler_crds_to_layout_tv_crds
+
+# name -> (tiler_mn, layout_tv), over column-major tiles
+LAYOUTS_TV = {
+    "64x64 tile, 128 thr x 32 val": ((64, 64), Layout(((32, 4), (4, 8)), ((4, 128), (1, 512)))),
+    "128x128 tile, 128 thr x 128 val": ((128, 128), Layout(((32, 4), (4, 32)), ((4, 128), (1, 512)))),
+    "256x128 tile, 128 thr x 256 val": ((256, 128), Layout(((32, 4), (8, 32)), ((8, 256), (1, 1024)))),
+}
+
+
+def measure(fn: Callable[[], Any], repeats: int) -> tuple[float, Any]:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        output = fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), output
+
+
+def scalar(tiler_crds: list[tuple[int, int]], tiler_mn: tuple[int, int], layout_tv: Layout) -> list[tuple]:
+    return [
+        tiler_crd_to_layout_tv_crd(tiler_crd, tiler_mn, layout_tv.shape, layout_tv.stride)
+        for tiler_crd in tiler_crds
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    for name, (tiler_mn, layout_tv) in LAYOUTS_TV.items():
+        M, N = tiler_mn
+        tiler_crds = [(m, n) for n in range(N) for m in range(M)]
+        tiler_crds_array = np.array(tiler_crds)
+        scalar_time, expected = measure(lambda: scalar(tiler_crds, tiler_mn, layout_tv), repeats=args.repeats)
+        batched_time, (thr_crds, val_crds, thr_idx, val_idx) = measure(
+            lambda: tiler_crds_to_layout_tv_crds(tiler_crds_array, tiler_mn, layout_tv.shape, layout_tv.stride),
+            repeats=args.repeats,
+        )
+        thr_shape, val_shape = layout_tv.shape
+        assert [flatten(thr_crd) for thr_crd, _ in expected] == [tuple(crd) for crd in thr_crds.tolist()]
+        assert [flatten(val_crd) for _, val_crd in expected] == [tuple(crd) for crd in val_crds.tolist()]
+        assert [crd2idx(thr_crd, thr_shape) for thr_crd, _ in expected] == thr_idx.tolist()
+        assert [crd2idx(val_crd, val_shape) for _, val_crd in expected] == val_idx.tolist()
+        print(
+            f"{name:<36} scalar {scalar_time * 1e3:10.2f} ms  "
+            f"batched {batched_time * 1e3:8.2f} ms  ({scalar_time / batched_time:6.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
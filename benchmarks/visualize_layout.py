@@ -0,0 +1,47 @@
+"""
+Render time of `visualize_layout` vs. the number of cells, drawing one patch
+and one text per cell (exact) or a single image (fast).
+
+Each measurement creates the figure and renders it to PNG with the Agg backend.
+
+Usage:
+python benchmarks/visualize_layout.py --sizes 8 32 128
+"""
+import io
+import time
+import argparse
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from hilt.pycute_utils import Layout, visualize_layout
+
+
+def measure(layout: Layout, fast: bool, figsize: tuple[float, float], dpi: int) -> float:
+    start = time.perf_counter()
+    fig, _ = visualize_layout(layout, fast=fast, figsize=figsize)
+    fig.savefig(io.BytesIO(), format="png", dpi=dpi)
+    plt.close(fig)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[8, 16, 32, 64, 128])
+    parser.add_argument("--max-exact-size", type=int, default=64, help="Larger layouts are only drawn fast")
+    parser.add_argument("--figsize", type=float, default=10.)
+    parser.add_argument("--dpi", type=int, default=100)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        layout = Layout((size, size), (size, 1))
+        fast_time = measure(layout, fast=True, figsize=(args.figsize, args.figsize), dpi=args.dpi)
+        if size <= args.max_exact_size:
+            exact_time = measure(layout, fast=False, figsize=(args.figsize, args.figsize), dpi=args.dpi)
+            exact = f"{exact_time:8.2f} s"
+        else:
+            exact = f"{'-':>10}"
+        print(f"{size:>4}x{size:<4} ({size * size:>6} cells): exact {exact}  fast {fast_time:8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,107 @@
 __version__ = "0.0.1"
 
-from .layout_tv import *
-from .math_utils import *
-from .debug_utils import *
-from .layout_utils import *
+import importlib
+from typing import Any
+
+# public names of each submodule re-exported here, i.e., their `__all__` (as
+# checked by `tests/test_init.py`). Submodules pull in CUTLASS DSL (MLIR) and
+# matplotlib, hence are only imported on first access.
+_lazy_exports = {
+    "layout_tv": [
+        "CompactInverseTV",
+        "make_inverse_tv",
+        "make_compact_inverse_tv",
+        "visualize_layout_tv",
+        "visualize_layout_tv_maybe_duplicates",
+        "tiler_crd_to_layout_tv_crd",
+        "tiler_crds_to_layout_tv_crds",
+        "LayoutTVCoverage",
+        "layout_tv_coverage",
+    ],
+    "math_utils": [
+        "exp2",
+        "exp",
+        "rsqrt",
+        "log2",
+        "log",
+    ],
+    "debug_utils": [
+        "block",
+        "thread",
+        "thread0",
+        "block0",
+        "printf",
+        "print_tensor",
+        "print_tensorssa",
+        "runtime_print",
+    ],
+    "layout_utils": [
+        "idx2crd",
+    ],
+    "render_utils": [
+        "render_layouts",
+    ],
+    "svg_utils": [
+        "iter_layout_svg",
+        "write_layout_svg",
+        "write_layout_html",
+    ],
+    "smem_utils": [
+        "BankConflictReport",
+        "get_element_bits",
+        "analyze_bank_conflicts",
+        "visualize_bank_conflicts",
+    ],
+    "gmem_utils": [
+        "EXCESSIVE_SECTORS_THRESHOLD",
+        "SectorReport",
+        "predict_global_sectors",
+    ],
+    "register_utils": [
+        "IN_REGISTER",
+        "SHUFFLE",
+        "SHARED_MEMORY",
+        "ConversionReport",
+        "analyze_conversion",
+        "visualize_conversion",
+    ],
+}
+_lazy_submodules = {
+    "eager",
+    "layout_tv",
+    "math_utils",
+    "debug_utils",
+    "dtype_utils",
+    "layout_utils",
+    "pycute_utils",
+    "render_utils",
+    "svg_utils",
+    "smem_utils",
+    "gmem_utils",
+    "register_utils",
+    "profile_kernel",
+}
+_lazy_attrs = {
+    name: module_name
+    for module_name, names in _lazy_exports.items()
+    for name in names
+}
+
+__all__ = list(_lazy_attrs.keys())
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_attrs:
+        module = importlib.import_module(f".{_lazy_attrs[name]}", __name__)
+        attr = getattr(module, name)
+    elif name in _lazy_submodules:
+        attr = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # subsequent accesses bypass `__getattr__`
+    globals()[name] = attr
+    return attr
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals().keys()) | set(__all__) | _lazy_submodules)
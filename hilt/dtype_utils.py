@@ -1,4 +1,3 @@
-import ipdb
 import cutlass
 import cutlass.cute as cute
 from typing import cast
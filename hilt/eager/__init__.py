@@ -0,0 +1,16 @@
+from .core import (
+    cute_apply,
+    batch_apply,
+)
+from .lazy import (
+    lazy,
+    is_lazy,
+    LazyNode,
+)
+from .parallel import (
+    parallel_map,
+)
+from .instrumentation import (
+    stats,
+    StatsRecorder,
+)
@@ -1,19 +1,43 @@
 import inspect
 import cutlass.cute as cute
+from typing import Any
 from .core import cute_apply
+from .fastpath import FASTPATH_FUNCTIONS, dispatch
 
 
-_exported_attrs = []
-for name in dir(cute):
+# functions whose effects (e.g., printing) are the point of calling them, hence
+# every call must run, rather than hit the cache of an identical previous call
+UNCACHED_FUNCTIONS = frozenset([
+    "printf",
+    "print_tensor",
+    "copy",
+    "basic_copy",
+    "basic_copy_if",
+    "autovec_copy",
+    "gemm",
+])
 
-    if name.startswith("_"):
-        continue
 
-    attr = getattr(cute, name)
+def _wrap(name: str, attr: Any) -> Any:
     if inspect.isfunction(attr):
-        attr = cute_apply()(attr)
+        attr = cute_apply(cache=name not in UNCACHED_FUNCTIONS)(attr)
+        if name in FASTPATH_FUNCTIONS:
+            attr = dispatch(name, attr)
+    return attr
 
+
+def __getattr__(name: str) -> Any:
+    # wraps `cute` functions on first access rather than all of them at import time
+    if name.startswith("_") or not hasattr(cute, name):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = _wrap(name, getattr(cute, name))
+    # subsequent accesses bypass `__getattr__`
     globals()[name] = attr
-    _exported_attrs.append(name)
+    return attr
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals().keys()) | set(__all__))
+
 
-__all__ = _exported_attrs
+__all__ = [name for name in dir(cute) if not name.startswith("_")]
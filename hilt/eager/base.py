@@ -1,8 +1,26 @@
+import os
 import torch
-from typing import Self
+import weakref
+from typing import Any, Self
+
+# when enabled, deserialized values equal to a live instance reuse it (see `CuTeValue.intern`)
+_interning = os.environ.get("HILT_EAGER_INTERN", "0") != "0"
+# canonical instances keyed by their type and `CuTeValue.get_key`
+_interned_values: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+
+def set_interning_enabled(enabled: bool) -> None:
+    """Switches whether values created from structs (e.g., eager outputs) are interned."""
+    global _interning
+    _interning = enabled
+
+
+def is_interning_enabled() -> bool:
+    return _interning
 
 
 class CuTeEager(object):
+    __slots__ = ()
 
     def get_metadata(self) -> dict[str, object]:
         raise NotImplementedError
@@ -37,4 +55,62 @@ class CuTeEager(object):
 
     def __repr__(self) -> str:
         from .core import cute_apply
-        return cute_apply()(str)(self)
+        # in lazy mode, `cute_apply` returns a node that `str` materializes
+        return str(cute_apply()(str)(self))
+
+
+class CuTeValue(CuTeEager):
+    """
+    Immutable value object: instances are equal (and hash equally) when they share their
+    type and metadata, hence they can be used as dict keys, deduplicated in sets, etc.
+
+    Attributes can only be assigned once, i.e., in `__init__`, except for `_mutable_slots`,
+    which hold caches rather than values and are ignored by comparisons.
+    """
+
+    __slots__ = ("_hash", "__weakref__")
+    _mutable_slots: frozenset[str] = frozenset(["_hash"])
+
+    def get_key(self) -> tuple:
+        return tuple(self.get_metadata().values())
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if type(self) is not type(other):
+            return NotImplemented
+        return self.get_key() == other.get_key()
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((type(self), self.get_key()))
+            return self._hash
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in self._mutable_slots and hasattr(self, name):
+            raise AttributeError(f"{type(self).__name__} is immutable, cannot reassign {name!r}")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable, cannot delete {name!r}")
+
+    def __reduce__(self) -> tuple:
+        # rebuilt from the struct, since cached hashes of types differ across processes
+        return type(self).from_struct, (self.to_struct(),)
+
+    def intern(self) -> Self:
+        """Returns the live instance equal to this one, registering this one if there is none."""
+        try:
+            return _interned_values.setdefault((type(self), self.get_key()), self)
+        except TypeError:
+            # e.g., dynamic values
+            return self
+
+    @classmethod
+    def from_struct(cls: type[Self], struct: object) -> Self:
+        value = super().from_struct(struct)
+        if _interning:
+            value = value.intern()
+        return value
@@ -0,0 +1,275 @@
+import os
+import enum
+import functools
+import pickle
+import inspect
+import tempfile
+import warnings
+import threading
+import importlib.metadata
+from pathlib import Path
+from collections import OrderedDict
+from typing import Any, Hashable, Iterator, NamedTuple
+from .. import __version__
+
+DEFAULT_MAXSIZE = 4096
+DEFAULT_MAX_BYTES = 1 << 30
+_MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class ApplyCache(object):
+    """Thread-safe LRU cache mapping `cute_apply` signatures to serialized outputs."""
+
+    def __init__(self, maxsize: int | None = DEFAULT_MAXSIZE) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def lookup(self, key: Hashable) -> tuple[bool, Any]:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return True, self._entries[key]
+            self._misses += 1
+            return False, None
+
+    def insert(self, key: Hashable, value: Any) -> None:
+        if self._maxsize == 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def resize(self, maxsize: int | None) -> None:
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self._maxsize,
+                currsize=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def _evict(self) -> None:
+        if self._maxsize is None:
+            return
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+class DiskCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    max_bytes: int | None
+    directory: str
+
+
+class DiskCache(object):
+    """Persistent cache of pickled `cute_apply` outputs, shared across processes.
+
+    Entries live under `<directory>/<namespace>/`, where the namespace encodes the
+    cache format, so that a format change never reads stale entries. Writes go to
+    a temporary file that is atomically renamed into place, hence concurrent
+    writers (and readers) never observe partial entries. Reads refresh the
+    modification time, and the least recently used entries are evicted once the
+    total size exceeds `max_bytes`.
+    """
+
+    FORMAT_VERSION = 1
+    EVICTION_INTERVAL = 32
+
+    def __init__(self, directory: str | os.PathLike, max_bytes: int | None = DEFAULT_MAX_BYTES) -> None:
+        self._directory = Path(directory)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._num_writes = 0
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def namespace(self) -> Path:
+        return self._directory / f"v{self.FORMAT_VERSION}"
+
+    def _get_path(self, digest: str) -> Path:
+        return self.namespace / digest[:2] / f"{digest}.pkl"
+
+    def lookup(self, digest: str) -> tuple[bool, Any]:
+        path = self._get_path(digest)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except OSError:
+            # missing, or unreadable, entry
+            value = _MISSING
+        except Exception:
+            # corrupted or incompatible entry, e.g., from an older CUTLASS DSL
+            _unlink(path)
+            value = _MISSING
+        else:
+            try:
+                os.utime(path)
+            except OSError:
+                # e.g., a read-only cache, whose entries are then evicted in write order
+                pass
+
+        with self._lock:
+            if value is _MISSING:
+                self._misses += 1
+                return False, None
+            self._hits += 1
+            return True, value
+
+    def insert(self, digest: str, value: Any) -> None:
+        """Persists `value`, warning (rather than raising) when it cannot be, e.g., on a full disk."""
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            # not every output can be persisted
+            _warn_write_failure(f"Cannot pickle the outputs for the disk cache: {e}")
+            return
+
+        path = self._get_path(digest)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        except OSError as e:
+            _warn_write_failure(f"Cannot write to the disk cache at {self._directory}: {e}")
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            _unlink(Path(temp_path))
+            _warn_write_failure(f"Cannot write to the disk cache at {self._directory}: {e}")
+            return
+        except BaseException:
+            _unlink(Path(temp_path))
+            raise
+
+        with self._lock:
+            self._num_writes += 1
+            should_evict = (self._num_writes - 1) % self.EVICTION_INTERVAL == 0
+        if should_evict:
+            try:
+                self.evict()
+            except OSError as e:
+                _warn_write_failure(f"Cannot evict entries from the disk cache at {self._directory}: {e}")
+
+    def evict(self) -> None:
+        """Removes the least recently used entries (of any version) until under `max_bytes`."""
+        if self._max_bytes is None:
+            return
+
+        entries = []
+        for path in self._iter_entry_paths():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self._max_bytes:
+                break
+            _unlink(path)
+            total_bytes -= size
+
+    def info(self) -> DiskCacheInfo:
+        with self._lock:
+            return DiskCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                max_bytes=self._max_bytes,
+                directory=str(self._directory),
+            )
+
+    def _iter_entry_paths(self) -> Iterator[Path]:
+        # the entries of every version, i.e., `<directory>/v*/<digest[:2]>/<digest>.pkl`
+        return self._directory.glob(f"v*/{'[0-9a-f]' * 2}/*.pkl")
+
+    def clear(self) -> None:
+        """Removes the entries (of every version), but nothing else from `directory`, which may be shared."""
+        for path in self._iter_entry_paths():
+            _unlink(path)
+        # then the (now empty) directories of the entries
+        for path in sorted(self._directory.glob("v*/*"), reverse=True) + sorted(self._directory.glob("v*")):
+            try:
+                path.rmdir()
+            except OSError:
+                # not empty (e.g., unrelated files), or not a directory
+                pass
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._num_writes = 0
+
+
+def _warn_write_failure(message: str) -> None:
+    # the outputs are still returned, only not persisted
+    warnings.warn(message, RuntimeWarning, stacklevel=3)
+
+
+def _unlink(path: Path) -> None:
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def stable_repr(obj: Any) -> str:
+    """A `repr` that is identical across processes, raising `TypeError` when impossible."""
+    if obj is None or isinstance(obj, bool | int | float | str):
+        return repr(obj)
+    if isinstance(obj, enum.Enum):
+        return f"{stable_repr(type(obj))}.{obj.name}"
+    if isinstance(obj, type) or inspect.isroutine(obj):
+        module = getattr(obj, "__module__", None)
+        qualname = getattr(obj, "__qualname__", None)
+        if module is None or qualname is None or "<" in qualname:
+            # lambdas and locally defined objects are not unique across processes
+            raise TypeError(f"{obj!r} has no stable name")
+        return f"{module}.{qualname}"
+    if isinstance(obj, tuple):
+        items = ", ".join(stable_repr(item) for item in obj)
+        if hasattr(obj, "_fields"):
+            return f"{stable_repr(type(obj))}({items})"
+        # normalizes tuple subclasses such as `torch.Size`
+        return f"({items})"
+    raise TypeError(f"{type(obj)} has no stable representation")
+
+
+@functools.cache
+def get_version_tag() -> str:
+    """Identifies the versions that the cached outputs depend on."""
+    try:
+        dsl_version = importlib.metadata.version("nvidia-cutlass-dsl")
+    except importlib.metadata.PackageNotFoundError:
+        dsl_version = "unknown"
+    return f"hilt-{__version__}/nvidia-cutlass-dsl-{dsl_version}"
@@ -1,13 +1,34 @@
+import os
+import time
+import hashlib
 import functools
 import cutlass
 import cutlass.cute as cute
 import torch.utils._pytree as pytree
-from typing import Any, Callable, cast
+from typing import Any, Callable, Sequence, cast
 from cutlass._mlir.dialects import cute as _cute_ir
 
 from .base import (
     CuTeEager,
 )
+from .serialization import (
+    TypeDispatcher,
+    tree_map,
+    tree_map_with_signature,
+)
+from .instrumentation import (
+    get_function_name,
+    get_stats_recorder,
+)
+from .cache import (
+    DEFAULT_MAX_BYTES,
+    CacheInfo,
+    DiskCache,
+    ApplyCache,
+    DiskCacheInfo,
+    stable_repr,
+    get_version_tag,
+)
 from .tensor import (
     TensorStruct,
     NumericStruct,
@@ -26,16 +47,6 @@ from .layout import (
     CuTeLayout,
 )
 
-CuTeEagerStruct = (
-    LayoutStruct |
-    TensorStruct |
-    NumericStruct |
-    TensorSSAStruct |
-    ArithValueStruct |
-    CoordinateTensorStruct |
-    TensorStructWithPointer
-)
-
 CuTeEagerClasses = [
     ReferenceTensor,
     CoordinateTensor,
@@ -46,104 +57,323 @@ CuTeEagerClasses = [
 ]
 
 
+def _tensor_from_coordinate_tensor_struct(struct: CoordinateTensorStruct) -> cute.Tensor:
+    layout = cute.make_layout(shape=struct.shape, stride=struct.stride)
+    return cute.make_tensor(iterator=struct.iterator, layout=layout)
+
+
+def _tensor_from_tensor_struct_with_pointer(struct: TensorStructWithPointer) -> cute.Tensor:
+    layout = cute.make_layout(shape=struct.shape, stride=struct.stride)
+    iterator = cute.core.make_ptr(
+        dtype=struct.dtype,
+        value=struct.pointer,
+        mem_space=cute.AddressSpace[struct.memspace],
+        assumed_align=struct.alignment,
+    )
+    return cute.make_tensor(iterator=iterator, layout=layout)
+
+
+def _tensor_ssa_from_tensor_ssa_struct(struct: TensorSSAStruct) -> cute.TensorSSA:
+    tensor = cute.make_fragment(layout_or_shape=struct.shape, dtype=struct.dtype)
+    return tensor.load()
+
+
+def _arith_value_from_arith_value_struct(struct: ArithValueStruct) -> Any:
+    return cutlass.cutlass_dsl.arith.constant(result=struct.dtype.mlir_type, value=struct.dtype.zero)
+
+
+def _numeric_from_numeric_struct(struct: NumericStruct) -> cute.Numeric:
+    return struct.dtype.zero
+
+
+def _layout_from_layout_struct(struct: LayoutStruct) -> cute.Layout:
+    return cute.make_layout(shape=struct.shape, stride=struct.stride)
+
+
+def _tensor_from_tensor_struct(struct: TensorStruct) -> cute.Tensor:
+    # pointers are attached by `create_tensor_struct_with_pointer`
+    raise NotImplementedError
+
+
+def _tensor_struct_from_tensor(tensor: cute.Tensor) -> TensorStruct | CoordinateTensorStruct:
+    assert cutlass.const_expr(isinstance(tensor, cute.core._Tensor))
+    tensor = cast(cute.core._Tensor, tensor)
+    if cutlass.const_expr(isinstance(tensor.type, _cute_ir.MemRefType)):
+        return TensorStruct.from_tensor(tensor)
+    if cutlass.const_expr(isinstance(tensor.type, _cute_ir.CoordTensorType)):
+        return CoordinateTensorStruct.from_tensor(tensor)
+    raise NotImplementedError
+
+
+def _numeric_struct_from_constant(constant: int | float | bool) -> NumericStruct:
+    # `bool` is a subclass of `int`, hence `True` and `False` become `Int64` as well
+    if isinstance(constant, int):
+        numeric = cute.Int64(constant)
+    elif isinstance(constant, float):
+        numeric = cute.Float32(constant)
+    else:
+        raise NotImplementedError
+    return NumericStruct.from_tensor(numeric)
+
+
+# handlers are resolved once per exact type, in the order listed here
+_TENSOR_FROM_TENSOR_STRUCT = TypeDispatcher({
+    TensorStruct: _tensor_from_tensor_struct,
+    CoordinateTensorStruct: _tensor_from_coordinate_tensor_struct,
+    TensorStructWithPointer: _tensor_from_tensor_struct_with_pointer,
+    TensorSSAStruct: _tensor_ssa_from_tensor_ssa_struct,
+    ArithValueStruct: _arith_value_from_arith_value_struct,
+    NumericStruct: _numeric_from_numeric_struct,
+    LayoutStruct: _layout_from_layout_struct,
+})
+
+_TENSOR_STRUCT_FROM_TENSOR_HANDLERS = {
+    cute.Tensor: _tensor_struct_from_tensor,
+    cute.TensorSSA: TensorSSAStruct.from_tensor,
+    cutlass.cutlass_dsl.cutlass_arith.ArithValue: ArithValueStruct.from_tensor,
+    cute.Numeric: NumericStruct.from_tensor,
+}
+
+_TENSOR_STRUCT_FROM_TENSOR = {
+    False: TypeDispatcher({
+        **_TENSOR_STRUCT_FROM_TENSOR_HANDLERS,
+        cute.Layout: LayoutStruct.from_layout,
+    }),
+    True: TypeDispatcher({
+        **_TENSOR_STRUCT_FROM_TENSOR_HANDLERS,
+        int | float | bool: _numeric_struct_from_constant,
+        cute.Layout: LayoutStruct.from_layout,
+    }),
+}
+
+_TENSOR_STRUCT_FROM_RAPIER_TENSOR = TypeDispatcher({
+    CuTeEager: lambda tensor: tensor.to_struct(),
+})
+
+# structs map to themselves, e.g., when computing signatures of serialized trees
+_TENSOR_STRUCT = TypeDispatcher({
+    cls.get_struct_type(): lambda struct: struct
+    for cls in CuTeEagerClasses
+})
+
+_RAPIER_TENSOR_FROM_TENSOR_STRUCT = TypeDispatcher({
+    cls.get_struct_type(): cls.from_struct
+    for cls in CuTeEagerClasses
+})
+
+
 def create_tensor_from_tensor_struct(tree: pytree.PyTree) -> pytree.PyTree:
-    def _fn(maybe_tensor: Any) -> Any:
-        if cutlass.const_expr(isinstance(maybe_tensor, TensorStruct)):
-            raise NotImplementedError
-        if cutlass.const_expr(isinstance(maybe_tensor, CoordinateTensorStruct)):
-            struct = cast(CoordinateTensorStruct, maybe_tensor)
-            layout = cute.make_layout(shape=struct.shape, stride=struct.stride)
-            return cute.make_tensor(iterator=struct.iterator, layout=layout)
-        if cutlass.const_expr(isinstance(maybe_tensor, TensorStructWithPointer)):
-            struct = cast(TensorStructWithPointer, maybe_tensor)
-            layout = cute.make_layout(shape=struct.shape, stride=struct.stride)
-            iterator = cute.core.make_ptr(
-                dtype=struct.dtype,
-                value=struct.pointer,
-                mem_space=cute.AddressSpace[struct.memspace],
-                assumed_align=struct.alignment,
-            )
-            return cute.make_tensor(iterator=iterator, layout=layout)
-        if cutlass.const_expr(isinstance(maybe_tensor, TensorSSAStruct)):
-            struct = cast(TensorSSAStruct, maybe_tensor)
-            tensor = cute.make_fragment(layout_or_shape=struct.shape, dtype=struct.dtype)
-            return tensor.load()
-        if cutlass.const_expr(isinstance(maybe_tensor, ArithValueStruct)):
-            struct = cast(ArithValueStruct, maybe_tensor)
-            return cutlass.cutlass_dsl.arith.constant(result=struct.dtype.mlir_type, value=struct.dtype.zero)
-        if cutlass.const_expr(isinstance(maybe_tensor, NumericStruct)):
-            struct = cast(NumericStruct, maybe_tensor)
-            return struct.dtype.zero
-        if cutlass.const_expr(isinstance(maybe_tensor, LayoutStruct)):
-            struct = cast(LayoutStruct, maybe_tensor)
-            return cute.make_layout(shape=struct.shape, stride=struct.stride)
-        return maybe_tensor
-
-    return pytree.tree_map(func=_fn, tree=tree, is_leaf=lambda node: isinstance(node, CuTeEagerStruct))
+    return tree_map(_TENSOR_FROM_TENSOR_STRUCT, tree)
 
 
 def create_tensor_struct_from_tensor(tree: pytree.PyTree, constant_as_numeric: bool) -> pytree.PyTree:
-    def _fn(maybe_tensor: Any) -> Any:
-        if cutlass.const_expr(isinstance(maybe_tensor, cute.Tensor)):
-            assert cutlass.const_expr(isinstance(maybe_tensor, cute.core._Tensor))
-            tensor = cast(cute.core._Tensor, maybe_tensor)
-            if cutlass.const_expr(isinstance(tensor.type, _cute_ir.MemRefType)):
-                return TensorStruct.from_tensor(tensor)
-            if cutlass.const_expr(isinstance(tensor.type, _cute_ir.CoordTensorType)):
-                return CoordinateTensorStruct.from_tensor(tensor)
-            raise NotImplementedError
-        if cutlass.const_expr(isinstance(maybe_tensor, cute.TensorSSA)):
-            return TensorSSAStruct.from_tensor(maybe_tensor)
-        if cutlass.const_expr(isinstance(maybe_tensor, cutlass.cutlass_dsl.cutlass_arith.ArithValue)):
-            return ArithValueStruct.from_tensor(maybe_tensor)
-        if cutlass.const_expr(isinstance(maybe_tensor, cute.Numeric)):
-            return NumericStruct.from_tensor(maybe_tensor)
-        if cutlass.const_expr(isinstance(maybe_tensor, int | float | bool) and constant_as_numeric):
-            if cutlass.const_expr(isinstance(maybe_tensor, int)):
-                numeric = cute.Int64(maybe_tensor)
-            elif cutlass.const_expr(isinstance(maybe_tensor, float)):
-                numeric = cute.Float32(maybe_tensor)
-            elif cutlass.const_expr(isinstance(maybe_tensor, bool)):
-                numeric = cute.Boolean(maybe_tensor)
-            else:
-                raise NotImplementedError
-            return NumericStruct.from_tensor(numeric)
-        if cutlass.const_expr(isinstance(maybe_tensor, cute.Layout)):
-            return LayoutStruct.from_layout(maybe_tensor)
-        return maybe_tensor
-    return pytree.tree_map(func=_fn, tree=tree)
+    return tree_map(_TENSOR_STRUCT_FROM_TENSOR[constant_as_numeric], tree)
 
 
 def create_tensor_struct_from_rapier_tensor(tree: pytree.PyTree) -> pytree.PyTree:
-    def _fn(maybe_tensor: Any) -> Any:
-        if cutlass.const_expr(isinstance(maybe_tensor, CuTeEager)):
-            tensor = cast(CuTeEager, maybe_tensor)
-            struct = tensor.to_struct()
-            if isinstance(struct, TensorStruct):
-                assert isinstance(tensor, ReferenceTensor)
-                pointer = tensor.make_pointer()
-                pointer = cast(cute.runtime._Pointer, pointer)
-                struct = TensorStructWithPointer(
-                    pointer=pointer._pointer,
-                    **struct._asdict(),
-                )
-            return struct
-        return maybe_tensor
-    return pytree.tree_map(func=_fn, tree=tree)
+    return tree_map(_TENSOR_STRUCT_FROM_RAPIER_TENSOR, tree)
+
+
+def create_tensor_struct_from_rapier_tensor_with_signature(tree: pytree.PyTree) -> tuple[pytree.PyTree, tuple]:
+    """Serializes `tree` and computes its signature (see `make_cache_key`) in a single traversal."""
+    return tree_map_with_signature(_TENSOR_STRUCT_FROM_RAPIER_TENSOR, tree)
+
+
+def create_signature_from_tensor_struct(tree: pytree.PyTree) -> tuple:
+    """Computes the signature of an already serialized `tree`, identical to that of its source."""
+    return tree_map_with_signature(_TENSOR_STRUCT, tree)[1]
 
 
 def create_rapier_tensor_from_tensor_struct(tree: pytree.PyTree) -> pytree.PyTree:
-    def _fn(maybe_tensor: Any) -> Any:
-        for cls in CuTeEagerClasses:
-            if cutlass.const_expr(isinstance(maybe_tensor, cls.get_struct_type())):
-                return cls.from_struct(maybe_tensor)
+    return tree_map(_RAPIER_TENSOR_FROM_TENSOR_STRUCT, tree)
+
+
+def copy_serialized_outputs(tree: pytree.PyTree) -> pytree.PyTree:
+    # the containers of (raw) outputs that are, or are about to be, cached, such
+    # that callers get their own, which they may mutate; the leaves are immutable
+    return pytree.tree_map(lambda leaf: leaf, tree)
+
+
+def create_tensor_struct_with_pointer(
+    tree: pytree.PyTree,
+    references: list[ReferenceTensor],
+) -> pytree.PyTree:
+    def _fn(struct: TensorStruct) -> TensorStructWithPointer:
+        # the reference is appended to `references` so that any buffer
+        # backing the pointer outlives the JIT call. Tensors are never
+        # interned here, as a shared instance only keeps its latest buffer.
+        tensor = ReferenceTensor(**struct._asdict())
+        pointer = tensor.make_pointer()
+        pointer = cast(cute.runtime._Pointer, pointer)
+        references.append(tensor)
+        return TensorStructWithPointer(
+            pointer=pointer._pointer,
+            **struct._asdict(),
+        )
+    return tree_map(TypeDispatcher({TensorStruct: _fn}), tree)
+
+
+def make_cache_key(
+    fn: Callable,
+    signature: tuple,
+    constant_as_numeric: bool,
+) -> tuple | None:
+    # the signature tags containers and leaves with their types, since e.g.,
+    # `LayoutStruct` and `TensorSSAStruct` (or `True` and `1`) compare equal
+    key = (fn, constant_as_numeric, signature)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def make_disk_cache_key(key: tuple) -> str | None:
+    # unlike the in-memory key, the on-disk key must be identical across
+    # processes, hence functions are identified by their qualified names
+    fn, constant_as_numeric, signature = key
+    try:
+        text = "\n".join([
+            get_version_tag(),
+            stable_repr(fn),
+            stable_repr(constant_as_numeric),
+            stable_repr(signature),
+        ])
+    except TypeError:
+        return None
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _make_disk_cache_from_env() -> DiskCache | None:
+    directory = os.environ.get("HILT_EAGER_CACHE_DIR")
+    if not directory:
+        return None
+    max_bytes = os.environ.get("HILT_EAGER_CACHE_MAX_BYTES")
+    if max_bytes is None:
+        max_bytes = DEFAULT_MAX_BYTES
+    return DiskCache(directory=directory, max_bytes=int(max_bytes))
+
+
+_apply_cache = ApplyCache()
+_disk_cache = _make_disk_cache_from_env()
+# installed by `hilt.eager.lazy.lazy` while lazy mode is active
+_lazy_recorder: Callable | None = None
+
+
+def get_lazy_recorder() -> Callable | None:
+    return _lazy_recorder
+
+
+def set_lazy_recorder(recorder: Callable | None) -> Callable | None:
+    """Installs the function that records calls in lazy mode, returning the previous one."""
+    global _lazy_recorder
+    previous_recorder = _lazy_recorder
+    _lazy_recorder = recorder
+    return previous_recorder
+
+
+def cache_info() -> CacheInfo:
+    """Returns the hit/miss statistics of the `cute_apply` cache."""
+    return _apply_cache.info()
+
+
+def cache_clear() -> None:
+    """Clears the `cute_apply` cache and resets its statistics."""
+    _apply_cache.clear()
+
+
+def cache_resize(maxsize: int | None) -> None:
+    """Sets the maximum number of cached signatures (`None` for unbounded)."""
+    _apply_cache.resize(maxsize)
 
-        return maybe_tensor
 
-    return pytree.tree_map(func=_fn, tree=tree, is_leaf=lambda node: isinstance(node, CuTeEagerStruct))
+def set_disk_cache(directory: str | os.PathLike | None, max_bytes: int | None = DEFAULT_MAX_BYTES) -> None:
+    """Enables (or disables, with `None`) the on-disk cache, overriding `HILT_EAGER_CACHE_DIR`."""
+    global _disk_cache
+    if directory is None:
+        _disk_cache = None
+    else:
+        _disk_cache = DiskCache(directory=directory, max_bytes=max_bytes)
 
 
-def cute_apply(*, raw: bool = False, constant_as_numeric: bool = False) -> Callable:
+def disk_cache_info() -> DiskCacheInfo | None:
+    """Returns the hit/miss statistics of the on-disk cache, if enabled."""
+    if _disk_cache is None:
+        return None
+    return _disk_cache.info()
+
+
+def lookup_cache(key: tuple | None) -> tuple[bool, Any]:
+    if key is None:
+        return False, None
+
+    found, serialized_outputs = _apply_cache.lookup(key)
+    if found:
+        return True, serialized_outputs
+
+    disk_cache = _disk_cache
+    if disk_cache is None:
+        return False, None
+    disk_key = make_disk_cache_key(key)
+    if disk_key is None:
+        return False, None
+
+    found, serialized_outputs = disk_cache.lookup(disk_key)
+    if found:
+        _apply_cache.insert(key, serialized_outputs)
+    return found, serialized_outputs
+
+
+def insert_cache(key: tuple | None, serialized_outputs: pytree.PyTree) -> None:
+    if key is None:
+        return
+
+    _apply_cache.insert(key, serialized_outputs)
+    disk_cache = _disk_cache
+    if disk_cache is None:
+        return
+    disk_key = make_disk_cache_key(key)
+    if disk_key is None:
+        return
+    disk_cache.insert(disk_key, serialized_outputs)
+
+
+def apply_serialized(
+    fn: Callable,
+    serialized_args: pytree.PyTree,
+    serialized_kwargs: pytree.PyTree,
+    constant_as_numeric: bool,
+) -> pytree.PyTree:
+    # called while tracing a `@cute.jit` function
+    recorder = get_stats_recorder()
+    if recorder is not None:
+        start = time.perf_counter()
+    cute_args, cute_kwargs = create_tensor_from_tensor_struct((serialized_args, serialized_kwargs))
+    output = fn(*cute_args, **cute_kwargs)
+    serialized_output = create_tensor_struct_from_tensor(output, constant_as_numeric=constant_as_numeric)
+    if recorder is not None:
+        recorder.record_trace(time.perf_counter() - start)
+    return serialized_output
+
+
+def apply_serialized_batch(
+    fn: Callable,
+    serialized_batch: list[tuple[pytree.PyTree, pytree.PyTree]],
+    constant_as_numeric: bool,
+) -> list[pytree.PyTree]:
+    # called while tracing a `@cute.jit` function
+    return [
+        apply_serialized(
+            fn=fn,
+            serialized_args=serialized_args,
+            serialized_kwargs=serialized_kwargs,
+            constant_as_numeric=constant_as_numeric,
+        )
+        for serialized_args, serialized_kwargs in serialized_batch
+    ]
+
+
+def cute_apply(*, raw: bool = False, constant_as_numeric: bool = False, cache: bool = True) -> Callable:
     """
     Decorator that bridges RapierTensor API with CUTLASS/cute JIT execution.
 
@@ -154,41 +384,263 @@ def cute_apply(*, raw: bool = False, constant_as_numeric: bool = False) -> Calla
     @cute_apply(raw=True)
     def my_function(...): ...
 
+    # evaluates all argument sets within a single JIT compilation
+    my_function.batch([(x0, y0), (x1, y1), ...])
+
     Transforms functions operating on cute objects to work with RapierTensor instances.
     Handles serialization: RapierTensor -> struct -> JIT execution -> struct -> RapierTensor.
 
+    Since the serialized arguments are compile-time constants, the outputs are fully
+    determined by the struct signature of the inputs. Outputs are therefore cached
+    (LRU, see `cache_info`, `cache_clear` and `cache_resize`) and repeated calls
+    skip the JIT entirely. When `HILT_EAGER_CACHE_DIR` is set (or `set_disk_cache`
+    is called), outputs are additionally persisted on disk and shared across
+    processes. Functions with side effects (e.g., printing) should disable caching.
+
+    Within `hilt.eager.lazy()`, calls are recorded instead and compiled together
+    once a concrete value is requested (see `hilt.eager.lazy.LazyNode`). Within
+    `hilt.eager.stats()`, calls record the time spent in each of their phases.
+
     Args:
         raw: If True, return the raw outputs without wrapping them in `RapierTensor`
         constant_as_numeric: If True, treat constants as numeric values
+        cache: If True, reuse the outputs of previous calls with the same signature
 
     Returns:
         Decorator function
     """
 
     def decorator(fn: Callable) -> Callable:
+        name = get_function_name(fn)
 
         @cute.jit
         def _cute_apply(
             serialized_args: cutlass.Constexpr,
             serialized_kwargs: cutlass.Constexpr,
         ) -> pytree.PyTree:
-            cute_args, cute_kwargs = create_tensor_from_tensor_struct((serialized_args, serialized_kwargs))
-            output = fn(*cute_args, **cute_kwargs)
-            return create_tensor_struct_from_tensor(output, constant_as_numeric=constant_as_numeric)
-
-        @functools.wraps(fn)
-        def wrapper(*args, **kwargs) -> pytree.PyTree:
-            serialized_args, serialized_kwargs = create_tensor_struct_from_rapier_tensor((args, kwargs))
-            serialized_outputs = _cute_apply(
+            return apply_serialized(
+                fn=fn,
                 serialized_args=serialized_args,
                 serialized_kwargs=serialized_kwargs,
+                constant_as_numeric=constant_as_numeric,
+            )
+
+        @cute.jit
+        def _cute_apply_batch(serialized_batch: cutlass.Constexpr) -> list[pytree.PyTree]:
+            return apply_serialized_batch(
+                fn=fn,
+                serialized_batch=serialized_batch,
+                constant_as_numeric=constant_as_numeric,
             )
 
+        def _make_cache_key(signature: tuple) -> tuple | None:
+            if not cache:
+                return None
+            return make_cache_key(
+                fn=fn,
+                signature=signature,
+                constant_as_numeric=constant_as_numeric,
+            )
+
+        def _deserialize(serialized_outputs: pytree.PyTree) -> pytree.PyTree:
             if raw:
-                return serialized_outputs
+                return copy_serialized_outputs(serialized_outputs)
             else:
                 return create_rapier_tensor_from_tensor_struct(serialized_outputs)
 
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs) -> pytree.PyTree:
+            if _lazy_recorder is not None:
+                return _lazy_recorder(
+                    fn=fn,
+                    args=args,
+                    kwargs=kwargs,
+                    raw=raw,
+                    constant_as_numeric=constant_as_numeric,
+                    cache=cache,
+                )
+
+            # timings are only taken while recording, see `hilt.eager.stats`
+            recorder = get_stats_recorder()
+            if recorder is not None:
+                start = time.perf_counter()
+
+            (serialized_args, serialized_kwargs), signature = create_tensor_struct_from_rapier_tensor_with_signature((args, kwargs))
+            key = _make_cache_key(signature)
+            found, serialized_outputs = lookup_cache(key)
+
+            if not found:
+                references = []
+                serialized_args, serialized_kwargs = create_tensor_struct_with_pointer(
+                    (serialized_args, serialized_kwargs),
+                    references=references,
+                )
+                if recorder is not None:
+                    jit_start = time.perf_counter()
+                    recorder.record_phase(name, "pack", jit_start - start)
+                serialized_outputs = _cute_apply(
+                    serialized_args=serialized_args,
+                    serialized_kwargs=serialized_kwargs,
+                )
+                if recorder is not None:
+                    start = time.perf_counter()
+                    recorder.record_jit(name, start - jit_start)
+                insert_cache(key, serialized_outputs)
+            elif recorder is not None:
+                packed = time.perf_counter()
+                recorder.record_phase(name, "pack", packed - start)
+                start = packed
+
+            outputs = _deserialize(serialized_outputs)
+            if recorder is not None:
+                recorder.record_phase(name, "unpack", time.perf_counter() - start)
+                recorder.record_call(name, calls=1, cache_hits=int(found))
+            return outputs
+
+        def _evaluate(pending_serialized: list[tuple[pytree.PyTree, pytree.PyTree]]) -> list[pytree.PyTree]:
+            references = []
+            serialized_batch = create_tensor_struct_with_pointer(
+                tuple(pending_serialized),
+                references=references,
+            )
+            return _cute_apply_batch(serialized_batch=serialized_batch)
+
+        def _batch_serialized(
+            serialized_list: list[tuple[pytree.PyTree, pytree.PyTree]],
+            signatures: list[tuple],
+            evaluate: Callable | None,
+            pack_start: float | None = None,
+        ) -> list[pytree.PyTree]:
+            # the "pack" phase (recorded once, below) starts at `pack_start`
+            # when the arguments were serialized by the caller, e.g., `batch`
+            recorder = get_stats_recorder()
+            if recorder is not None:
+                start = time.perf_counter() if pack_start is None else pack_start
+
+            serialized_outputs_list = [None] * len(serialized_list)
+            # argument sets to evaluate, deduplicated by their cache keys
+            pending_keys: list[tuple | None] = []
+            pending_indices: list[list[int]] = []
+            pending_serialized: list[tuple[pytree.PyTree, pytree.PyTree]] = []
+            pending_positions: dict[tuple, int] = {}
+            for index, (serialized, signature) in enumerate(zip(serialized_list, signatures)):
+                key = _make_cache_key(signature)
+                found, serialized_outputs = lookup_cache(key)
+                if found:
+                    serialized_outputs_list[index] = serialized_outputs
+                    continue
+                if key is not None and key in pending_positions:
+                    pending_indices[pending_positions[key]].append(index)
+                    continue
+                if key is not None:
+                    pending_positions[key] = len(pending_keys)
+                pending_keys.append(key)
+                pending_indices.append([index])
+                pending_serialized.append(serialized)
+
+            if recorder is not None:
+                jit_start = time.perf_counter()
+                recorder.record_phase(name, "pack", jit_start - start)
+                recorder.record_call(
+                    name,
+                    calls=len(serialized_list),
+                    cache_hits=len(serialized_list) - sum(len(indices) for indices in pending_indices),
+                )
+
+            if len(pending_serialized) > 0:
+                if evaluate is None:
+                    evaluate = _evaluate
+                serialized_outputs_batch = evaluate(pending_serialized)
+                if recorder is not None:
+                    # for other evaluators (e.g., worker processes), everything counts as compilation
+                    recorder.record_jit(name, time.perf_counter() - jit_start)
+                for key, indices, serialized_outputs in zip(pending_keys, pending_indices, serialized_outputs_batch):
+                    insert_cache(key, serialized_outputs)
+                    for index in indices:
+                        serialized_outputs_list[index] = serialized_outputs
+
+            return serialized_outputs_list
+
+        def batch(
+            args_list: Sequence[tuple],
+            kwargs_list: Sequence[dict[str, Any]] | None = None,
+            evaluate: Callable | None = None,
+        ) -> list[pytree.PyTree]:
+            """
+            Applies the function to every argument set, compiling (at most) once.
+
+            The argument sets missing from the cache are passed (serialized) to `evaluate`,
+            which returns their serialized outputs, and defaults to a single local compilation.
+            """
+            if kwargs_list is None:
+                kwargs_list = [{}] * len(args_list)
+            if len(args_list) != len(kwargs_list):
+                raise ValueError(f"Got {len(args_list)} argument sets but {len(kwargs_list)} keyword argument sets")
+
+            recorder = get_stats_recorder()
+            pack_start = time.perf_counter() if recorder is not None else None
+
+            serialized_list = []
+            signatures = []
+            for args, kwargs in zip(args_list, kwargs_list):
+                serialized, signature = create_tensor_struct_from_rapier_tensor_with_signature((tuple(args), kwargs))
+                serialized_list.append(serialized)
+                signatures.append(signature)
+
+            serialized_outputs_list = _batch_serialized(
+                serialized_list,
+                signatures,
+                evaluate=evaluate,
+                pack_start=pack_start,
+            )
+            if recorder is not None:
+                start = time.perf_counter()
+
+            outputs = [
+                _deserialize(serialized_outputs)
+                for serialized_outputs in serialized_outputs_list
+            ]
+            if recorder is not None:
+                recorder.record_phase(name, "unpack", time.perf_counter() - start)
+            return outputs
+
+        def batch_serialized(serialized_list: list[tuple[pytree.PyTree, pytree.PyTree]]) -> list[pytree.PyTree]:
+            """Like `batch`, but on (and returning) already serialized argument sets."""
+            signatures = [create_signature_from_tensor_struct(serialized) for serialized in serialized_list]
+            return _batch_serialized(serialized_list, signatures, evaluate=None)
+
+        wrapper.batch = batch
+        wrapper.batch_serialized = batch_serialized
+        # allows rebuilding the wrapper elsewhere, e.g., in worker processes
+        wrapper.cute_apply_fn = fn
+        wrapper.cute_apply_options = {
+            "raw": raw,
+            "constant_as_numeric": constant_as_numeric,
+            "cache": cache,
+        }
         return wrapper
 
     return decorator
+
+
+def batch_apply(
+    fn: Callable,
+    args_list: Sequence[tuple],
+    kwargs_list: Sequence[dict[str, Any]] | None = None,
+    **kwargs,
+) -> list[pytree.PyTree]:
+    """
+    Evaluates `fn` on many independent argument sets within a single JIT compilation.
+
+    Args:
+        fn: A function operating on cute objects, or one already wrapped by `cute_apply`
+        args_list: The positional arguments of each call
+        kwargs_list: The keyword arguments of each call
+        **kwargs: Forwarded to `cute_apply` when `fn` is not wrapped yet
+
+    Returns:
+        The outputs of each call, in order
+    """
+    if not hasattr(fn, "batch"):
+        fn = cute_apply(**kwargs)(fn)
+    return fn.batch(args_list, kwargs_list)
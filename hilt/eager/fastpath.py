@@ -0,0 +1,474 @@
+import os
+import random
+import functools
+import cutlass.cute as cute
+from typing import Any, Callable, NamedTuple, Sequence
+from ..pycute_utils import (
+    size,
+    cosize,
+    Layout,
+    filter,
+    flatten,
+    coalesce,
+    is_tuple,
+    complement,
+    composition,
+    hier_unzip,
+    make_layout,
+    prefix_product,
+)
+from .core import cute_apply
+from .layout import CuTeLayout
+
+# Pure-Python (pycute) implementations of static layout algebra. Each function
+# mirrors the signature of its `cutlass.cute` counterpart and raises on inputs
+# it does not support, in which case the call falls back to `cute_apply`.
+
+_enabled = os.environ.get("HILT_EAGER_FASTPATH", "1") != "0"
+
+
+class Unsupported(Exception):
+    pass
+
+
+def set_fastpath_enabled(enabled: bool) -> None:
+    """Enables or disables the pure-Python fast path (`HILT_EAGER_FASTPATH=0` disables it by default)."""
+    global _enabled
+    _enabled = enabled
+
+
+def is_fastpath_enabled() -> bool:
+    return _enabled
+
+
+def to_pycute(tree: Any) -> Any:
+    if isinstance(tree, CuTeLayout):
+        if tree.stride is None:
+            raise Unsupported
+        return Layout(tree.shape, tree.stride)
+    if tree is None:
+        return None
+    if isinstance(tree, int) and not isinstance(tree, bool):
+        return int(tree)
+    if isinstance(tree, tuple):
+        return tuple(to_pycute(item) for item in tree)
+    raise Unsupported
+
+
+def from_pycute(tree: Any) -> Any:
+    if isinstance(tree, Layout):
+        return CuTeLayout(shape=tree.shape, stride=tree.stride)
+    if isinstance(tree, int):
+        return tree
+    raise Unsupported
+
+
+def _append(layout: Layout, rank: int) -> Layout:
+    # pads `layout` with `1:0` modes up to `rank`, i.e., `append<R>` in CuTe
+    if len(layout) >= rank:
+        return layout
+    modes = [layout[i] for i in range(len(layout))] if is_tuple(layout.shape) else [layout]
+    modes.extend(Layout(1, 0) for _ in range(rank - len(modes)))
+    return make_layout(*modes)
+
+
+def _zip(layout_a: Layout, layout_b: Layout) -> Layout:
+    assert len(layout_a) == len(layout_b)
+    return make_layout(
+        make_layout(layout_a[i], layout_b[i])
+        for i in range(len(layout_a))
+    )
+
+
+def _zero_unit_strides(shape: Any, stride: Any) -> Any:
+    if is_tuple(shape):
+        return tuple(_zero_unit_strides(s, d) for s, d in zip(shape, stride))
+    return 0 if shape == 1 else stride
+
+
+def _layout(x: Any) -> Layout:
+    if not isinstance(x, Layout):
+        raise Unsupported
+    return x
+
+
+def _check_admissible(layout_a: Layout, layout_b: Any) -> None:
+    # pycute silently composes layouts that CuTe rejects with a divisibility error
+    if layout_b is None:
+        return
+    if isinstance(layout_b, int):
+        layout_b = Layout(layout_b)
+    if is_tuple(layout_b):
+        for i in range(len(layout_b)):
+            _check_admissible(layout_a[i], layout_b[i])
+        return
+    if is_tuple(layout_b.shape):
+        for i in range(len(layout_b)):
+            _check_admissible(layout_a, layout_b[i])
+        return
+    if layout_b.stride == 0:
+        return
+    if layout_b.stride < 0:
+        raise Unsupported
+
+    rest_shape = layout_b.shape
+    rest_stride = layout_b.stride
+    flat_a = coalesce(layout_a)
+    for curr_shape in flatten(flat_a.shape)[:-1]:
+        if curr_shape % rest_stride != 0 and rest_stride % curr_shape != 0:
+            raise Unsupported
+        new_shape = max(1, curr_shape // rest_stride)
+        if new_shape % rest_shape != 0 and rest_shape % new_shape != 0:
+            raise Unsupported
+        new_shape = min(new_shape, rest_shape)
+        rest_shape = rest_shape // new_shape
+        rest_stride = -(-rest_stride // curr_shape)
+
+
+def _compose(layout_a: Layout, layout_b: Any) -> Layout:
+    _check_admissible(layout_a, layout_b)
+    # unlike pycute, CuTe assigns zero strides to the size-1 modes of a composition
+    result = composition(layout_a, layout_b)
+    return Layout(result.shape, _zero_unit_strides(result.shape, result.stride))
+
+
+def _make_layout(shape: Any, *, stride: Any = None) -> Layout:
+    if isinstance(shape, Layout) or isinstance(stride, Layout):
+        raise Unsupported
+    if stride is None:
+        # unlike pycute, CuTe assigns zero strides to the size-1 modes of compact layouts
+        layout = Layout(shape)
+        return Layout(layout.shape, _zero_unit_strides(layout.shape, layout.stride))
+    return Layout(shape, stride)
+
+
+def _coalesce(input: Any, *, target_profile: Any = None) -> Layout:
+    return coalesce(_layout(input), profile=target_profile)
+
+
+def _filter(input: Any) -> Layout:
+    return filter(_layout(input))
+
+
+def _composition(lhs: Any, rhs: Any) -> Layout:
+    return _compose(_layout(lhs), rhs)
+
+
+def _complement(input: Any, cotarget: Any) -> Layout:
+    if not isinstance(cotarget, int):
+        raise Unsupported
+    return complement(_layout(input), cotarget)
+
+
+def _right_inverse(input: Any) -> Layout:
+    # unlike pycute, stride-0 modes are skipped rather than terminating the search
+    layout = coalesce(_layout(input))
+    flat_shape = flatten(layout.shape)
+    flat_stride = flatten(layout.stride)
+    if any(stride < 0 for stride in flat_stride):
+        raise Unsupported
+    flat_rstride = prefix_product(flat_shape)
+
+    result_shape = []
+    result_stride = []
+    current_idx = 1
+    while True:
+        matches = [
+            i for i in range(len(flat_shape))
+            if flat_stride[i] == current_idx and flat_shape[i] != 1
+        ]
+        if len(matches) == 0:
+            break
+        i = matches[0]
+        result_shape.append(flat_shape[i])
+        result_stride.append(flat_rstride[i])
+        current_idx = flat_shape[i] * flat_stride[i]
+
+    return coalesce(Layout(tuple(result_shape), tuple(result_stride)))
+
+
+def _left_inverse(input: Any) -> Layout:
+    layout = _layout(input)
+    if all(stride == 0 for stride in flatten(coalesce(layout).stride)):
+        # CuTe returns a broadcast rather than the trivial inverse here
+        raise Unsupported
+    return _right_inverse(make_layout(layout, complement(layout)))
+
+
+def _logical_product_impl(block: Layout, tiler: Layout) -> Layout:
+    return make_layout(block, _compose(complement(block, size(block) * cosize(tiler)), tiler))
+
+
+def _logical_divide_impl(target: Layout, tiler: Any) -> Layout:
+    if tiler is None:
+        return target
+    if isinstance(tiler, int):
+        return _logical_divide_impl(target, Layout(tiler))
+    if is_tuple(tiler):
+        assert len(target) >= len(tiler)
+        return make_layout(
+            [_logical_divide_impl(target[i], tiler[i]) for i in range(len(tiler))] +
+            [target[i] for i in range(len(tiler), len(target))]
+        )
+    return _compose(target, make_layout(tiler, complement(tiler, size(target))))
+
+
+def _logical_product(block: Any, tiler: Any) -> Layout:
+    return _logical_product_impl(_layout(block), _layout(tiler))
+
+
+def _blocked_product(block: Any, tiler: Any) -> Layout:
+    block, tiler = _layout(block), _layout(tiler)
+    rank = max(len(block), len(tiler))
+    result = _logical_product_impl(_append(block, rank), _append(tiler, rank))
+    return _zip(result[0], result[1])
+
+
+def _raked_product(block: Any, tiler: Any) -> Layout:
+    block, tiler = _layout(block), _layout(tiler)
+    rank = max(len(block), len(tiler))
+    result = _logical_product_impl(_append(block, rank), _append(tiler, rank))
+    return coalesce(_zip(result[1], result[0]), profile=(1,) * rank)
+
+
+def _logical_divide(target: Any, tiler: Any) -> Layout:
+    return _logical_divide_impl(_layout(target), tiler)
+
+
+def _zipped_divide(target: Any, tiler: Any) -> Layout:
+    return hier_unzip(_logical_divide_impl, _layout(target), tiler)
+
+
+def _tiled_divide(target: Any, tiler: Any) -> Layout:
+    result = _zipped_divide(target, tiler)
+    return make_layout([result[0]] + [result[1][i] for i in range(len(result[1]))])
+
+
+def _size(a: Any, mode: Sequence[int] = ()) -> int:
+    if len(mode) > 0:
+        raise Unsupported
+    return size(a)
+
+
+def _cosize(a: Any, mode: Sequence[int] = ()) -> int:
+    if len(mode) > 0:
+        raise Unsupported
+    return cosize(_layout(a))
+
+
+FASTPATH_FUNCTIONS: dict[str, Callable] = {
+    "make_layout": _make_layout,
+    "coalesce": _coalesce,
+    "filter": _filter,
+    "composition": _composition,
+    "complement": _complement,
+    "right_inverse": _right_inverse,
+    "left_inverse": _left_inverse,
+    "logical_product": _logical_product,
+    "blocked_product": _blocked_product,
+    "raked_product": _raked_product,
+    "logical_divide": _logical_divide,
+    "zipped_divide": _zipped_divide,
+    "tiled_divide": _tiled_divide,
+    "size": _size,
+    "cosize": _cosize,
+}
+
+
+def try_fastpath(name: str, args: tuple, kwargs: dict[str, Any]) -> tuple[bool, Any]:
+    if not _enabled:
+        return False, None
+    try:
+        pycute_args = to_pycute(args)
+        pycute_kwargs = {key: to_pycute(value) for key, value in kwargs.items()}
+        output = FASTPATH_FUNCTIONS[name](*pycute_args, **pycute_kwargs)
+        return True, from_pycute(output)
+    except Exception:
+        # unsupported inputs, or inputs pycute rejects; either way
+        # the JIT path is authoritative (including for error messages)
+        return False, None
+
+
+def dispatch(name: str, fn: Callable) -> Callable:
+    """Serves `fn` (wrapped by `cute_apply`) from the pure-Python engine when possible."""
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs) -> Any:
+        found, output = try_fastpath(name, args, kwargs)
+        if found:
+            return output
+        return fn(*args, **kwargs)
+
+    def batch(
+        args_list: Sequence[tuple],
+        kwargs_list: Sequence[dict[str, Any]] | None = None,
+        evaluate: Callable | None = None,
+    ) -> list[Any]:
+        if kwargs_list is None:
+            kwargs_list = [{}] * len(args_list)
+        if len(args_list) != len(kwargs_list):
+            raise ValueError(f"Got {len(args_list)} argument sets but {len(kwargs_list)} keyword argument sets")
+
+        outputs = [None] * len(args_list)
+        fallback_indices = []
+        for index, (args, kwargs) in enumerate(zip(args_list, kwargs_list)):
+            found, output = try_fastpath(name, tuple(args), kwargs)
+            if found:
+                outputs[index] = output
+            else:
+                fallback_indices.append(index)
+
+        if len(fallback_indices) > 0:
+            fallback_outputs = fn.batch(
+                [args_list[index] for index in fallback_indices],
+                [kwargs_list[index] for index in fallback_indices],
+                evaluate=evaluate,
+            )
+            for index, output in zip(fallback_indices, fallback_outputs):
+                outputs[index] = output
+        return outputs
+
+    wrapper.batch = batch
+    return wrapper
+
+
+class DifferentialReport(NamedTuple):
+    name: str
+    num_trials: int
+    num_agreed: int
+    num_unsupported: int
+    mismatches: list[tuple[tuple, Any, Any]]
+
+
+def _random_shape(rng: random.Random, max_rank: int) -> tuple:
+    shape = []
+    for _ in range(rng.randint(1, max_rank)):
+        if rng.random() < 0.25:
+            shape.append((rng.choice([1, 2, 4]), rng.choice([2, 3, 4])))
+        else:
+            shape.append(rng.choice([1, 2, 3, 4, 8]))
+    return tuple(shape)
+
+
+def random_layout(rng: random.Random, max_rank: int = 3) -> CuTeLayout:
+    """Samples a layout whose strides are a (possibly broadcasting) permutation of a compact layout."""
+    shape = _random_shape(rng, max_rank)
+    flat_shape = flatten(shape)
+    order = list(range(len(flat_shape)))
+    rng.shuffle(order)
+
+    flat_stride = [0] * len(flat_shape)
+    current = 1
+    for index in order:
+        if rng.random() < 0.1:
+            continue
+        flat_stride[index] = current
+        current = current * flat_shape[index]
+
+    # restores the nesting of `shape`
+    flat_stride = iter(flat_stride)
+    stride = tuple(
+        tuple(next(flat_stride) for _ in mode) if is_tuple(mode) else next(flat_stride)
+        for mode in shape
+    )
+    return CuTeLayout(shape=shape, stride=stride)
+
+
+def _random_args(name: str, rng: random.Random) -> tuple[tuple, dict[str, Any]]:
+    layout_a = random_layout(rng)
+    layout_b = random_layout(rng, max_rank=2)
+    if name == "make_layout":
+        if rng.random() < 0.5:
+            # the default (compact) strides
+            return (layout_a.shape,), {}
+        return (layout_a.shape,), {"stride": layout_a.stride}
+    if name in ("coalesce", "filter", "right_inverse", "left_inverse", "size", "cosize"):
+        return (layout_a,), {}
+    if name == "complement":
+        cotarget = cosize(to_pycute(layout_a)) * rng.choice([1, 2, 4])
+        return (layout_a, cotarget), {}
+    if name in ("composition", "logical_divide", "zipped_divide", "tiled_divide"):
+        # tilers that evenly divide the target
+        target_size = size(layout_a.shape)
+        tile = rng.choice([d for d in range(1, target_size + 1) if target_size % d == 0])
+        tile_stride = rng.choice([1, 1, target_size // tile])
+        return (layout_a, CuTeLayout(shape=tile, stride=tile_stride)), {}
+    return (layout_a, layout_b), {}
+
+
+def differential_test(
+    names: Sequence[str] | None = None,
+    num_trials: int = 64,
+    seed: int = 0,
+) -> list[DifferentialReport]:
+    """
+    Checks that the pure-Python engine agrees with the JIT on randomized layouts.
+
+    Each function is evaluated by both engines on `num_trials` random argument sets
+    (the JIT side within a single batched compilation). Inputs rejected by the
+    pure-Python engine count as unsupported rather than mismatches.
+    """
+    if names is None:
+        names = list(FASTPATH_FUNCTIONS.keys())
+
+    reports = []
+    rng = random.Random(seed)
+    for name in names:
+        jit_fn = cute_apply()(getattr(cute, name))
+        trials = [_random_args(name, rng) for _ in range(num_trials)]
+        try:
+            jit_outputs = jit_fn.batch([args for args, _ in trials], [kwargs for _, kwargs in trials])
+        except Exception:
+            # some inputs are rejected by the JIT, evaluate them one by one
+            jit_outputs = []
+            for args, kwargs in trials:
+                try:
+                    jit_outputs.append(jit_fn(*args, **kwargs))
+                except Exception as e:
+                    jit_outputs.append(e)
+
+        num_agreed = 0
+        num_unsupported = 0
+        mismatches = []
+        for (args, kwargs), jit_output in zip(trials, jit_outputs):
+            found, output = try_fastpath(name, args, kwargs)
+            if not found:
+                num_unsupported += 1
+            elif _as_comparable(output) == _as_comparable(jit_output):
+                num_agreed += 1
+            else:
+                mismatches.append(((args, kwargs), output, jit_output))
+
+        reports.append(DifferentialReport(
+            name=name,
+            num_trials=num_trials,
+            num_agreed=num_agreed,
+            num_unsupported=num_unsupported,
+            mismatches=mismatches,
+        ))
+    return reports
+
+
+def _as_comparable(output: Any) -> Any:
+    if isinstance(output, CuTeLayout):
+        return ("layout", output.shape, output.stride)
+    if isinstance(output, Exception):
+        return ("error", type(output))
+    return output
+
+
+def main() -> None:
+    reports = differential_test()
+    for report in reports:
+        print(
+            f"{report.name:>16}: {report.num_agreed}/{report.num_trials} agreed, "
+            f"{report.num_unsupported} unsupported, {len(report.mismatches)} mismatches"
+        )
+        for (args, kwargs), output, jit_output in report.mismatches[:3]:
+            print(f"{'':>18}args={args}, kwargs={kwargs}: {output} (pycute) vs {jit_output} (jit)")
+    if any(len(report.mismatches) > 0 for report in reports):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+import os
+import json
+import threading
+import contextlib
+from typing import Any, Callable, Iterator, NamedTuple
+
+# the phases of an eager call:
+# - pack: serializing the arguments into structs, and looking up the cache
+# - trace: rebuilding cute objects and running the function, while tracing
+# - compile: the rest of the `@cute.jit` call, i.e., lowering, compiling and
+#   running the (trivial) host function, which the JIT performs in one step
+# - unpack: deserializing the outputs
+PHASES = ("pack", "trace", "compile", "unpack")
+
+
+class PhaseStats(NamedTuple):
+    count: int
+    seconds: float
+
+
+class FunctionStats(NamedTuple):
+    calls: int
+    cache_hits: int
+    phases: dict[str, PhaseStats]
+
+
+def get_function_name(fn: Callable) -> str:
+    module = getattr(fn, "__module__", None)
+    qualname = getattr(fn, "__qualname__", None)
+    if qualname is None:
+        return repr(fn)
+    if module is None:
+        return qualname
+    return f"{module}.{qualname}"
+
+
+class StatsRecorder(object):
+    """Thread-safe per-function call counts and cumulative time of each phase of eager calls."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, int] = {}
+        self._cache_hits: dict[str, int] = {}
+        self._phases: dict[str, dict[str, list]] = {}
+        # tracing happens within the `@cute.jit` call, hence its time is
+        # accumulated per thread and subtracted from that of the call
+        self._local = threading.local()
+
+    def record_call(self, name: str, calls: int = 1, cache_hits: int = 0) -> None:
+        with self._lock:
+            self._calls[name] = self._calls.get(name, 0) + calls
+            self._cache_hits[name] = self._cache_hits.get(name, 0) + cache_hits
+
+    def record_phase(self, name: str, phase: str, seconds: float) -> None:
+        with self._lock:
+            phases = self._phases.setdefault(name, {})
+            entry = phases.setdefault(phase, [0, 0.])
+            entry[0] += 1
+            entry[1] += seconds
+
+    def record_trace(self, seconds: float) -> None:
+        self._local.trace_seconds = getattr(self._local, "trace_seconds", 0.) + seconds
+
+    def record_jit(self, name: str, seconds: float) -> None:
+        """Records a `@cute.jit` call, split into the tracing recorded during it and the rest."""
+        trace_seconds = getattr(self._local, "trace_seconds", 0.)
+        self._local.trace_seconds = 0.
+        self.record_phase(name, "trace", trace_seconds)
+        self.record_phase(name, "compile", seconds - trace_seconds)
+
+    def summary(self) -> dict[str, FunctionStats]:
+        with self._lock:
+            return {
+                name: FunctionStats(
+                    calls=calls,
+                    cache_hits=self._cache_hits.get(name, 0),
+                    phases={
+                        phase: PhaseStats(count=count, seconds=seconds)
+                        for phase, (count, seconds) in self._phases.get(name, {}).items()
+                    },
+                )
+                for name, calls in self._calls.items()
+            }
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            name: {
+                "calls": function_stats.calls,
+                "cache_hits": function_stats.cache_hits,
+                "phases": {
+                    phase: phase_stats._asdict()
+                    for phase, phase_stats in function_stats.phases.items()
+                },
+            }
+            for name, function_stats in self.summary().items()
+        }
+
+    def dump(self, path: str | os.PathLike) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_json(), f, indent=2)
+
+    def format(self) -> str:
+        lines = [f"{'function':<48} {'calls':>8} {'hits':>8} " + " ".join(f"{phase + ' (ms)':>12}" for phase in PHASES)]
+        for name, function_stats in sorted(self.summary().items()):
+            times = [
+                function_stats.phases.get(phase, PhaseStats(count=0, seconds=0.)).seconds * 1e3
+                for phase in PHASES
+            ]
+            lines.append(
+                f"{name:<48} {function_stats.calls:>8} {function_stats.cache_hits:>8} " +
+                " ".join(f"{time:>12.3f}" for time in times))
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._calls.clear()
+            self._cache_hits.clear()
+            self._phases.clear()
+
+
+# installed by `stats` while recording, checked once per eager call
+_stats_recorder: StatsRecorder | None = None
+
+
+def get_stats_recorder() -> StatsRecorder | None:
+    return _stats_recorder
+
+
+def set_stats_recorder(recorder: StatsRecorder | None) -> StatsRecorder | None:
+    """Installs the recorder of eager call statistics, returning the previous one."""
+    global _stats_recorder
+    previous_recorder = _stats_recorder
+    _stats_recorder = recorder
+    return previous_recorder
+
+
+@contextlib.contextmanager
+def stats(path: str | os.PathLike | None = None) -> Iterator[StatsRecorder]:
+    """
+    Context manager within which eager calls record their per-phase timings (see `PHASES`).
+
+    Usage:
+    with hilt.eager.stats("stats.json") as recorder:
+        layout2 = cute.blocked_product(layout0, layout1)
+    print(recorder.format())
+
+    Args:
+        path: If given, the statistics are dumped as JSON to `path` on exit
+
+    Yields:
+        The recorder, see `StatsRecorder.summary`
+    """
+    recorder = StatsRecorder()
+    previous_recorder = set_stats_recorder(recorder)
+    try:
+        yield recorder
+    finally:
+        set_stats_recorder(previous_recorder)
+        if path is not None:
+            recorder.dump(path)
@@ -7,7 +7,7 @@ from ..pycute_utils import (
     Layout as PyCuTeLayout,
 )
 
-from .base import CuTeEager
+from .base import CuTeValue
 
 
 class LayoutStruct(NamedTuple):
@@ -23,7 +23,8 @@ class LayoutStruct(NamedTuple):
         return cls(shape=layout.shape, stride=layout.stride)
 
 
-class CuTeLayout(CuTeEager):
+class CuTeLayout(CuTeValue):
+    __slots__ = ("_shape", "_stride")
 
     def __init__(
         self,
@@ -60,8 +61,7 @@ class CuTeLayout(CuTeEager):
 
     @classmethod
     def from_struct(cls: type[Self], struct: LayoutStruct) -> Self:
-        assert isinstance(struct, cls.get_struct_type())
-        return cls(**struct._asdict())
+        return super().from_struct(struct)
 
     def to_struct(self) -> LayoutStruct:
         struct_cls = self.get_struct_type()
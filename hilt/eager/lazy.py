@@ -0,0 +1,333 @@
+import weakref
+import contextlib
+import cutlass
+import cutlass.cute as cute
+import torch.utils._pytree as pytree
+from typing import Any, Callable, Iterator
+
+from .base import CuTeEager
+from .core import (
+    get_lazy_recorder,
+    set_lazy_recorder,
+    lookup_cache,
+    insert_cache,
+    make_cache_key,
+    create_tensor_from_tensor_struct,
+    create_tensor_struct_from_tensor,
+    copy_serialized_outputs,
+    create_tensor_struct_with_pointer,
+    create_rapier_tensor_from_tensor_struct,
+    create_tensor_struct_from_rapier_tensor_with_signature,
+)
+from .serialization import (
+    TypeDispatcher,
+    tree_map,
+)
+
+
+class NodeRef(object):
+    """Placeholder for the output of the `index`-th node of a serialized graph."""
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+
+class LazyNode(CuTeEager):
+    """
+    Deferred output of a `cute_apply` call recorded in lazy mode.
+
+    The node records the function and its (possibly lazy) arguments. Accessing any
+    concrete value (e.g., `shape`, `stride`, `visualize()`, `str`) materializes the
+    node together with all of its pending dependencies in a single JIT compilation.
+    """
+
+    # `__weakref__` is required by the interning of pending nodes
+    __slots__ = (
+        "_fn",
+        "_args",
+        "_kwargs",
+        "_raw",
+        "_constant_as_numeric",
+        "_cache",
+        "_dependencies",
+        "_materialized",
+        "_serialized_outputs",
+        "_value",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        fn: Callable,
+        args: tuple,
+        kwargs: dict[str, Any],
+        raw: bool,
+        constant_as_numeric: bool,
+        cache: bool,
+    ) -> None:
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._raw = raw
+        self._constant_as_numeric = constant_as_numeric
+        self._cache = cache
+        self._dependencies = tuple(
+            leaf for leaf in pytree.tree_leaves((args, kwargs))
+            if isinstance(leaf, LazyNode)
+        )
+        self._materialized = False
+        self._serialized_outputs = None
+        self._value = None
+
+    @property
+    def materialized(self) -> bool:
+        return self._materialized
+
+    @property
+    def value(self) -> pytree.PyTree:
+        if not self._materialized:
+            materialize(self)
+        return self._value
+
+    def make_cache_key(self) -> tuple | None:
+        if not self._cache:
+            return None
+        # materialized dependencies are serialized through `to_struct`
+        _, signature = create_tensor_struct_from_rapier_tensor_with_signature((self._args, self._kwargs))
+        return make_cache_key(
+            fn=self._fn,
+            signature=signature,
+            constant_as_numeric=self._constant_as_numeric,
+        )
+
+    def set_serialized_outputs(self, serialized_outputs: pytree.PyTree) -> None:
+        self._serialized_outputs = serialized_outputs
+        if self._raw:
+            self._value = copy_serialized_outputs(serialized_outputs)
+        else:
+            self._value = create_rapier_tensor_from_tensor_struct(serialized_outputs)
+        self._materialized = True
+        # the inputs are no longer needed
+        self._args = None
+        self._kwargs = None
+        self._dependencies = ()
+
+    def to_struct(self) -> pytree.PyTree:
+        if not self._materialized:
+            materialize(self)
+        return self._serialized_outputs
+
+    def get_metadata(self) -> dict[str, object]:
+        return self.value.get_metadata()
+
+    def get_annotation(self, name: str | None = None) -> str:
+        if not self._materialized:
+            return f"LazyNode[fn={getattr(self._fn, '__name__', self._fn)}]"
+        return self._value.get_annotation(name)
+
+    def __getattr__(self, name: str) -> Any:
+        # only invoked when `name` is not an attribute of the node itself
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.value, name)
+
+    def __getitem__(self, index: Any) -> Any:
+        return self.value[index]
+
+    def __iter__(self) -> Iterator:
+        return iter(self.value)
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+    def __repr__(self) -> str:
+        return repr(self.value)
+
+
+# pending nodes keyed by their function and inputs, used for
+# common-subexpression elimination. Keys hold strong references
+# to the dependencies, hence identities are never reused.
+_interned_nodes: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+
+def _make_intern_key(
+    fn: Callable,
+    args: tuple,
+    kwargs: dict[str, Any],
+    raw: bool,
+    constant_as_numeric: bool,
+) -> tuple | None:
+    leaves, spec = pytree.tree_flatten((args, kwargs))
+    tagged_leaves = []
+    for leaf in leaves:
+        if isinstance(leaf, LazyNode):
+            tagged_leaves.append(leaf)
+        elif isinstance(leaf, CuTeEager):
+            tagged_leaves.append((type(leaf), leaf.to_struct()))
+        else:
+            tagged_leaves.append((type(leaf), leaf))
+    key = (fn, raw, constant_as_numeric, spec, tuple(tagged_leaves))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def record(
+    fn: Callable,
+    args: tuple,
+    kwargs: dict[str, Any],
+    raw: bool,
+    constant_as_numeric: bool,
+    cache: bool,
+) -> LazyNode:
+    key = None
+    # functions with side effects are not deduplicated
+    if cache:
+        key = _make_intern_key(
+            fn=fn,
+            args=args,
+            kwargs=kwargs,
+            raw=raw,
+            constant_as_numeric=constant_as_numeric,
+        )
+
+    if key is not None:
+        node = _interned_nodes.get(key)
+        if node is not None:
+            return node
+
+    node = LazyNode(
+        fn=fn,
+        args=args,
+        kwargs=kwargs,
+        raw=raw,
+        constant_as_numeric=constant_as_numeric,
+        cache=cache,
+    )
+    if key is not None:
+        _interned_nodes[key] = node
+    return node
+
+
+@contextlib.contextmanager
+def lazy() -> Iterator[None]:
+    """
+    Context manager within which `cute_apply` calls are recorded as `LazyNode`s.
+
+    Calls served by the pure-Python fast path (`hilt.eager.fastpath`) never reach
+    `cute_apply`, hence are only recorded when some of their arguments are nodes.
+
+    Usage:
+    with hilt.eager.lazy():
+        layout2 = cute.make_ordered_layout((4, 8), order=(1, 0))
+        layout3 = cute.right_inverse(cute.coalesce(layout2))
+    # compiles the whole chain once
+    print(layout3)
+    """
+    previous_recorder = set_lazy_recorder(record)
+    try:
+        yield
+    finally:
+        set_lazy_recorder(previous_recorder)
+
+
+def is_lazy() -> bool:
+    return get_lazy_recorder() is record
+
+
+def _get_pending_nodes(node: LazyNode) -> list[LazyNode]:
+    # iterative post-order traversal, so that dependencies come first
+    order = []
+    visited = set()
+    stack = [(node, False)]
+    while len(stack) > 0:
+        current, expanded = stack.pop()
+        if current.materialized:
+            continue
+        if expanded:
+            order.append(current)
+            continue
+        if id(current) in visited:
+            continue
+        visited.add(id(current))
+        stack.append((current, True))
+        for dependency in current._dependencies:
+            stack.append((dependency, False))
+    return order
+
+
+def apply_serialized_graph(serialized_graph: tuple) -> list[pytree.PyTree]:
+    # called while tracing a `@cute.jit` function
+    values = []
+    serialized_outputs_list = []
+    for fn, serialized_args, serialized_kwargs, constant_as_numeric in serialized_graph:
+        cute_args, cute_kwargs = create_tensor_from_tensor_struct((serialized_args, serialized_kwargs))
+        cute_args, cute_kwargs = tree_map(
+            TypeDispatcher({NodeRef: lambda leaf: values[leaf.index]}),
+            (cute_args, cute_kwargs),
+        )
+        output = fn(*cute_args, **cute_kwargs)
+        values.append(output)
+        serialized_outputs_list.append(create_tensor_struct_from_tensor(output, constant_as_numeric=constant_as_numeric))
+    return serialized_outputs_list
+
+
+@cute.jit
+def _cute_apply_graph(serialized_graph: cutlass.Constexpr) -> list[pytree.PyTree]:
+    return apply_serialized_graph(serialized_graph)
+
+
+def materialize(node: LazyNode) -> None:
+    """Materializes `node` and its pending dependencies with (at most) one JIT compilation."""
+    pending = []
+    for current in _get_pending_nodes(node):
+        # nodes whose inputs are all concrete might be cached already
+        if all(dependency.materialized for dependency in current._dependencies):
+            found, serialized_outputs = lookup_cache(current.make_cache_key())
+            if found:
+                current.set_serialized_outputs(serialized_outputs)
+                continue
+        pending.append(current)
+
+    if len(pending) == 0:
+        return
+
+    positions = {id(current): index for index, current in enumerate(pending)}
+
+    def _serialize_node(leaf: LazyNode) -> Any:
+        if not leaf.materialized:
+            return NodeRef(positions[id(leaf)])
+        return leaf.to_struct()
+
+    dispatcher = TypeDispatcher({
+        LazyNode: _serialize_node,
+        CuTeEager: lambda leaf: leaf.to_struct(),
+    })
+    serialized_graph = []
+    for current in pending:
+        serialized_args, serialized_kwargs = tree_map(dispatcher, (current._args, current._kwargs))
+        serialized_graph.append((
+            current._fn,
+            serialized_args,
+            serialized_kwargs,
+            current._constant_as_numeric,
+        ))
+
+    references = []
+    serialized_graph = create_tensor_struct_with_pointer(
+        tuple(serialized_graph),
+        references=references,
+    )
+    serialized_outputs_list = _cute_apply_graph(serialized_graph=serialized_graph)
+
+    for current, serialized_outputs in zip(pending, serialized_outputs_list):
+        # dependencies come first, hence their outputs are set
+        # by the time the cache key of `current` is computed
+        key = current.make_cache_key()
+        current.set_serialized_outputs(serialized_outputs)
+        insert_cache(key, serialized_outputs)
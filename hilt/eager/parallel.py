@@ -0,0 +1,146 @@
+import os
+import math
+import threading
+import multiprocessing
+import concurrent.futures
+import torch.utils._pytree as pytree
+from typing import Any, Callable, Sequence
+
+from .core import cute_apply
+
+# pools are kept alive across calls, so that the workers' JIT contexts
+# (and in-process caches) stay warm, see `shutdown_pools`
+_pools: dict[int, concurrent.futures.ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+# wrappers built within a worker process, keyed by function and options
+_worker_wrappers: dict[tuple, Callable] = {}
+
+
+def _initialize_worker() -> None:
+    # pays for importing the CUTLASS DSL once per worker rather than per task
+    import cutlass.cute  # noqa: F401
+
+
+def _evaluate_chunk(
+    fn: Callable,
+    options: dict[str, Any],
+    serialized_chunk: list[tuple[pytree.PyTree, pytree.PyTree]],
+) -> list[pytree.PyTree]:
+    # runs in a worker process
+    key = (fn, tuple(sorted(options.items())))
+    wrapper = _worker_wrappers.get(key)
+    if wrapper is None:
+        wrapper = cute_apply(**options)(fn)
+        _worker_wrappers[key] = wrapper
+    return wrapper.batch_serialized(serialized_chunk)
+
+
+def get_pool(workers: int) -> concurrent.futures.ProcessPoolExecutor:
+    """Returns the (shared) pool of `workers` processes, starting it if needed."""
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            # forking a process with an initialized MLIR context is unsafe
+            pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_initialize_worker,
+            )
+            _pools[workers] = pool
+        return pool
+
+
+def shutdown_pools() -> None:
+    """Terminates the worker processes started by `parallel_map`."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _evaluate_in_pool(
+    pending_serialized: list[tuple[pytree.PyTree, pytree.PyTree]],
+    fn: Callable,
+    options: dict[str, Any],
+    workers: int,
+    chunksize: int | None,
+) -> list[pytree.PyTree]:
+    if chunksize is None:
+        # a few chunks per worker balance the load, while
+        # each chunk is still evaluated in a single compilation
+        chunksize = max(1, math.ceil(len(pending_serialized) / (workers * 4)))
+
+    pool = get_pool(workers)
+    futures = [
+        pool.submit(_evaluate_chunk, fn, options, pending_serialized[start: start + chunksize])
+        for start in range(0, len(pending_serialized), chunksize)
+    ]
+
+    done, not_done = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+    for future in futures:
+        if future in done and future.exception() is not None:
+            # skips the chunks that have not started yet
+            for other_future in not_done:
+                other_future.cancel()
+            raise future.exception()
+
+    return [
+        serialized_outputs
+        for future in futures
+        for serialized_outputs in future.result()
+    ]
+
+
+def parallel_map(
+    fn: Callable,
+    args_list: Sequence[tuple],
+    kwargs_list: Sequence[dict[str, Any]] | None = None,
+    workers: int | None = None,
+    chunksize: int | None = None,
+    **kwargs,
+) -> list[pytree.PyTree]:
+    """
+    Evaluates `fn` on many independent argument sets across worker processes.
+
+    Argument sets are serialized into (picklable) structs, deduplicated and looked up in
+    the cache as in `batch`. The remaining ones are split into chunks, each evaluated by a
+    worker within a single JIT compilation. Workers are reused across calls. On the first
+    error, chunks that have not started are cancelled and the error is raised.
+
+    Args:
+        fn: A module-level function operating on cute objects, or one already wrapped by `cute_apply`
+        args_list: The positional arguments of each call
+        kwargs_list: The keyword arguments of each call
+        workers: The number of worker processes, defaults to `os.cpu_count()`
+        chunksize: The number of argument sets per task, defaults to a few tasks per worker
+        **kwargs: Forwarded to `cute_apply` when `fn` is not wrapped yet
+
+    Returns:
+        The outputs of each call, in order
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"`workers` must be positive, got {workers}")
+
+    if not hasattr(fn, "batch"):
+        fn = cute_apply(**kwargs)(fn)
+    if workers == 1:
+        return fn.batch(args_list, kwargs_list)
+
+    # workers rebuild the wrapper from the (picklable) function, note that
+    # `inspect.unwrap` could go past it into decorators applied before `cute_apply`
+    unwrapped_fn = fn.cute_apply_fn
+    options = fn.cute_apply_options
+
+    def evaluate(pending_serialized: list[tuple[pytree.PyTree, pytree.PyTree]]) -> list[pytree.PyTree]:
+        return _evaluate_in_pool(
+            pending_serialized,
+            fn=unwrapped_fn,
+            options=options,
+            workers=workers,
+            chunksize=chunksize,
+        )
+
+    return fn.batch(args_list, kwargs_list, evaluate=evaluate)
@@ -0,0 +1,145 @@
+import torch.utils._pytree as pytree
+from typing import Any, Callable
+
+# how `tree_map` traverses each type, mirroring `torch.utils._pytree`
+_LEAF = 0
+_TUPLE = 1
+_LIST = 2
+_DICT = 3
+_NAMEDTUPLE = 4
+_PYTREE = 5
+
+
+class TypeDispatcher(object):
+    """
+    Maps objects to handlers by their exact type in O(1).
+
+    Handlers are registered against (possibly abstract, or union) base types, and are
+    checked in registration order the first time a concrete type is seen, much like
+    an `isinstance` chain. The resolved handler (or `None`) is memoized per type.
+    """
+
+    def __init__(self, handlers: dict[Any, Callable]) -> None:
+        self._handlers = list(handlers.items())
+        self._table: dict[type, Callable | None] = {}
+
+    def register(self, base: Any, handler: Callable) -> None:
+        self._handlers.append((base, handler))
+        self._table.clear()
+
+    def lookup(self, cls: type) -> Callable | None:
+        try:
+            return self._table[cls]
+        except KeyError:
+            pass
+        handler = None
+        for base, candidate in self._handlers:
+            if issubclass(cls, base):
+                handler = candidate
+                break
+        self._table[cls] = handler
+        return handler
+
+
+_node_kinds: dict[type, int] = {
+    tuple: _TUPLE,
+    list: _LIST,
+    dict: _DICT,
+    # an empty node for `pytree`, which maps to itself
+    type(None): _LEAF,
+}
+
+
+def _get_node_kind(cls: type) -> int:
+    try:
+        return _node_kinds[cls]
+    except KeyError:
+        pass
+    if issubclass(cls, tuple) and hasattr(cls, "_fields"):
+        kind = _NAMEDTUPLE
+    elif cls in pytree.SUPPORTED_NODES:
+        kind = _PYTREE
+    else:
+        kind = _LEAF
+    _node_kinds[cls] = kind
+    return kind
+
+
+def _flatten_one_level(node: Any) -> tuple[list[Any], pytree.TreeSpec]:
+    return pytree.tree_flatten(node, is_leaf=lambda child: child is not node)
+
+
+def tree_map(dispatcher: TypeDispatcher, tree: pytree.PyTree) -> pytree.PyTree:
+    """
+    Single-pass equivalent of `pytree.tree_map`, whose leaves are the objects with a
+    handler in `dispatcher` (which are never traversed) and the `pytree` leaves.
+    Leaves without a handler are returned as is.
+    """
+
+    def _map(node: Any) -> Any:
+        cls = type(node)
+        handler = dispatcher.lookup(cls)
+        if handler is not None:
+            return handler(node)
+        kind = _get_node_kind(cls)
+        if kind == _LEAF:
+            return node
+        if kind == _TUPLE:
+            return tuple([_map(child) for child in node])
+        if kind == _LIST:
+            return [_map(child) for child in node]
+        if kind == _DICT:
+            return {key: _map(child) for key, child in node.items()}
+        if kind == _NAMEDTUPLE:
+            return cls(*[_map(child) for child in node])
+        # uncommon containers (e.g., `OrderedDict`) are flattened one level by `pytree`
+        children, spec = _flatten_one_level(node)
+        return pytree.tree_unflatten([_map(child) for child in children], spec)
+
+    return _map(tree)
+
+
+def tree_map_with_signature(dispatcher: TypeDispatcher, tree: pytree.PyTree) -> tuple[pytree.PyTree, tuple]:
+    """
+    Like `tree_map`, but additionally returns the signature of the output: a nested tuple
+    that mirrors the structure, tagging every container and leaf with its type, since
+    e.g., different `NamedTuple`s (or `True` and `1`) compare equal as plain tuples.
+    """
+
+    def _map(node: Any) -> tuple[Any, tuple]:
+        cls = type(node)
+        handler = dispatcher.lookup(cls)
+        if handler is not None:
+            output = handler(node)
+            return output, (type(output), output)
+        kind = _get_node_kind(cls)
+        if kind == _LEAF:
+            return node, (cls, node)
+        if kind == _DICT:
+            outputs = {}
+            signatures = []
+            for key, child in node.items():
+                outputs[key], signature = _map(child)
+                signatures.append((key, signature))
+            return outputs, (cls, tuple(signatures))
+        if kind == _PYTREE:
+            children, spec = _flatten_one_level(node)
+        else:
+            children, spec = node, None
+
+        outputs = []
+        signatures = []
+        for child in children:
+            output, signature = _map(child)
+            outputs.append(output)
+            signatures.append(signature)
+        if kind == _TUPLE:
+            outputs = tuple(outputs)
+        elif kind == _NAMEDTUPLE:
+            outputs = cls(*outputs)
+        elif kind == _PYTREE:
+            # the spec records the context, e.g., the keys of an `OrderedDict`
+            return pytree.tree_unflatten(outputs, spec), (cls, spec, tuple(signatures))
+        return outputs, (cls, tuple(signatures))
+
+    return _map(tree)
@@ -1,11 +1,15 @@
+import os
+import sys
+import mmap
+import ctypes
 import torch
 import cutlass
 import cutlass.torch
 import cutlass.cute as cute
 from typing import Any, NamedTuple, Self
 from ..dtype_utils import get_dtype
-from ..pycute_utils import product
-from .base import CuTeEager
+from ..pycute_utils import product, flatten
+from .base import CuTeValue
 
 CuTeTensorType = cute.runtime._Tensor | cute.core._Tensor
 
@@ -17,6 +21,22 @@ TORCH_DTYPE_TO_CUTLASS_DTYPE_MAP = {
     torch.int64: cutlass.Int64,
 }
 
+# `ReferenceTensor` pointers are never dereferenced by the layout algebra, hence by default
+# they point into address space that is reserved but not backed by memory (see `VirtualBuffer`).
+_virtual_pointers = os.environ.get("HILT_EAGER_VIRTUAL_POINTERS", "1") != "0"
+# exposed by the `mmap` module only as of Python 3.13
+MAP_NORESERVE = getattr(mmap, "MAP_NORESERVE", 0x4000 if sys.platform.startswith("linux") else 0)
+
+
+def set_virtual_pointers_enabled(enabled: bool) -> None:
+    """Switches `ReferenceTensor` pointers between reserved address space and real (`torch.empty`) buffers."""
+    global _virtual_pointers
+    _virtual_pointers = enabled
+
+
+def is_virtual_pointers_enabled() -> bool:
+    return _virtual_pointers
+
 
 class TensorStruct(NamedTuple):
     shape: tuple
@@ -113,7 +133,29 @@ class NumericStruct(NamedTuple):
         return cls(dtype=tensor.dtype)
 
 
-class CuTeTensor(CuTeEager):
+class VirtualBuffer(object):
+    """
+    Anonymous private mapping reserved with `MAP_NORESERVE`, whose pages are only
+    committed when written to. Reads of untouched pages return zeros from the shared
+    zero page, hence a (GB-sized) placeholder costs address space rather than memory.
+    """
+
+    def __init__(self, nbytes: int, alignment: int = 1) -> None:
+        # mappings are page-aligned, larger alignments need slack
+        self._mmap = mmap.mmap(
+            -1,
+            max(nbytes + max(alignment - mmap.PAGESIZE, 0), 1),
+            flags=mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS | MAP_NORESERVE,
+        )
+        base = ctypes.addressof(ctypes.c_char.from_buffer(self._mmap))
+        self._data_ptr = ((base + alignment - 1) // alignment) * alignment
+
+    def data_ptr(self) -> int:
+        return self._data_ptr
+
+
+class CuTeTensor(CuTeValue):
+    __slots__ = ("_shape", "_stride", "_dtype")
 
     def __init__(
         self,
@@ -162,6 +204,9 @@ class CuTeTensor(CuTeEager):
 
 
 class ReferenceTensor(CuTeTensor):
+    # `_data` keeps the buffer backing the latest pointer alive
+    __slots__ = ("_memspace", "_alignment", "_data")
+    _mutable_slots = CuTeValue._mutable_slots | {"_data"}
 
     def __init__(
         self,
@@ -200,8 +245,26 @@ class ReferenceTensor(CuTeTensor):
     def get_struct_type(cls: type[Self]) -> type:
         return TensorStruct
 
-    def make_pointer(self) -> cute.Pointer:
-        if self.alignment is not None and self.alignment > 1:
+    def nbytes_spanned(self) -> int:
+        # bytes between the first and (one past) the last element
+        if self.numel() == 0:
+            return 0
+        shape = flatten(self.shape)
+        stride = flatten(self.stride())
+        span = 1 + sum((s - 1) * abs(d) for s, d in zip(shape, stride))
+        return span * self.torch_dtype.itemsize
+
+    def make_pointer(self, virtual: bool | None = None) -> cute.Pointer:
+        if virtual is None:
+            virtual = _virtual_pointers
+
+        if virtual:
+            data = VirtualBuffer(
+                nbytes=self.nbytes_spanned(),
+                alignment=max(self.alignment or 1, self.torch_dtype.itemsize),
+            )
+            data_ptr = data.data_ptr()
+        elif self.alignment is not None and self.alignment > 1:
             # Allocate buffer with extra space for alignment
             extra_elements = (self.alignment - 1) // self.torch_dtype.itemsize
             data = torch.empty(
@@ -235,6 +298,7 @@ class ReferenceTensor(CuTeTensor):
 
 
 class CoordinateTensor(CuTeTensor):
+    __slots__ = ("_iterator",)
 
     def __init__(
         self,
@@ -266,6 +330,7 @@ class CoordinateTensor(CuTeTensor):
 
 
 class SSATensor(CuTeTensor):
+    __slots__ = ()
 
     def __init__(
         self,
@@ -290,6 +355,7 @@ class SSATensor(CuTeTensor):
 
 
 class ArithValueTensor(CuTeTensor):
+    __slots__ = ()
 
     def __init__(self, dtype: type[cute.Numeric]) -> None:
         super().__init__(
@@ -309,6 +375,7 @@ class ArithValueTensor(CuTeTensor):
 
 
 class NumericTensor(CuTeTensor):
+    __slots__ = ()
 
     def __init__(self, dtype: type[cute.Numeric]) -> None:
         super().__init__(
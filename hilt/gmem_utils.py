@@ -0,0 +1,151 @@
+import math
+import numpy as np
+from typing import NamedTuple
+from .pycute_utils import (
+    Layout,
+    LayoutBase,
+    product,
+    get_shape,
+    to_index_array,
+    evaluate_layout,
+)
+from .smem_utils import get_element_bits
+
+__all__ = [
+    "EXCESSIVE_SECTORS_THRESHOLD",
+    "SectorReport",
+    "predict_global_sectors",
+]
+
+# as in `profile_kernel.py`, accesses are excessive when at least this fraction of
+# their sectors are excessive ("L2 Theoretical Sectors Global Excessive")
+EXCESSIVE_SECTORS_THRESHOLD = 0.25
+
+
+class SectorReport(NamedTuple):
+    """
+    The global memory sectors of every warp-wide load (or store) of a TV layout.
+
+    Attributes:
+        vector_width: The number of (consecutive) values of each thread per access
+        sectors: The sectors requested by each `(warp, access)`
+        ideal_sectors: The fewest sectors that could hold the bytes of each `(warp, access)`
+    """
+    vector_width: int
+    sectors: np.ndarray
+    ideal_sectors: np.ndarray
+
+    @property
+    def excessive_sectors(self) -> np.ndarray:
+        return self.sectors - self.ideal_sectors
+
+    @property
+    def excessive_accesses(self) -> np.ndarray:
+        """Whether each access (summed over warps) is classified as excessive."""
+        sectors = self.sectors.sum(axis=0)
+        excessive = self.excessive_sectors.sum(axis=0)
+        return (excessive > 0) & (excessive >= EXCESSIVE_SECTORS_THRESHOLD * sectors)
+
+    @property
+    def is_excessive(self) -> bool:
+        sectors = int(self.sectors.sum())
+        excessive = int(self.excessive_sectors.sum())
+        return excessive > 0 and excessive >= EXCESSIVE_SECTORS_THRESHOLD * sectors
+
+    def format(self) -> str:
+        lines = []
+        sectors = self.sectors.sum(axis=0)
+        excessive = self.excessive_sectors.sum(axis=0)
+        for access, (total, extra, flagged) in enumerate(zip(sectors, excessive, self.excessive_accesses)):
+            start = access * self.vector_width
+            line = f"access {access:4d} (values {start}-{start + self.vector_width - 1}): {total} sectors, {extra} excessive"
+            if flagged:
+                line += f" [Access] {extra / total * 100:.2f}% of this access's sectors are excessive"
+            lines.append(line)
+        lines.append(f"total: {int(self.sectors.sum())} sectors, {int(self.excessive_sectors.sum())} excessive")
+        return "\n".join(lines)
+
+
+def predict_global_sectors(
+    layout_tv: LayoutBase,
+    gmem_layout: object,
+    dtype: object | None = None,
+    alignment: int | None = None,
+    vector_width: int = 1,
+    sector_bytes: int = 32,
+    warp_size: int = 32,
+) -> SectorReport:
+    """
+    Predicts the sectors that each warp-wide access through a TV layout requests from global
+    memory, without running the kernel. The `k`-th access of each thread covers its values
+    `[k * vector_width, (k + 1) * vector_width)`.
+
+    Args:
+        layout_tv: Maps (thread, value) to the index in the tile, as in `make_inverse_tv`
+        gmem_layout: Maps the index in the tile to the element offset in global memory, either
+            a layout or a tensor with `shape`, `stride()` and `dtype`, e.g., `hilt.eager.tensor.from_torch`
+        dtype: The element type, defaults to that of `gmem_layout` (when a tensor)
+        alignment: The alignment (in bytes) of the first element of the tile, which is assumed to
+            start `alignment % sector_bytes` bytes into a sector (i.e., not the worst placement
+            the alignment allows, only the first that is not sector-aligned); defaults to that of
+            `gmem_layout` (when a tensor), and to sector-aligned otherwise
+        vector_width: The number of values per access
+        sector_bytes: The size of each sector
+        warp_size: The number of threads per warp
+    """
+    if not isinstance(gmem_layout, LayoutBase):
+        if dtype is None:
+            dtype = gmem_layout.dtype
+        if alignment is None:
+            alignment = getattr(gmem_layout, "alignment", None)
+        gmem_layout = Layout(tuple(gmem_layout.shape), tuple(gmem_layout.stride()))
+    if dtype is None:
+        raise ValueError("`dtype` is required for layouts")
+
+    indices = to_index_array(layout_tv)
+    if indices.ndim != 2:
+        raise ValueError(f"Expected a (thread, value) layout, got {layout_tv}")
+    num_threads, num_values = indices.shape
+    tile_size = int(indices.max(initial=-1)) + 1
+    if product(get_shape(gmem_layout)) < tile_size:
+        raise ValueError(f"The domain of {gmem_layout} does not cover the tile of {tile_size} elements")
+    if vector_width < 1 or num_values % vector_width != 0:
+        raise ValueError(f"{num_values} values per thread are not a multiple of the vector width {vector_width}")
+    num_accesses = num_values // vector_width
+    num_warps = math.ceil(num_threads / warp_size)
+    num_groups = num_warps * num_accesses
+
+    element_bits = get_element_bits(dtype)
+    sector_bits = sector_bytes * 8
+    base_bits = 0 if alignment is None else (alignment % sector_bytes) * 8
+    offsets = evaluate_layout(gmem_layout, indices).reshape(num_threads, num_accesses, vector_width)
+    groups = (np.arange(num_threads) // warp_size)[:, None] * num_accesses + np.arange(num_accesses)
+    groups = np.broadcast_to(groups[..., None], offsets.shape).reshape(-1)
+    offsets = offsets.reshape(-1)
+
+    # elements straddle (at most) two sectors when misaligned
+    start_bits = base_bits + offsets * element_bits
+    first_sectors = start_bits // sector_bits
+    last_sectors = (start_bits + element_bits - 1) // sector_bits
+    sectors = _count_distinct_per_group(
+        np.concatenate([groups, groups]),
+        np.concatenate([first_sectors, last_sectors]),
+        num_groups,
+    )
+    # elements read by several threads are only fetched once
+    num_elements = _count_distinct_per_group(groups, offsets, num_groups)
+    ideal_sectors = -(-num_elements * element_bits // sector_bits)
+    return SectorReport(
+        vector_width=vector_width,
+        sectors=sectors.reshape(num_warps, num_accesses),
+        ideal_sectors=ideal_sectors.reshape(num_warps, num_accesses),
+    )
+
+
+def _count_distinct_per_group(groups: np.ndarray, values: np.ndarray, num_groups: int) -> np.ndarray:
+    if values.size == 0:
+        return np.zeros(num_groups, dtype=np.int64)
+    min_value = int(values.min())
+    span = int(values.max()) - min_value + 1
+    keys = np.unique(groups * span + (values - min_value))
+    return np.bincount(keys // span, minlength=num_groups)
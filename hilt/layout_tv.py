@@ -1,10 +1,18 @@
+import numpy as np
 import matplotlib.pyplot as plt
+from typing import NamedTuple
 from collections import defaultdict
+from collections.abc import Callable
 from .pycute_utils import (
     Layout,
-    idx2crd,
-    crd2idx,
+    Swizzle,
+    LayoutBase,
+    get_shape,
+    swizzle_array,
+    is_injective,
+    get_shape_indexer,
     product,
+    to_index_array,
     visualize_layout,
 )
 
@@ -14,33 +22,38 @@ LayoutTV = tuple[TVShape, TVShape]
 InverseTVEntry = tuple[tuple[int, ...], tuple[int, ...], int, int]
 
 __all__ = [
+    "CompactInverseTV",
     "make_inverse_tv",
+    "make_compact_inverse_tv",
     "visualize_layout_tv",
     "visualize_layout_tv_maybe_duplicates",
     "tiler_crd_to_layout_tv_crd",
+    "tiler_crds_to_layout_tv_crds",
+    "LayoutTVCoverage",
+    "layout_tv_coverage",
 ]
 
 
 def visualize_layout_tv(
     tiler_mn: TilerMN,
-    layout_tv: Layout,
-    inverse_tv: dict[int, InverseTVEntry] | None = None,
+    layout_tv: LayoutBase,
+    inverse_tv: "dict[int, InverseTVEntry] | CompactInverseTV | None" = None,
     use_alpha: bool = False,
     use_index: bool = False,
+    color_map: Callable[[int], object] | None = None,
     **kwargs,
 ) -> tuple[plt.Figure, plt.Axes]:
 
-    assert len(layout_tv.shape) == 2
-    assert len(layout_tv.stride) == 2
+    assert len(get_shape(layout_tv)) == 2
     if inverse_tv is None:
-        inverse_tv = make_inverse_tv(layout_tv, maybe_duplicates=False)
+        inverse_tv = make_compact_inverse_tv(layout_tv, maybe_duplicates=False)
 
-    def color_map(index: int) -> tuple[float, float, float, float]:
+    def thread_color_map(index: int) -> tuple[float, float, float, float]:
         _, _, thr_idx, val_idx = inverse_tv[index]
         colors = plt.cm.Set2.colors
         rgb = colors[thr_idx % len(colors)]
         if use_alpha:
-            vals = product(layout_tv.shape[1])
+            vals = product(get_shape(layout_tv)[1])
             alpha = (vals - val_idx) / vals
         else:
             alpha = 1.0
@@ -56,7 +69,8 @@ def visualize_layout_tv(
     tiler_layout = Layout(tiler_mn)
     return visualize_layout(
         layout=tiler_layout,
-        color_map=color_map,
+        # e.g., overlays of analyses, colored per index rather than per thread
+        color_map=thread_color_map if color_map is None else color_map,
         label_map=label_map,
         **kwargs
     )
@@ -64,19 +78,19 @@ def visualize_layout_tv(
 
 def visualize_layout_tv_maybe_duplicates(
     tiler_mn: TilerMN,
-    layout_tv: Layout,
-    inverse_tv: dict[int, list[InverseTVEntry]] | None = None,
+    layout_tv: LayoutBase,
+    inverse_tv: "dict[int, list[InverseTVEntry]] | CompactInverseTV | None" = None,
     use_alpha: bool = False,
     use_index: bool = False,
+    color_map: Callable[[int], object] | None = None,
     **kwargs,
 ) -> tuple[plt.Figure, plt.Axes]:
 
-    assert len(layout_tv.shape) == 2
-    assert len(layout_tv.stride) == 2
+    assert len(get_shape(layout_tv)) == 2
     if inverse_tv is None:
-        inverse_tv = make_inverse_tv(layout_tv, maybe_duplicates=True)
+        inverse_tv = make_compact_inverse_tv(layout_tv, maybe_duplicates=True)
 
-    def color_map(index: int) -> tuple[float, float, float, float]:
+    def thread_color_map(index: int) -> tuple[float, float, float, float]:
         if len(inverse_tv[index]) == 0:
             return 1.0, 1.0, 1.0, 0.0
 
@@ -85,7 +99,7 @@ def visualize_layout_tv_maybe_duplicates(
         colors = plt.cm.Set2.colors
         rgb = colors[thr_idx % len(colors)]
         if use_alpha:
-            vals = product(layout_tv.shape[1])
+            vals = product(get_shape(layout_tv)[1])
             alpha = (vals - val_idx) / vals
         else:
             alpha = 1.0
@@ -113,34 +127,30 @@ def visualize_layout_tv_maybe_duplicates(
     tiler_layout = Layout(tiler_mn)
     return visualize_layout(
         layout=tiler_layout,
-        color_map=color_map,
+        color_map=thread_color_map if color_map is None else color_map,
         label_map=label_map,
         **kwargs
     )
 
 
-def make_inverse_tv(layout_tv: Layout, maybe_duplicates: bool) -> dict[int, InverseTVEntry | list[InverseTVEntry]]:
-    thr_shape, val_shape = layout_tv.shape
+def make_inverse_tv(layout_tv: LayoutBase, maybe_duplicates: bool) -> dict[int, InverseTVEntry | list[InverseTVEntry]]:
+    thr_shape, val_shape = get_shape(layout_tv)
 
     if not maybe_duplicates:
+        assert is_injective(layout_tv)
         inverse_tv = {}
     else:
         inverse_tv = defaultdict(list)
 
-    for thr_idx in range(product(thr_shape)):
-        thr_crd = idx2crd(
-            idx=thr_idx,
-            shape=thr_shape,
-        )
-        for val_idx in range(product(val_shape)):
-            val_crd = idx2crd(
-                idx=val_idx,
-                shape=val_shape,
-            )
-            index = layout_tv(thr_idx, val_idx)
+    thr_crds = [get_shape_indexer(thr_shape).idx2crd(thr_idx) for thr_idx in range(product(thr_shape))]
+    val_crds = [get_shape_indexer(val_shape).idx2crd(val_idx) for val_idx in range(product(val_shape))]
+    indices = to_index_array(layout_tv).tolist()
+
+    for thr_idx, thr_crd in enumerate(thr_crds):
+        for val_idx, val_crd in enumerate(val_crds):
+            index = indices[thr_idx][val_idx]
             entry = (thr_crd, val_crd, thr_idx, val_idx)
             if not maybe_duplicates:
-                assert index not in inverse_tv.keys()
                 inverse_tv[index] = entry
             else:
                 inverse_tv[index].append(entry)
@@ -148,22 +158,219 @@ def make_inverse_tv(layout_tv: Layout, maybe_duplicates: bool) -> dict[int, Inve
     return inverse_tv
 
 
+class CompactInverseTV(object):
+    """
+    Array-backed equivalent of `make_inverse_tv`, indexed the same way.
+
+    The (thread, value) pairs mapping to each index are stored in CSR form: those of `index`
+    are `thr_idx[offsets[index]: offsets[index + 1]]` (and likewise `val_idx`), in the order
+    of `make_inverse_tv`. Coordinates are only decoded when an entry is accessed.
+    """
+
+    def __init__(
+        self,
+        thr_shape: TVShape,
+        val_shape: TVShape,
+        thr_idx: np.ndarray,
+        val_idx: np.ndarray,
+        offsets: np.ndarray,
+        maybe_duplicates: bool,
+    ) -> None:
+        self.thr_shape = thr_shape
+        self.val_shape = val_shape
+        self.thr_idx = thr_idx
+        self.val_idx = val_idx
+        self.offsets = offsets
+        self.maybe_duplicates = maybe_duplicates
+
+    @classmethod
+    def from_layout_tv(cls, layout_tv: LayoutBase, maybe_duplicates: bool) -> "CompactInverseTV":
+        thr_shape, val_shape = get_shape(layout_tv)
+        num_vals = product(val_shape)
+        # thread-major, as in `make_inverse_tv`
+        indices = to_index_array(layout_tv).reshape(-1)
+        if indices.size > 0 and indices.min() < 0:
+            raise ValueError("TV layouts with negative indices are not supported")
+
+        counts = np.bincount(indices, minlength=0 if indices.size == 0 else indices.max() + 1)
+        if not maybe_duplicates and np.any(counts > 1):
+            raise ValueError(f"Index {int(np.argmax(counts > 1))} is mapped to by multiple (thread, value) pairs")
+        offsets = np.zeros(counts.size + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        # scatters every (thread, value) pair to the next free slot of its index,
+        # the stable sort keeps pairs of the same index in thread-major order
+        order = np.argsort(indices, kind="stable")
+        return cls(
+            thr_shape=thr_shape,
+            val_shape=val_shape,
+            thr_idx=(order // num_vals).astype(np.int32),
+            val_idx=(order % num_vals).astype(np.int32),
+            offsets=offsets,
+            maybe_duplicates=maybe_duplicates,
+        )
+
+    def count(self, index: int) -> int:
+        if index < 0 or index + 1 >= self.offsets.size:
+            return 0
+        return int(self.offsets[index + 1] - self.offsets[index])
+
+    def entries(self, index: int) -> list[InverseTVEntry]:
+        if self.count(index) == 0:
+            return []
+        start = int(self.offsets[index])
+        end = int(self.offsets[index + 1])
+        return [
+            self._make_entry(int(thr_idx), int(val_idx))
+            for thr_idx, val_idx in zip(self.thr_idx[start: end], self.val_idx[start: end])
+        ]
+
+    def _make_entry(self, thr_idx: int, val_idx: int) -> InverseTVEntry:
+        thr_crd = get_shape_indexer(self.thr_shape).idx2crd(thr_idx)
+        val_crd = get_shape_indexer(self.val_shape).idx2crd(val_idx)
+        return thr_crd, val_crd, thr_idx, val_idx
+
+    def keys(self) -> list[int]:
+        return np.flatnonzero(np.diff(self.offsets)).tolist()
+
+    def __contains__(self, index: int) -> bool:
+        return self.count(index) > 0
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(np.diff(self.offsets)))
+
+    def __getitem__(self, index: int) -> InverseTVEntry | list[InverseTVEntry]:
+        # like the dictionaries of `make_inverse_tv`, where
+        # missing indices map to empty lists when duplicates are allowed
+        if self.maybe_duplicates:
+            return self.entries(index)
+        if self.count(index) == 0:
+            raise KeyError(index)
+        start = int(self.offsets[index])
+        return self._make_entry(int(self.thr_idx[start]), int(self.val_idx[start]))
+
+
+def make_compact_inverse_tv(layout_tv: LayoutBase, maybe_duplicates: bool) -> CompactInverseTV:
+    """Like `make_inverse_tv`, but builds the (much smaller) array-backed `CompactInverseTV`."""
+    return CompactInverseTV.from_layout_tv(layout_tv, maybe_duplicates=maybe_duplicates)
+
+
 def tiler_crd_to_layout_tv_crd(
     tiler_crd: TilerMN,
     tiler_mn: TilerMN,
     layout_tv_shape: TVShape,
     layout_tv_stride: TVShape,
+    swizzle: Swizzle | None = None,
 ) -> TVShape:
+    # the index in the tile is unswizzled first, since swizzles are involutions,
+    # i.e., `layout_tv_shape` and `layout_tv_stride` are of the unswizzled TV layout
     assert len(tiler_crd) == 2
     assert len(tiler_mn) == 2
     assert len(layout_tv_shape) == 2
     assert len(layout_tv_stride) == 2
-    tiler_idx = crd2idx(
-        crd=tiler_crd,
-        shape=tiler_mn,
-    )
-    return idx2crd(
-        idx=tiler_idx,
-        shape=layout_tv_shape,
-        stride=layout_tv_stride,
+    tiler_idx = get_shape_indexer(tiler_mn).crd2idx(tiler_crd)
+    if swizzle is not None:
+        tiler_idx = swizzle(tiler_idx)
+    return get_shape_indexer(layout_tv_shape, layout_tv_stride).idx2crd(tiler_idx)
+
+
+def tiler_crds_to_layout_tv_crds(
+    tiler_crds: np.ndarray,
+    tiler_mn: TilerMN,
+    layout_tv_shape: TVShape,
+    layout_tv_stride: TVShape,
+    swizzle: Swizzle | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Batched `tiler_crd_to_layout_tv_crd`, over an array of (m, n) coordinates along its last axis.
+
+    Returns:
+        The thread and value coordinates, flattened along the last axis (i.e., `flatten(thr_crd)`
+        and `flatten(val_crd)` of the scalar version), and the thread and value indices
+    """
+    assert len(tiler_mn) == 2
+    assert len(layout_tv_shape) == 2
+    assert len(layout_tv_stride) == 2
+    tiler_crds = np.asarray(tiler_crds, dtype=np.int64)
+    if tiler_crds.shape[-1] != 2:
+        raise ValueError(f"Expected (m, n) coordinates along the last axis, got shape {tiler_crds.shape}")
+    thr_shape, val_shape = layout_tv_shape
+    tiler_idx = get_shape_indexer(tiler_mn).crd2idx_array(tiler_crds)
+    if swizzle is not None:
+        tiler_idx = swizzle_array(swizzle, tiler_idx)
+    flat_crds = get_shape_indexer(layout_tv_shape, layout_tv_stride).idx2crd_array(tiler_idx)
+    num_thr_modes = len(get_shape_indexer(thr_shape).flat_shape)
+    thr_crds = flat_crds[..., :num_thr_modes]
+    val_crds = flat_crds[..., num_thr_modes:]
+    thr_idx = get_shape_indexer(thr_shape).crd2idx_array(thr_crds)
+    val_idx = get_shape_indexer(val_shape).crd2idx_array(val_crds)
+    return thr_crds, val_crds, thr_idx, val_idx
+
+
+class LayoutTVCoverage(NamedTuple):
+    """
+    How a TV layout covers its tile.
+
+    Attributes:
+        counts: The number of (thread, value) pairs mapping to each index of the tile
+        unreached: The indices of the tile that no pair maps to
+        out_of_tile: The `(thr_idx, val_idx)` of the pairs mapping outside of the tile
+        values_per_thread: The number of values of each thread within the tile
+    """
+    counts: np.ndarray
+    unreached: np.ndarray
+    out_of_tile: np.ndarray
+    values_per_thread: np.ndarray
+
+    @property
+    def max_replication(self) -> int:
+        return int(self.counts.max(initial=0))
+
+    @property
+    def duplicated(self) -> np.ndarray:
+        """The indices of the tile that several pairs map to."""
+        return np.flatnonzero(self.counts > 1)
+
+    @property
+    def is_complete(self) -> bool:
+        return self.unreached.size == 0
+
+    @property
+    def is_bijective(self) -> bool:
+        return self.is_complete and self.max_replication <= 1 and self.out_of_tile.size == 0
+
+    @property
+    def load_imbalance(self) -> float:
+        """The largest number of values of a thread over the mean (1 when balanced)."""
+        mean = self.values_per_thread.mean() if self.values_per_thread.size > 0 else 0.0
+        return float(self.values_per_thread.max() / mean) if mean > 0 else 1.0
+
+    def format(self) -> str:
+        lines = [
+            f"tile: {self.counts.size} indices, {self.unreached.size} unreached, "
+            f"{self.duplicated.size} duplicated (up to {self.max_replication}x)",
+            f"out of tile: {len(self.out_of_tile)} (thread, value) pairs",
+        ]
+        values_per_thread = self.values_per_thread
+        if values_per_thread.size > 0:
+            lines.append(
+                f"values per thread: min {values_per_thread.min()}, max {values_per_thread.max()}, "
+                f"mean {values_per_thread.mean():.2f}, imbalance {self.load_imbalance:.2f}"
+            )
+        return "\n".join(lines)
+
+
+def layout_tv_coverage(tiler_mn: TilerMN, layout_tv: LayoutBase) -> LayoutTVCoverage:
+    """Counts, with `bincount`, how often each index of the `tiler_mn` tile is mapped to by `layout_tv`."""
+    assert len(get_shape(layout_tv)) == 2
+    tile_size = product(tiler_mn)
+    # (thread, value) -> index in the tile
+    indices = to_index_array(layout_tv)
+    in_tile = (indices >= 0) & (indices < tile_size)
+    counts = np.bincount(indices[in_tile], minlength=tile_size)
+    return LayoutTVCoverage(
+        counts=counts,
+        unreached=np.flatnonzero(counts == 0),
+        out_of_tile=np.argwhere(~in_tile),
+        values_per_thread=np.count_nonzero(in_tile, axis=1),
     )
@@ -1,5 +1,14 @@
+import os
 import sys
+import functools
+import numpy as np
+import matplotlib.colors as mcolors
 import matplotlib.pyplot as plt
+from matplotlib.collections import PathCollection
+from matplotlib.font_manager import FontProperties
+from matplotlib.path import Path as MplPath
+from matplotlib.textpath import TextPath
+from matplotlib.transforms import Affine2D
 from pathlib import Path
 from typing import Self
 from itertools import chain
@@ -21,12 +30,27 @@ from pycute.int_tuple import (
     prefix_product,
 )
 from pycute.layout import (
+    size,
+    cosize,
     Layout,
     LayoutBase,
     filter,
     coalesce,
     is_tuple,
+    complement,
+    composition,
+    hier_unzip,
     make_layout,
+    left_inverse,
+    right_inverse,
+    tiled_divide,
+    zipped_divide,
+    logical_divide,
+    logical_product,
+)
+from pycute.swizzle import (
+    Swizzle,
+    ComposedLayout,
 )
 
 IntTuple = int | tuple["IntTuple", ...]
@@ -34,7 +58,11 @@ IntTuple = int | tuple["IntTuple", ...]
 
 __all__ = [
     "Layout",
+    "Swizzle",
+    "ComposedLayout",
     "MultiLayout",
+    "size",
+    "cosize",
     "slice_",
     "filter",
     "filter2",
@@ -46,12 +74,385 @@ __all__ = [
     "has_none",
     "coalesce",
     "is_tuple",
+    "complement",
+    "composition",
+    "hier_unzip",
     "make_layout",
+    "left_inverse",
+    "right_inverse",
+    "tiled_divide",
+    "zipped_divide",
+    "logical_divide",
+    "logical_product",
     "prefix_product",
+    "get_shape",
+    "swizzle_array",
+    "evaluate_layout",
+    "make_swizzled_layout",
+    "to_index_array",
+    "to_mode_index_arrays",
     "visualize_layout",
+    "ShapeIndexer",
+    "get_shape_indexer",
+    "is_injective",
+    "is_surjective",
+    "is_bijective",
+    "is_mode_contiguous",
+    "max_contiguous_width",
 ]
 
 
+def _rebuild(nesting: IntTuple, flat: list[int]) -> IntTuple:
+    # the leaves of `nesting` are positions within `flat`
+    if is_tuple(nesting):
+        return tuple(_rebuild(n, flat) for n in nesting)
+    return flat[nesting]
+
+
+class _ShapeNode(object):
+    # a (sub-)mode: the range of its leaves within the flattened shape, and the
+    # (colexicographic) divisors of its 1-D indices, relative to the mode itself
+    __slots__ = ("start", "end", "divisors", "children", "nesting")
+
+    def __init__(self, shape: IntTuple, start: int) -> None:
+        flat_shape = flatten(shape)
+        self.start = start
+        self.end = start + len(flat_shape)
+        self.divisors = flatten(prefix_product(shape))
+        self.children = None
+        # the nesting of the shape, with the (flat) position of each leaf
+        self.nesting = start
+        if is_tuple(shape):
+            self.children = []
+            for s in shape:
+                self.children.append(_ShapeNode(s, start=start))
+                start += len(flatten(s))
+            self.nesting = tuple(child.nesting for child in self.children)
+
+
+class ShapeIndexer(object):
+    """
+    `idx2crd` and `crd2idx` for a fixed (nested) shape and stride, with identical semantics.
+
+    The shape is flattened, and its prefix products and mode boundaries are computed, once;
+    coordinates are rebuilt following the (precomputed) nesting of the shape. Besides
+    scalars, the `*_array` methods convert arrays of (flat) coordinates. Use `get_shape_indexer`
+    to reuse indexers across calls.
+    """
+
+    def __init__(self, shape: IntTuple, stride: IntTuple | None = None) -> None:
+        if stride is None:
+            stride = prefix_product(shape)
+        self.shape = shape
+        self.stride = stride
+        self.flat_shape = flatten(shape)
+        self.flat_stride = flatten(stride)
+        if len(self.flat_shape) != len(self.flat_stride):
+            raise ValueError(f"Shape {shape} and stride {stride} are not congruent")
+        self._root = _ShapeNode(shape, start=0)
+        self._pairs = list(zip(self.flat_shape, self.flat_stride))
+        self._flat_shape_array = np.array(self.flat_shape, dtype=np.int64)
+        self._flat_stride_array = np.array(self.flat_stride, dtype=np.int64)
+        self._divisor_array = np.array(self._root.divisors, dtype=np.int64)
+
+    def unflatten(self, flat: list[int]) -> IntTuple:
+        """Nests flat coordinates as the shape, e.g., `((flat[0], flat[1]), flat[2])`."""
+        return _rebuild(self._root.nesting, flat)
+
+    def idx2crd(self, idx: int) -> IntTuple:
+        if is_tuple(idx):
+            return idx2crd(idx, self.shape, self.stride)
+        return self.unflatten([(idx // d) % s for s, d in self._pairs])
+
+    def crd2idx(self, crd: IntTuple | None) -> int:
+        return self._crd2idx(crd, self._root)
+
+    def _crd2idx(self, crd: IntTuple | None, node: _ShapeNode) -> int:
+        if is_tuple(crd):
+            if node.children is None or len(crd) != len(node.children):
+                raise ValueError(f"Coordinate {crd} is not congruent with shape {self.shape}")
+            return sum(self._crd2idx(c, child) for c, child in zip(crd, node.children))
+        if crd is None:
+            crd = 0
+        # 1-D index within the mode, where (as in `crd2idx`) the last leaf is not wrapped around
+        flat_stride = self.flat_stride
+        flat_shape = self.flat_shape
+        result = 0
+        last = node.end - 1
+        for leaf, divisor in zip(range(node.start, last), node.divisors):
+            result += (crd // divisor) % flat_shape[leaf] * flat_stride[leaf]
+        return result + crd // node.divisors[-1] * flat_stride[last]
+
+    def idx2crd_array(self, idx: np.ndarray) -> np.ndarray:
+        """Converts indices to flat coordinates, along a new last axis of `len(flat_shape)`."""
+        idx = np.asarray(idx, dtype=np.int64)
+        return (idx[..., None] // self._flat_stride_array) % self._flat_shape_array
+
+    def crd2idx_array(self, flat_crd: np.ndarray) -> np.ndarray:
+        """Converts flat coordinates (along the last axis) to indices."""
+        flat_crd = np.asarray(flat_crd, dtype=np.int64)
+        return flat_crd @ self._flat_stride_array
+
+    def evaluate_array(self, idx: np.ndarray) -> np.ndarray:
+        """Maps 1-D indices through the layout as `crd2idx`, i.e., without wrapping the last leaf around."""
+        idx = np.asarray(idx, dtype=np.int64)
+        flat_crd = idx[..., None] // self._divisor_array
+        flat_crd[..., :-1] %= self._flat_shape_array[:-1]
+        return flat_crd @ self._flat_stride_array
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_shape_indexer(shape: IntTuple, stride: IntTuple | None) -> ShapeIndexer:
+    return ShapeIndexer(shape, stride)
+
+
+def get_shape_indexer(shape: IntTuple, stride: IntTuple | None = None) -> ShapeIndexer:
+    """Returns the (memoized) `ShapeIndexer` of `shape` and `stride`."""
+    try:
+        return _get_shape_indexer(shape, stride)
+    except TypeError:
+        # unhashable, e.g., lists
+        return ShapeIndexer(shape, stride)
+
+
+def get_shape(layout: LayoutBase) -> IntTuple:
+    """The shape of (the domain of) `layout`, i.e., of its innermost layout when composed."""
+    while isinstance(layout, ComposedLayout):
+        layout = layout.layoutA
+    return layout.shape
+
+
+def swizzle_array(swizzle: Swizzle, offsets: np.ndarray) -> np.ndarray:
+    """Applies `swizzle` to every offset, i.e., XORs the `yyy` bits shifted onto the `zzz` bits."""
+    offsets = np.asarray(offsets, dtype=np.int64)
+    yyy = offsets & swizzle.yyy_msk
+    if swizzle.shift >= 0:
+        return offsets ^ (yyy >> swizzle.shift)
+    return offsets ^ (yyy << -swizzle.shift)
+
+
+def evaluate_layout(layout: LayoutBase | Swizzle, indices: np.ndarray) -> np.ndarray:
+    """Evaluates `layout` (plain, swizzle or composed) at every 1-D index of `indices`."""
+    if isinstance(layout, ComposedLayout):
+        return evaluate_layout(layout.layoutB, evaluate_layout(layout.layoutA, indices) + layout.offset)
+    if isinstance(layout, Swizzle):
+        return swizzle_array(layout, indices)
+    if not isinstance(layout, Layout):
+        raise TypeError(f"Unsupported layout {layout!r}")
+    # as in CuTe, indices beyond `size(layout)` run along its last mode
+    return get_shape_indexer(layout.shape, layout.stride).evaluate_array(indices)
+
+
+def make_swizzled_layout(
+    swizzle: Swizzle | tuple[int, int, int],
+    layout: Layout,
+    offset: int = 0,
+) -> ComposedLayout:
+    """Returns `swizzle o offset o layout`, e.g., `make_swizzled_layout((3, 3, 3), layout)` for `Swizzle<3, 3, 3>`."""
+    if not isinstance(swizzle, Swizzle):
+        swizzle = Swizzle(*swizzle)
+    return ComposedLayout(swizzle, offset, layout)
+
+
+def _mode_index_table(shape: IntTuple, stride: IntTuple) -> tuple[np.ndarray, np.ndarray]:
+    # per-mode stride tables: the (colexicographic) flat coordinates
+    # of every 1-D index of the mode, and the offsets they map to
+    flat_shape = np.array(flatten(shape), dtype=np.int64)
+    flat_stride = np.array(flatten(stride), dtype=np.int64)
+    divisors = np.ones_like(flat_shape)
+    divisors[1:] = np.cumprod(flat_shape[:-1])
+    indices = np.arange(product(shape), dtype=np.int64)
+    coordinates = (indices[:, None] // divisors[None, :]) % flat_shape[None, :]
+    return coordinates @ flat_stride, coordinates
+
+
+def to_mode_index_arrays(layout: Layout) -> tuple[list[np.ndarray], list[np.ndarray]]:
+    """
+    Returns, for each top-level mode, the offsets of its 1-D indices, and their flat coordinates
+    (of shape `(size(mode), len(flatten(mode)))`). The layout maps each tuple of 1-D indices to
+    the sum of their offsets, e.g., `layout(m, n) == offsets[0][m] + offsets[1][n]`.
+    """
+    if isinstance(layout, ComposedLayout):
+        raise TypeError(f"The offsets of composed layouts are not separable per mode, got {layout}")
+    if is_tuple(layout.shape):
+        modes = list(zip(layout.shape, layout.stride))
+    else:
+        modes = [(layout.shape, layout.stride)]
+
+    offset_arrays = []
+    coordinate_arrays = []
+    for mode_shape, mode_stride in modes:
+        offsets, coordinates = _mode_index_table(mode_shape, mode_stride)
+        offset_arrays.append(offsets)
+        coordinate_arrays.append(coordinates)
+    return offset_arrays, coordinate_arrays
+
+
+def to_index_array(
+    layout: LayoutBase,
+    with_coordinates: bool = False,
+) -> np.ndarray | tuple[np.ndarray, list[np.ndarray]]:
+    """
+    Evaluates `layout` over its whole domain at once.
+
+    Each top-level mode is indexed by its 1-D (colexicographic) index, hence the output has one
+    axis per mode, i.e., `to_index_array(layout)[m, n] == layout(m, n)` for a rank-2 layout, and
+    a single axis for integral shapes.
+
+    Args:
+        layout: The layout to evaluate
+        with_coordinates: If True, also returns, for each top-level mode, the flat coordinates
+            of its 1-D indices, as an array of shape `(size(mode), len(flatten(mode)))`
+
+    Returns:
+        The int64 array of indices, and (optionally) the per-mode coordinate arrays
+    """
+    if isinstance(layout, ComposedLayout):
+        # evaluates the inner layout per mode, then the (elementwise) outer one
+        index_array, coordinate_arrays = to_index_array(layout.layoutA, with_coordinates=True)
+        index_array = evaluate_layout(layout.layoutB, index_array + layout.offset)
+        if with_coordinates:
+            return index_array, coordinate_arrays
+        return index_array
+
+    offset_arrays, coordinate_arrays = to_mode_index_arrays(layout)
+    index_array = np.zeros((), dtype=np.int64)
+    for offsets in offset_arrays:
+        # broadcasts the offsets of this mode along a new (last) axis
+        index_array = index_array[..., None] + offsets
+
+    if with_coordinates:
+        return index_array, coordinate_arrays
+    return index_array
+
+
+def _to_flat_index_array(layout: LayoutBase) -> np.ndarray:
+    # all indices, in colexicographic order of the coordinates
+    return to_index_array(layout).reshape(-1, order="F")
+
+
+def _get_modes(layout: Layout) -> list[tuple[int, int]]:
+    # the (shape, stride) of each non-trivial mode of the coalesced layout
+    layout = coalesce(layout)
+    return [
+        (shape, stride)
+        for shape, stride in zip(flatten(layout.shape), flatten(layout.stride))
+        if shape != 1
+    ]
+
+
+def _get_sorted_modes(layout: Layout) -> list[tuple[int, int]]:
+    return sorted(_get_modes(layout), key=lambda mode: abs(mode[1]))
+
+
+def is_injective(layout: LayoutBase) -> bool:
+    """
+    Whether no two coordinates of `layout` map to the same index.
+
+    Decided from the coalesced modes, sorted by stride: when every stride exceeds the span of
+    the modes below it, indices are unique (as digits of a mixed-radix number). Only otherwise
+    (e.g., `(2, 2):(3, 2)`) is the layout enumerated.
+    """
+    if isinstance(layout, ComposedLayout):
+        # swizzles are bijections
+        if isinstance(layout.layoutB, Swizzle):
+            return is_injective(layout.layoutA)
+        indices = _to_flat_index_array(layout)
+        return np.unique(indices).size == indices.size
+
+    span = 0
+    for shape, stride in _get_sorted_modes(layout):
+        if stride == 0:
+            return False
+        if abs(stride) <= span:
+            break
+        span += abs(stride) * (shape - 1)
+    else:
+        return True
+
+    indices = _to_flat_index_array(layout)
+    return np.unique(indices).size == indices.size
+
+
+def is_surjective(layout: LayoutBase, tile_size: int | None = None) -> bool:
+    """
+    Whether `layout` maps onto every index of `[0, tile_size)`, `size(layout)` by default.
+
+    Decided from the coalesced modes, sorted by stride, when strides are non-negative: as long
+    as each stride is at most one past the largest index of the modes below it, their indices
+    form a contiguous range starting at 0; the first stride beyond it skips the next index for
+    good. Only layouts with negative strides, and composed layouts, are enumerated.
+    """
+    if tile_size is None:
+        tile_size = size(layout)
+    if tile_size <= 0:
+        return True
+    if isinstance(layout, ComposedLayout):
+        return _is_surjective_by_enumeration(layout, tile_size)
+    modes = [(shape, stride) for shape, stride in _get_sorted_modes(layout) if stride != 0]
+    if product(tuple(shape for shape, _ in modes)) < tile_size:
+        # fewer distinct indices than the tile
+        return False
+
+    if all(stride > 0 for _, stride in modes):
+        largest = 0
+        for shape, stride in modes:
+            if stride > largest + 1:
+                break
+            largest += stride * (shape - 1)
+        return largest + 1 >= tile_size
+
+    return _is_surjective_by_enumeration(layout, tile_size)
+
+
+def _is_surjective_by_enumeration(layout: LayoutBase, tile_size: int) -> bool:
+    indices = _to_flat_index_array(layout)
+    indices = indices[(indices >= 0) & (indices < tile_size)]
+    return np.unique(indices).size == tile_size
+
+
+def is_bijective(layout: LayoutBase, tile_size: int | None = None) -> bool:
+    """Whether `layout` maps one-to-one onto `[0, tile_size)`, `size(layout)` by default."""
+    if tile_size is None:
+        tile_size = size(layout)
+    return size(layout) == tile_size and is_injective(layout) and is_surjective(layout, tile_size)
+
+
+def is_mode_contiguous(layout: LayoutBase) -> tuple[bool, ...]:
+    """
+    Whether each top-level mode of `layout` maps its 1-D indices to consecutive indices,
+    i.e., whether it coalesces into (at most) a single mode of stride 1.
+    """
+    if not is_tuple(get_shape(layout)):
+        modes = [layout]
+    else:
+        modes = [layout[i] for i in range(len(get_shape(layout)))]
+    contiguity = []
+    for mode in modes:
+        if isinstance(mode, ComposedLayout):
+            contiguity.append(bool(np.all(np.diff(_to_flat_index_array(mode)) == 1)))
+            continue
+        flat_modes = _get_modes(mode)
+        contiguity.append(len(flat_modes) == 0 or (len(flat_modes) == 1 and flat_modes[0][1] == 1))
+    return tuple(contiguity)
+
+
+def max_contiguous_width(layout: LayoutBase) -> int:
+    """
+    The number of leading (colexicographic) coordinates of `layout` that map to consecutive
+    indices, i.e., the widest vector that accesses through `layout` can use.
+    """
+    if isinstance(layout, ComposedLayout):
+        steps = np.diff(_to_flat_index_array(layout)) != 1
+        return int(np.argmax(steps)) + 1 if np.any(steps) else max(1, size(layout))
+
+    modes = _get_modes(layout)
+    if len(modes) == 0:
+        return 1
+    shape, stride = modes[0]
+    return shape if stride == 1 else 1
+
+
 def default_color_map(index: int) -> tuple[float, float, float]:
     # https://github.com/NVIDIA/cutlass/blob/main/include/cute/util/print_latex.hpp
     colors = plt.cm.tab20c.colors[:16]
@@ -62,44 +463,45 @@ def default_label_map(index: int) -> str:
     return str(index)
 
 
-def visualize_layout(
-    layout: Layout,
-    color_map: Callable[[int], object] | None = None,
-    label_map: Callable[[int], str] | None = None,
-    **kwargs,
-) -> tuple[plt.Figure, plt.Axes]:
-    # https://github.com/NVIDIA/cutlass/blob/main/include/cute/util/print_latex.hpp
+# layouts with at least this many cells are drawn as a single image by default
+FAST_RENDERING_MIN_CELLS = 1024
+# labels that would be drawn smaller than this (in points) are dropped
+MIN_LABEL_FONTSIZE = 4.0
 
-    if color_map is None:
-        color_map = default_color_map
-    if label_map is None:
-        label_map = default_label_map
 
-    if isinstance(layout.shape, int):
-        M = layout.shape
-        N = 1
-    elif len(layout.shape) == 1:
-        M = product(layout.shape[0])
-        N = 1
-    elif len(layout.shape) == 2:
-        M = product(layout.shape[0])
-        N = product(layout.shape[1])
-    else:
-        raise NotImplementedError
+def _get_cell_points(fig: plt.Figure, ax: plt.Axes, M: int, N: int) -> float:
+    # the side of a cell in points, given the axes limits set by `visualize_layout`
+    bbox = ax.get_position()
+    width, height = fig.get_size_inches()
+    return min(
+        bbox.width * width * 72 / (N + 1.6),
+        bbox.height * height * 72 / (M + 1.6),
+    )
 
-    # Create figure and axis
-    fig, ax = plt.subplots(**kwargs)
 
+def _get_label_fontsize(cell_points: float, labels: list[str], fontsize: float) -> float:
+    # shrinks the font until the longest label fits within a cell
+    lines = [line for label in labels for line in label.split("\n")]
+    max_chars = max([len(line) for line in lines], default=1)
+    max_lines = max([label.count("\n") + 1 for label in labels], default=1)
+    return min(
+        fontsize,
+        cell_points * 0.9 / (max(max_chars, 1) * 0.65),
+        cell_points * 0.8 / (max_lines * 1.25),
+    )
+
+
+def _draw_cells_exact(
+    ax: plt.Axes,
+    indices: list[list[int]],
+    M: int,
+    N: int,
+    color_map: Callable[[int], object],
+    label_map: Callable[[int], str],
+) -> None:
     for m in range(M):
         for n in range(N):
-            if isinstance(layout.shape, int):
-                index = layout(m)
-            elif len(layout.shape) == 1:
-                index = layout(m)
-            elif len(layout.shape) == 2:
-                index = layout(m, n)
-            else:
-                raise NotImplementedError
+            index = indices[m][n]
 
             # Get color and label for this index
             color = color_map(index)
@@ -128,36 +530,175 @@ def visualize_layout(
                 color="black",
             )
 
-    # Add row labels (m indices) - positioned to the left
-    for m in range(M):
-        ax.text(
-            -0.3,
-            M - m - 0.5,
-            str(m),
-            ha="center",
-            va="center",
-            fontsize=14,
-            fontweight="bold",
-        )
 
-    # Add column labels (n indices) - positioned at the top
-    for n in range(N):
-        ax.text(
-            n + 0.5,
-            M + 0.3,
-            str(n),
-            ha="center",
-            va="center",
-            fontsize=14,
-            fontweight="bold",
-        )
+def _draw_cells_fast(
+    fig: plt.Figure,
+    ax: plt.Axes,
+    indices: list[list[int]],
+    M: int,
+    N: int,
+    color_map: Callable[[int], object],
+    label_map: Callable[[int], str],
+) -> None:
+    # the callbacks are evaluated once per distinct index, the cells are drawn
+    # as one image, the grid as one collection per direction, and the labels
+    # as one collection, only when readable (level-of-detail)
+    index_array = np.array(indices, dtype=np.int64).reshape(M, N)
+    unique_indices, inverse = np.unique(index_array, return_inverse=True)
+    colors = np.array([mcolors.to_rgba(color_map(int(index))) for index in unique_indices.tolist()])
+    image = colors[inverse.reshape(M, N)]
+    ax.imshow(image, extent=(0, N, 0, M), origin="upper", interpolation="nearest")
+
+    cell_points = _get_cell_points(fig, ax, M=M, N=N)
+    linewidth = min(2.0, cell_points * 0.05)
+    if linewidth > 0.1:
+        ax.vlines(np.arange(N + 1), 0, M, colors="black", linewidth=linewidth)
+        ax.hlines(np.arange(M + 1), 0, N, colors="black", linewidth=linewidth)
+
+    # an upper bound of the font size, before computing any label
+    if _get_label_fontsize(cell_points, labels=["0"], fontsize=12) < MIN_LABEL_FONTSIZE:
+        return
+    labels = [label_map(int(index)) for index in unique_indices.tolist()]
+    fontsize = _get_label_fontsize(cell_points, labels=labels, fontsize=12)
+    if fontsize < MIN_LABEL_FONTSIZE:
+        return
+    # one (centered) path per distinct label, all the cells drawn as a single collection
+    label_paths = [_get_label_path(label, fontsize=fontsize) for label in labels]
+    rows, columns = np.divmod(np.arange(M * N), N)
+    labels_collection = PathCollection(
+        [label_paths[i] for i in inverse.reshape(-1).tolist()],
+        offsets=np.stack([columns + 0.5, M - rows - 0.5], axis=1),
+        offset_transform=ax.transData,
+        transform=Affine2D().scale(1 / 72) + fig.dpi_scale_trans,
+        facecolors="black",
+        edgecolors="none",
+    )
+    ax.add_collection(labels_collection, autolim=False)
+
+
+def _get_label_path(label: str, fontsize: float) -> MplPath:
+    # the outline (in points) of `label` centered at the origin, one line below the other
+    font = FontProperties(weight="bold", size=fontsize)
+    lines = label.split("\n")
+    line_paths = []
+    for i, line in enumerate(lines):
+        path = TextPath((0, 0), line, prop=font)
+        # the extents of the control points, much cheaper than `get_extents` and close enough
+        center_x = (path.vertices[:, 0].min() + path.vertices[:, 0].max()) / 2 if len(path.vertices) > 0 else 0.
+        center_y = ((len(lines) - 1) / 2 - i) * fontsize * 1.25
+        line_paths.append(path.transformed(Affine2D().translate(-center_x, center_y - fontsize * 0.35)))
+    return MplPath.make_compound_path(*line_paths)
+
+
+def visualize_layout(
+    layout: LayoutBase,
+    color_map: Callable[[int], object] | None = None,
+    label_map: Callable[[int], str] | None = None,
+    fast: bool | None = None,
+    ax: plt.Axes | None = None,
+    format: str | None = None,
+    path: str | os.PathLike | None = None,
+    **kwargs,
+) -> tuple[plt.Figure, plt.Axes] | Path:
+    """
+    Draws `layout` as a grid of cells colored and labeled by their indices.
+
+    With `format="svg"` (or `"html"`), the layout is instead streamed into an SVG file (or a
+    pan/zoom-able page of SVG tiles in the directory) at `path`, without creating a figure
+    nor holding the index array, see `hilt.svg_utils`. This returns the written path.
+
+    Args:
+        layout: A layout of rank at most 2, possibly swizzled (i.e., a `ComposedLayout`)
+        color_map: Maps indices to (matplotlib) colors
+        label_map: Maps indices to labels
+        fast: If True, draws the cells as a single image and labels them only when readable,
+            rather than one patch and one text per cell. Defaults to True for layouts with
+            at least `FAST_RENDERING_MIN_CELLS` cells
+        ax: If given, draws into this (empty) axes, e.g., of a reused figure, rather than a new one
+        format: "svg" or "html" to stream to `path` rather than drawing a figure
+        path: The SVG file (or directory, for HTML) to write
+        **kwargs: Forwarded to `plt.subplots`, or to `write_layout_svg` (`write_layout_html`)
+    """
+    if format is not None:
+        # imported here, since `svg_utils` builds upon this module
+        from .svg_utils import write_layout_svg, write_layout_html
+        if format not in ("svg", "html"):
+            raise ValueError(f"Unsupported format {format!r}, expected 'svg' or 'html'")
+        if path is None:
+            raise ValueError(f"`path` is required for format {format!r}")
+        write = write_layout_svg if format == "svg" else write_layout_html
+        return write(layout, path, color_map=color_map, label_map=label_map, **kwargs)
+    # https://github.com/NVIDIA/cutlass/blob/main/include/cute/util/print_latex.hpp
+
+    if color_map is None:
+        color_map = default_color_map
+    if label_map is None:
+        label_map = default_label_map
+
+    shape = get_shape(layout)
+    if isinstance(shape, int):
+        M = shape
+        N = 1
+    elif len(shape) == 1:
+        M = product(shape[0])
+        N = 1
+    elif len(shape) == 2:
+        M = product(shape[0])
+        N = product(shape[1])
+    else:
+        raise NotImplementedError
+
+    if fast is None:
+        fast = M * N >= FAST_RENDERING_MIN_CELLS
+
+    # evaluates the whole layout at once, as nested lists of Python integers
+    indices = to_index_array(layout).reshape(M, N).tolist()
+
+    # Create figure and axis
+    if ax is None:
+        fig, ax = plt.subplots(**kwargs)
+    else:
+        fig = ax.figure
+
+    if not fast:
+        _draw_cells_exact(ax, indices, M=M, N=N, color_map=color_map, label_map=label_map)
+        axis_fontsize = 14
+    else:
+        _draw_cells_fast(fig, ax, indices, M=M, N=N, color_map=color_map, label_map=label_map)
+        axis_fontsize = min(14, _get_cell_points(fig, ax, M=M, N=N) * 0.6)
+
+    # row and column labels are dropped along with unreadable cell labels
+    if axis_fontsize >= MIN_LABEL_FONTSIZE:
+        # Add row labels (m indices) - positioned to the left
+        for m in range(M):
+            ax.text(
+                -0.3,
+                M - m - 0.5,
+                str(m),
+                ha="center",
+                va="center",
+                fontsize=axis_fontsize,
+                fontweight="bold",
+            )
+
+        # Add column labels (n indices) - positioned at the top
+        for n in range(N):
+            ax.text(
+                n + 0.5,
+                M + 0.3,
+                str(n),
+                ha="center",
+                va="center",
+                fontsize=axis_fontsize,
+                fontweight="bold",
+            )
 
     ax.set_xlim(-0.8, N + 0.8)
     ax.set_ylim(-0.8, M + 0.8)
     ax.set_aspect("equal")
     ax.axis("off")
 
-    plt.tight_layout()
+    fig.tight_layout()
     return fig, ax
 
 
@@ -0,0 +1,137 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from typing import NamedTuple
+from .pycute_utils import (
+    LayoutBase,
+    get_shape,
+    to_index_array,
+)
+from .layout_tv import TilerMN, visualize_layout_tv_maybe_duplicates
+
+__all__ = [
+    "IN_REGISTER",
+    "SHUFFLE",
+    "SHARED_MEMORY",
+    "ConversionReport",
+    "analyze_conversion",
+    "visualize_conversion",
+]
+
+# how an element reaches the (thread, value) of the destination, from cheapest to costliest
+IN_REGISTER = 0
+SHUFFLE = 1
+SHARED_MEMORY = 2
+MOVEMENT_NAMES = ("in-register", "shuffle", "shared memory")
+MOVEMENT_COLORS = ((1.0, 1.0, 1.0, 1.0), (1.0, 0.8, 0.3, 1.0), (0.9, 0.3, 0.3, 1.0))
+
+
+class ConversionReport(NamedTuple):
+    """
+    How the elements move when converting fragments from one TV layout to another.
+
+    Attributes:
+        movements: The movement (`IN_REGISTER`, `SHUFFLE` or `SHARED_MEMORY`) of each
+            `(thread, value)` of the destination
+        cell_movements: The costliest movement into each index of the tile, -1 when
+            the destination does not hold it
+    """
+    movements: np.ndarray
+    cell_movements: np.ndarray
+
+    @property
+    def counts_per_thread(self) -> np.ndarray:
+        """The number of values of each destination thread, per movement."""
+        return np.stack([np.count_nonzero(self.movements == movement, axis=1) for movement in range(3)], axis=1)
+
+    @property
+    def counts(self) -> np.ndarray:
+        return np.bincount(self.movements.reshape(-1), minlength=3)
+
+    @property
+    def needs_shuffles(self) -> bool:
+        return bool(np.any(self.movements == SHUFFLE))
+
+    @property
+    def needs_shared_memory(self) -> bool:
+        return bool(np.any(self.movements == SHARED_MEMORY))
+
+    def format(self) -> str:
+        total = max(int(self.movements.size), 1)
+        lines = [
+            f"{name}: {count} values ({count / total * 100:.1f}%)"
+            for name, count in zip(MOVEMENT_NAMES, self.counts)
+        ]
+        counts_per_thread = self.counts_per_thread
+        for movement in (SHUFFLE, SHARED_MEMORY):
+            if counts_per_thread.size > 0 and counts_per_thread[:, movement].max() > 0:
+                lines.append(
+                    f"most {MOVEMENT_NAMES[movement]} values per thread: {counts_per_thread[:, movement].max()} "
+                    f"(thread {int(counts_per_thread[:, movement].argmax())})"
+                )
+        return "\n".join(lines)
+
+
+def analyze_conversion(
+    src_layout_tv: LayoutBase,
+    dst_layout_tv: LayoutBase,
+    warp_size: int = 32,
+) -> ConversionReport:
+    """
+    Classifies how each value of `dst_layout_tv` is obtained from the fragments of `src_layout_tv`,
+    both over the same tile: from a register of the same thread, by a shuffle within the warp, or
+    through shared memory across warps. Elements replicated in the source are taken from the
+    cheapest of their holders.
+    """
+    assert len(get_shape(src_layout_tv)) == 2
+    assert len(get_shape(dst_layout_tv)) == 2
+    src_indices = to_index_array(src_layout_tv)
+    dst_indices = to_index_array(dst_layout_tv)
+    num_threads = max(src_indices.shape[0], dst_indices.shape[0])
+    num_warps = -(-num_threads // warp_size)
+    src_threads = np.broadcast_to(np.arange(src_indices.shape[0])[:, None], src_indices.shape)
+    dst_threads = np.broadcast_to(np.arange(dst_indices.shape[0])[:, None], dst_indices.shape)
+
+    missing = ~np.isin(dst_indices, src_indices)
+    if np.any(missing):
+        raise ValueError(f"Indices {np.unique(dst_indices[missing])[:8].tolist()} are not held by the source")
+
+    # whether some source holder of each index is the same thread, or in the same warp
+    same_thread = np.isin(dst_indices * num_threads + dst_threads, src_indices * num_threads + src_threads)
+    same_warp = np.isin(
+        dst_indices * num_warps + dst_threads // warp_size,
+        src_indices * num_warps + src_threads // warp_size,
+    )
+    movements = np.full(dst_indices.shape, SHARED_MEMORY, dtype=np.int8)
+    movements[same_warp] = SHUFFLE
+    movements[same_thread] = IN_REGISTER
+
+    cell_movements = np.full(int(max(src_indices.max(initial=-1), dst_indices.max(initial=-1))) + 1, -1, dtype=np.int8)
+    np.maximum.at(cell_movements, dst_indices.reshape(-1), movements.reshape(-1))
+    return ConversionReport(movements=movements, cell_movements=cell_movements)
+
+
+def visualize_conversion(
+    tiler_mn: TilerMN,
+    src_layout_tv: LayoutBase,
+    dst_layout_tv: LayoutBase,
+    report: ConversionReport | None = None,
+    figsize: tuple[float, float] = (16., 8.),
+    **kwargs,
+) -> tuple[plt.Figure, np.ndarray]:
+    """
+    Draws the source (left) and destination (right) TV layouts side by side, with the cells
+    colored by their costliest movement: white in-register, orange shuffled, red through smem.
+    """
+    if report is None:
+        report = analyze_conversion(src_layout_tv, dst_layout_tv)
+
+    def color_map(index: int) -> tuple[float, float, float, float]:
+        if index >= report.cell_movements.size or report.cell_movements[index] < 0:
+            return 1.0, 1.0, 1.0, 0.0
+        return MOVEMENT_COLORS[report.cell_movements[index]]
+
+    fig, axes = plt.subplots(1, 2, figsize=figsize)
+    for ax, layout_tv, title in ((axes[0], src_layout_tv, "source"), (axes[1], dst_layout_tv, "destination")):
+        visualize_layout_tv_maybe_duplicates(tiler_mn, layout_tv, color_map=color_map, ax=ax, **kwargs)
+        ax.set_title(title)
+    return fig, axes
@@ -0,0 +1,195 @@
+import io
+import os
+import math
+import multiprocessing
+import concurrent.futures
+import numpy as np
+import matplotlib.image
+from pathlib import Path
+from typing import Any, Sequence
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from .pycute_utils import Layout, visualize_layout
+from .layout_tv import (
+    TilerMN,
+    visualize_layout_tv,
+    visualize_layout_tv_maybe_duplicates,
+)
+
+__all__ = [
+    "render_layouts",
+]
+
+# figures reused across the items rendered by a process, keyed by size
+_figure_templates: dict[tuple[float, float], Figure] = {}
+
+
+def _get_figure(figsize: tuple[float, float]) -> Figure:
+    # figures are created without `pyplot`, hence are headless (Agg)
+    # and not tracked by (nor leaked into) the global figure manager
+    fig = _figure_templates.get(figsize)
+    if fig is None:
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        _figure_templates[figsize] = fig
+    fig.clear()
+    return fig
+
+
+def _render_one(
+    layout: Layout,
+    tiler_mn: TilerMN | None,
+    maybe_duplicates: bool,
+    figsize: tuple[float, float],
+    format: str,
+    dpi: int,
+    kwargs: dict[str, Any],
+) -> bytes:
+    fig = _get_figure(figsize)
+    ax = fig.add_subplot()
+    if tiler_mn is None:
+        visualize_layout(layout, ax=ax, **kwargs)
+    elif not maybe_duplicates:
+        visualize_layout_tv(tiler_mn, layout, ax=ax, **kwargs)
+    else:
+        visualize_layout_tv_maybe_duplicates(tiler_mn, layout, ax=ax, **kwargs)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=format, dpi=dpi)
+    return buffer.getvalue()
+
+
+def _render_chunk(
+    chunk: list[tuple[int, Layout, TilerMN | None, str | None]],
+    maybe_duplicates: bool,
+    figsize: tuple[float, float],
+    format: str,
+    dpi: int,
+    kwargs: dict[str, Any],
+) -> list[tuple[int, bytes | None]]:
+    # runs in a worker process, writing the images to `path` when given
+    # and returning them otherwise (e.g., for contact sheets)
+    outputs = []
+    for index, layout, tiler_mn, path in chunk:
+        data = _render_one(
+            layout=layout,
+            tiler_mn=tiler_mn,
+            maybe_duplicates=maybe_duplicates,
+            figsize=figsize,
+            format=format,
+            dpi=dpi,
+            kwargs=kwargs,
+        )
+        if path is not None:
+            Path(path).write_bytes(data)
+            data = None
+        outputs.append((index, data))
+    return outputs
+
+
+def _make_contact_sheet(images: list[np.ndarray], columns: int) -> np.ndarray:
+    # pads every image (with white) to the largest one, row-major
+    height = max(image.shape[0] for image in images)
+    width = max(image.shape[1] for image in images)
+    rows = math.ceil(len(images) / columns)
+    sheet = np.ones((rows * height, columns * width, 4), dtype=np.float32)
+    for index, image in enumerate(images):
+        row, column = divmod(index, columns)
+        sheet[row * height: row * height + image.shape[0], column * width: column * width + image.shape[1]] = image
+    return sheet
+
+
+def render_layouts(
+    layouts: Sequence[Layout],
+    output_dir: str | os.PathLike | None = None,
+    contact_sheet: str | os.PathLike | None = None,
+    tilers_mn: Sequence[TilerMN] | None = None,
+    maybe_duplicates: bool = False,
+    format: str = "png",
+    figsize: tuple[float, float] = (8., 8.),
+    dpi: int = 100,
+    columns: int | None = None,
+    workers: int | None = None,
+    chunksize: int = 8,
+    **kwargs,
+) -> list[Path]:
+    """
+    Renders many layouts (or TV layouts) headlessly, across worker processes.
+
+    Each worker draws with the Agg backend into a figure reused across its items, hence
+    `color_map` and `label_map` (if any) must be picklable, e.g., module-level functions.
+
+    Args:
+        layouts: The layouts to render, or the TV layouts when `tilers_mn` is given
+        output_dir: Writes one `layout_{index}.{format}` file per layout into this directory
+        contact_sheet: Writes a single (PNG) image with all layouts arranged in a grid
+        tilers_mn: The tiler of each TV layout, see `visualize_layout_tv`
+        maybe_duplicates: Uses `visualize_layout_tv_maybe_duplicates` for TV layouts
+        format: The file format (e.g., "png" or "svg"), PNG only for contact sheets
+        figsize: The size of each figure (in inches)
+        dpi: The resolution of each figure
+        columns: The number of columns of the contact sheet, defaults to a square grid
+        workers: The number of worker processes, defaults to `os.cpu_count()`; with 1,
+            layouts are rendered in this process
+        chunksize: The number of layouts per task
+        **kwargs: Forwarded to `visualize_layout` (or `visualize_layout_tv`), e.g., `color_map`
+
+    Returns:
+        The paths of the written files
+    """
+    if (output_dir is None) == (contact_sheet is None):
+        raise ValueError("Exactly one of `output_dir` and `contact_sheet` must be given")
+    if tilers_mn is not None and len(tilers_mn) != len(layouts):
+        raise ValueError(f"Got {len(layouts)} layouts but {len(tilers_mn)} tilers")
+    if contact_sheet is not None and format != "png":
+        raise ValueError(f"Contact sheets are rendered as PNG, got format {format!r}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"`workers` must be positive, got {workers}")
+
+    paths = []
+    items = []
+    for index, layout in enumerate(layouts):
+        path = None
+        if output_dir is not None:
+            path = Path(output_dir) / f"layout_{index:05d}.{format}"
+            paths.append(path)
+        tiler_mn = None if tilers_mn is None else tilers_mn[index]
+        items.append((index, layout, tiler_mn, path))
+    if output_dir is not None:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    chunks = [items[start: start + chunksize] for start in range(0, len(items), chunksize)]
+    options = {
+        "maybe_duplicates": maybe_duplicates,
+        "figsize": tuple(figsize),
+        "format": format,
+        "dpi": dpi,
+        "kwargs": kwargs,
+    }
+    outputs: list[bytes | None] = [None] * len(items)
+    if workers == 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            for index, data in _render_chunk(chunk, **options):
+                outputs[index] = data
+    else:
+        # spawned, since the parent may hold an (unforkable) MLIR context
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(workers, len(chunks)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            futures = [pool.submit(_render_chunk, chunk, **options) for chunk in chunks]
+            for future in concurrent.futures.as_completed(futures):
+                for index, data in future.result():
+                    outputs[index] = data
+
+    if contact_sheet is None:
+        return paths
+    if len(outputs) == 0:
+        raise ValueError("Contact sheets require at least one layout")
+
+    images = [matplotlib.image.imread(io.BytesIO(data), format="png") for data in outputs]
+    if columns is None:
+        columns = max(1, math.ceil(math.sqrt(len(images))))
+    matplotlib.image.imsave(contact_sheet, _make_contact_sheet(images, columns=columns))
+    return [Path(contact_sheet)]
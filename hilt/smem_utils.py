@@ -0,0 +1,178 @@
+import math
+import numpy as np
+import matplotlib.pyplot as plt
+from typing import NamedTuple
+from .pycute_utils import (
+    Layout,
+    LayoutBase,
+    to_index_array,
+    evaluate_layout,
+)
+from .layout_tv import TilerMN, visualize_layout_tv_maybe_duplicates
+
+__all__ = [
+    "BankConflictReport",
+    "get_element_bits",
+    "analyze_bank_conflicts",
+    "visualize_bank_conflicts",
+]
+
+
+class BankConflictReport(NamedTuple):
+    """
+    The shared memory wavefronts of every access of a TV layout.
+
+    Attributes:
+        vector_width: The number of (consecutive) values of each thread per access
+        threads_per_phase: The number of threads whose accesses are served together, e.g.,
+            a quarter of a warp for 128-bit accesses
+        degrees: The number of distinct words in the most loaded bank, i.e., the wavefronts,
+            of each `(warp, access, phase)`
+        ideal_degrees: The fewest wavefronts that the words of each `(warp, access, phase)` need
+        value_degrees: The degree of the phase of each `(thread, value)`
+        cell_degrees: The largest degree among the accesses of each index of the tile,
+            0 for indices that are never accessed
+    """
+    vector_width: int
+    threads_per_phase: int
+    degrees: np.ndarray
+    ideal_degrees: np.ndarray
+    value_degrees: np.ndarray
+    cell_degrees: np.ndarray
+
+    @property
+    def wavefronts(self) -> np.ndarray:
+        """The wavefronts of each `(warp, access)`, summed over its phases."""
+        return self.degrees.sum(axis=-1)
+
+    @property
+    def ideal_wavefronts(self) -> np.ndarray:
+        return self.ideal_degrees.sum(axis=-1)
+
+    @property
+    def conflict_degrees(self) -> np.ndarray:
+        """The worst degree of each access, over warps and phases (1 is conflict-free)."""
+        return self.degrees.max(axis=(0, 2))
+
+    @property
+    def worst_wavefronts(self) -> int:
+        return int(self.wavefronts.max(initial=0))
+
+    def format(self) -> str:
+        lines = []
+        wavefronts = self.wavefronts.max(axis=0)
+        ideal_wavefronts = self.ideal_wavefronts.max(axis=0)
+        for access, (degree, actual, ideal) in enumerate(zip(self.conflict_degrees, wavefronts, ideal_wavefronts)):
+            start = access * self.vector_width
+            lines.append(
+                f"access {access:4d} (values {start}-{start + self.vector_width - 1}): "
+                f"{degree}-way, {actual} wavefronts (ideal {ideal})"
+            )
+        lines.append(f"worst-case wavefronts per access: {self.worst_wavefronts}")
+        return "\n".join(lines)
+
+
+def get_element_bits(dtype: object) -> int:
+    """The size in bits of `dtype`, a CuTe numeric type (`width`), or a NumPy or PyTorch dtype (`itemsize`)."""
+    width = getattr(dtype, "width", None)
+    if isinstance(width, int):
+        return width
+    itemsize = getattr(dtype, "itemsize", None)
+    if isinstance(itemsize, int):
+        return itemsize * 8
+    return np.dtype(dtype).itemsize * 8
+
+
+def analyze_bank_conflicts(
+    layout_tv: LayoutBase,
+    smem_layout: LayoutBase,
+    dtype: object,
+    vector_width: int = 1,
+    num_banks: int = 32,
+    bank_bytes: int = 4,
+    warp_size: int = 32,
+) -> BankConflictReport:
+    """
+    Simulates the shared memory accesses of every warp through a TV layout.
+
+    The `k`-th access of each thread covers its values `[k * vector_width, (k + 1) * vector_width)`.
+    Accesses wider than a bank are served in phases of `num_banks * bank_bytes` bytes (e.g., half
+    warps for 64-bit accesses), each taking as many wavefronts as its most loaded bank has distinct
+    words, since threads reading the same word are served by a broadcast.
+
+    Args:
+        layout_tv: Maps (thread, value) to the index in the tile, as in `make_inverse_tv`
+        smem_layout: Maps the index in the tile to the element offset in shared memory,
+            e.g., a `ComposedLayout` of a `Swizzle`
+        dtype: The element type, e.g., `cutlass.Float16`, `torch.float16` or `"float16"`
+        vector_width: The number of values per access
+        num_banks: The number of shared memory banks
+        bank_bytes: The width of each bank
+        warp_size: The number of threads per warp
+    """
+    indices = to_index_array(layout_tv)
+    if indices.ndim != 2:
+        raise ValueError(f"Expected a (thread, value) layout, got {layout_tv}")
+    num_threads, num_values = indices.shape
+    if vector_width < 1 or num_values % vector_width != 0:
+        raise ValueError(f"{num_values} values per thread are not a multiple of the vector width {vector_width}")
+    num_accesses = num_values // vector_width
+
+    # the (first) words of every element, and the remaining ones of elements wider than a bank
+    element_bits = get_element_bits(dtype)
+    bank_bits = bank_bytes * 8
+    offsets = evaluate_layout(smem_layout, indices)
+    words = (offsets * element_bits // bank_bits)[..., None] + np.arange(max(1, element_bits // bank_bits))
+    words = words.reshape(num_threads, num_accesses, -1)
+
+    access_bytes = vector_width * element_bits / 8
+    threads_per_phase = int(min(warp_size, max(1, num_banks * bank_bytes // max(access_bytes, bank_bytes))))
+    num_warps = math.ceil(num_threads / warp_size)
+    num_phases = math.ceil(warp_size / threads_per_phase)
+    threads = np.arange(num_threads)
+    phases = (threads % warp_size) // threads_per_phase
+    groups = ((threads // warp_size)[:, None] * num_accesses + np.arange(num_accesses)) * num_phases + phases[:, None]
+    num_groups = num_warps * num_accesses * num_phases
+
+    # distinct words of each (warp, access, phase), counted per bank
+    min_word = int(words.min(initial=0))
+    span = int(words.max(initial=0)) - min_word + 1
+    keys = np.unique((groups[..., None] * span + (words - min_word)).reshape(-1))
+    unique_groups, unique_words = np.divmod(keys, span)
+    banks = (unique_words + min_word) % num_banks
+    counts = np.bincount(unique_groups * num_banks + banks, minlength=num_groups * num_banks)
+    counts = counts.reshape(num_warps, num_accesses, num_phases, num_banks)
+    degrees = counts.max(axis=-1)
+    ideal_degrees = -(-counts.sum(axis=-1) // num_banks)
+
+    value_degrees = degrees.reshape(-1)[groups]
+    value_degrees = np.repeat(value_degrees, vector_width, axis=1)
+    cell_degrees = np.zeros(int(indices.max(initial=-1)) + 1, dtype=np.int64)
+    np.maximum.at(cell_degrees, indices.reshape(-1), value_degrees.reshape(-1))
+    return BankConflictReport(
+        vector_width=vector_width,
+        threads_per_phase=threads_per_phase,
+        degrees=degrees,
+        ideal_degrees=ideal_degrees,
+        value_degrees=value_degrees,
+        cell_degrees=cell_degrees,
+    )
+
+
+def visualize_bank_conflicts(
+    tiler_mn: TilerMN,
+    layout_tv: LayoutBase,
+    report: BankConflictReport,
+    cmap: str = "Reds",
+    **kwargs,
+) -> tuple[plt.Figure, plt.Axes]:
+    """Draws `visualize_layout_tv_maybe_duplicates`, colored by `report.cell_degrees` (white when conflict-free)."""
+    colormap = plt.get_cmap(cmap)
+    max_degree = max(int(report.cell_degrees.max(initial=1)), 2)
+
+    def color_map(index: int) -> tuple[float, float, float, float]:
+        if index >= report.cell_degrees.size or report.cell_degrees[index] <= 1:
+            return 1.0, 1.0, 1.0, 1.0
+        return colormap((report.cell_degrees[index] - 1) / (max_degree - 1))
+
+    return visualize_layout_tv_maybe_duplicates(tiler_mn, layout_tv, color_map=color_map, **kwargs)
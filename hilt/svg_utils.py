@@ -0,0 +1,261 @@
+import os
+import html
+import math
+import functools
+import numpy as np
+import matplotlib.colors as mcolors
+from pathlib import Path
+from typing import Callable, Iterator
+from .pycute_utils import (
+    LayoutBase,
+    ComposedLayout,
+    is_tuple,
+    evaluate_layout,
+    default_color_map,
+    default_label_map,
+    to_mode_index_arrays,
+)
+
+__all__ = [
+    "iter_layout_svg",
+    "write_layout_svg",
+    "write_layout_html",
+]
+
+# callbacks are memoized per index, up to this many indices
+CALLBACK_CACHE_SIZE = 1 << 16
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+  html, body {{ margin: 0; height: 100%; overflow: hidden; background: #fff; font-family: sans-serif; }}
+  #viewport {{ width: 100%; height: 100%; overflow: hidden; cursor: grab; }}
+  #canvas {{ position: relative; transform-origin: 0 0; width: {width}px; height: {height}px; }}
+  #canvas img {{ position: absolute; display: block; }}
+  #info {{ position: fixed; top: 8px; right: 8px; background: rgba(255,255,255,0.8); padding: 4px 8px; }}
+</style>
+</head>
+<body>
+<div id="info">{title} &mdash; scroll to zoom, drag to pan</div>
+<div id="viewport"><div id="canvas">
+{tiles}
+</div></div>
+<script>
+  // tiles are <img loading="lazy">, hence only those near the view are fetched
+  const viewport = document.getElementById("viewport");
+  const canvas = document.getElementById("canvas");
+  let scale = 1, x = 0, y = 0, drag = null;
+  const update = () => {{ canvas.style.transform = `translate(${{x}}px, ${{y}}px) scale(${{scale}})`; }};
+  viewport.addEventListener("wheel", (event) => {{
+    event.preventDefault();
+    const factor = Math.exp(-event.deltaY * 0.001);
+    x = event.clientX - (event.clientX - x) * factor;
+    y = event.clientY - (event.clientY - y) * factor;
+    scale *= factor;
+    update();
+  }}, {{ passive: false }});
+  viewport.addEventListener("mousedown", (event) => {{ drag = [event.clientX - x, event.clientY - y]; }});
+  window.addEventListener("mouseup", () => {{ drag = null; }});
+  window.addEventListener("mousemove", (event) => {{
+    if (drag === null) return;
+    x = event.clientX - drag[0];
+    y = event.clientY - drag[1];
+    update();
+  }});
+</script>
+</body>
+</html>
+"""
+
+
+def _get_mode_offsets(layout: LayoutBase) -> tuple[np.ndarray, np.ndarray]:
+    # the offsets of the rows and columns, such that `layout(m, n) == rows[m] + columns[n]`,
+    # which takes O(M + N) memory rather than O(M * N) for the whole index array. For
+    # composed layouts, those of the innermost layout, see `_get_row_indices`
+    while isinstance(layout, ComposedLayout):
+        layout = layout.layoutA
+    if is_tuple(layout.shape) and len(layout.shape) > 2:
+        raise NotImplementedError
+    offset_arrays, _ = to_mode_index_arrays(layout)
+    if len(offset_arrays) == 1:
+        return offset_arrays[0], np.zeros(1, dtype=np.int64)
+    return offset_arrays[0], offset_arrays[1]
+
+
+def _get_row_indices(layout: LayoutBase, row_offset: int, column_offsets: np.ndarray) -> list[int]:
+    # the indices of (part of) a row, applying the outer layouts (e.g., swizzles)
+    # of composed layouts elementwise, as `to_index_array` does
+    if not isinstance(layout, ComposedLayout):
+        return (column_offsets + row_offset).tolist()
+    outer_layouts = []
+    while isinstance(layout, ComposedLayout):
+        outer_layouts.append((layout.layoutB, layout.offset))
+        layout = layout.layoutA
+    indices = column_offsets + row_offset
+    for outer_layout, offset in reversed(outer_layouts):
+        indices = evaluate_layout(outer_layout, indices + offset)
+    return indices.tolist()
+
+
+def _to_svg_fill(color: object) -> str:
+    red, green, blue, alpha = mcolors.to_rgba(color)
+    fill = f'fill="{mcolors.to_hex((red, green, blue))}"'
+    if alpha < 1.0:
+        fill += f' fill-opacity="{alpha:.3g}"'
+    return fill
+
+
+def _to_svg_text(label: str, x: float, y: float, fontsize: float) -> str:
+    lines = label.split("\n")
+    if len(lines) == 1 and lines[0] == "":
+        return ""
+    # centers the block of lines vertically around `y`
+    first_dy = -(len(lines) - 1) * 0.6
+    tspans = "".join(
+        f'<tspan x="{x:g}" dy="{first_dy if index == 0 else 1.2:g}em">{html.escape(line)}</tspan>'
+        for index, line in enumerate(lines)
+    )
+    return f'<text x="{x:g}" y="{y:g}" font-size="{fontsize:.3g}">{tspans}</text>'
+
+
+def iter_layout_svg(
+    layout: LayoutBase,
+    color_map: Callable[[int], object] | None = None,
+    label_map: Callable[[int], str] | None = None,
+    cell_size: float = 40.,
+    rows: tuple[int, int] | None = None,
+    columns: tuple[int, int] | None = None,
+    headers: bool = True,
+) -> Iterator[str]:
+    """
+    Yields an SVG document drawing `layout` like `visualize_layout`, one row of cells at a time.
+
+    Neither the figure nor the index array is held in memory, hence arbitrarily large layouts
+    can be streamed to files (see `write_layout_svg` and `write_layout_html`).
+
+    Args:
+        layout: A layout of rank at most 2, possibly swizzled (i.e., a `ComposedLayout`)
+        color_map: Maps indices to (matplotlib) colors, called once per distinct index (memoized)
+        label_map: Maps indices to labels, called once per distinct index (memoized)
+        cell_size: The side of each cell, in pixels
+        rows: The (half-open) range of rows to draw, defaults to all of them
+        columns: The (half-open) range of columns to draw, defaults to all of them
+        headers: If True, draws the row and column indices around the cells
+    """
+    if color_map is None:
+        color_map = default_color_map
+    if label_map is None:
+        label_map = default_label_map
+    color_map = functools.lru_cache(maxsize=CALLBACK_CACHE_SIZE)(color_map)
+    label_map = functools.lru_cache(maxsize=CALLBACK_CACHE_SIZE)(label_map)
+
+    row_offsets, column_offsets = _get_mode_offsets(layout)
+    row_start, row_end = rows if rows is not None else (0, len(row_offsets))
+    column_start, column_end = columns if columns is not None else (0, len(column_offsets))
+    margin = cell_size if headers else 0.
+    width = margin + (column_end - column_start) * cell_size + 1
+    height = margin + (row_end - row_start) * cell_size + 1
+    fontsize = cell_size * 0.25
+    linewidth = max(cell_size * 0.04, 0.5)
+
+    yield (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:g}" height="{height:g}" '
+        f'viewBox="0 0 {width:g} {height:g}">\n'
+        f'<g font-family="sans-serif" font-weight="bold" text-anchor="middle" dominant-baseline="central">\n'
+    )
+    if headers:
+        for n in range(column_start, column_end):
+            x = margin + (n - column_start + 0.5) * cell_size
+            yield _to_svg_text(str(n), x=x, y=margin * 0.5, fontsize=fontsize * 1.2) + "\n"
+
+    for m in range(row_start, row_end):
+        y = margin + (m - row_start) * cell_size
+        chunks = []
+        if headers:
+            chunks.append(_to_svg_text(str(m), x=margin * 0.5, y=y + cell_size * 0.5, fontsize=fontsize * 1.2))
+        indices = _get_row_indices(layout, int(row_offsets[m]), column_offsets[column_start:column_end])
+        for n, index in zip(range(column_start, column_end), indices):
+            x = margin + (n - column_start) * cell_size
+            chunks.append(
+                f'<rect x="{x:g}" y="{y:g}" width="{cell_size:g}" height="{cell_size:g}" '
+                f'{_to_svg_fill(color_map(index))} stroke="black" stroke-width="{linewidth:.3g}"/>'
+            )
+            chunks.append(_to_svg_text(label_map(index), x=x + cell_size * 0.5, y=y + cell_size * 0.5, fontsize=fontsize))
+        yield "".join(chunks) + "\n"
+
+    yield "</g>\n</svg>\n"
+
+
+def write_layout_svg(layout: LayoutBase, path: str | os.PathLike, **kwargs) -> Path:
+    """Streams `layout` into a single SVG file, see `iter_layout_svg` for the arguments."""
+    with open(path, "w") as f:
+        for chunk in iter_layout_svg(layout, **kwargs):
+            f.write(chunk)
+    return Path(path)
+
+
+def write_layout_html(
+    layout: LayoutBase,
+    directory: str | os.PathLike,
+    tile_size: int = 32,
+    cell_size: float = 40.,
+    **kwargs,
+) -> Path:
+    """
+    Streams `layout` into a pan/zoom-able HTML page backed by tiles of `tile_size` x `tile_size`
+    cells, each a separate SVG file that the browser only loads once it is (nearly) visible.
+
+    Args:
+        layout: A layout of rank at most 2
+        directory: Where `index.html` and the `tiles` are written
+        tile_size: The number of rows (and columns) of cells per tile
+        cell_size: The side of each cell, in pixels
+        **kwargs: Forwarded to `iter_layout_svg`, e.g., `color_map` and `label_map`
+
+    Returns:
+        The path of `index.html`
+    """
+    directory = Path(directory)
+    (directory / "tiles").mkdir(parents=True, exist_ok=True)
+    # headers would be repeated within every tile
+    kwargs.pop("headers", None)
+    if "color_map" in kwargs and kwargs["color_map"] is not None:
+        kwargs["color_map"] = functools.lru_cache(maxsize=CALLBACK_CACHE_SIZE)(kwargs["color_map"])
+    if "label_map" in kwargs and kwargs["label_map"] is not None:
+        kwargs["label_map"] = functools.lru_cache(maxsize=CALLBACK_CACHE_SIZE)(kwargs["label_map"])
+
+    row_offsets, column_offsets = _get_mode_offsets(layout)
+    M = len(row_offsets)
+    N = len(column_offsets)
+    tiles = []
+    for tile_row in range(math.ceil(M / tile_size)):
+        for tile_column in range(math.ceil(N / tile_size)):
+            rows = (tile_row * tile_size, min((tile_row + 1) * tile_size, M))
+            columns = (tile_column * tile_size, min((tile_column + 1) * tile_size, N))
+            name = f"tiles/{tile_row}_{tile_column}.svg"
+            write_layout_svg(
+                layout,
+                directory / name,
+                rows=rows,
+                columns=columns,
+                cell_size=cell_size,
+                headers=False,
+                **kwargs,
+            )
+            tiles.append(
+                f'<img loading="lazy" src="{name}" title="rows {rows[0]}-{rows[1] - 1}, columns {columns[0]}-{columns[1] - 1}" '
+                f'style="left: {columns[0] * cell_size:g}px; top: {rows[0] * cell_size:g}px; '
+                f'width: {(columns[1] - columns[0]) * cell_size + 1:g}px; height: {(rows[1] - rows[0]) * cell_size + 1:g}px">'
+            )
+
+    path = directory / "index.html"
+    path.write_text(HTML_TEMPLATE.format(
+        title=html.escape(f"{layout} ({M}x{N})"),
+        width=f"{N * cell_size + 1:g}",
+        height=f"{M * cell_size + 1:g}",
+        tiles="\n".join(tiles),
+    ))
+    return path
@@ -0,0 +1,52 @@
+import pytest
+
+pytest.importorskip("cutlass")
+pytest.importorskip("torch")
+
+from hilt.eager import api
+from hilt.eager.core import cache_clear
+
+
+def test_effectful_functions_are_not_cached() -> None:
+    for name in ("printf", "print_tensor"):
+        assert getattr(api, name).cute_apply_options["cache"] is False
+
+
+def test_identical_printf_calls_both_print(capfd: pytest.CaptureFixture) -> None:
+    cache_clear()
+    api.printf("hilt-printf-regression")
+    api.printf("hilt-printf-regression")
+    captured = capfd.readouterr()
+    assert captured.out.count("hilt-printf-regression") == 2
+
+
+def test_raw_outputs_are_copied_from_the_cache() -> None:
+    from hilt.eager.core import cute_apply
+
+    @cute_apply(raw=True)
+    def make_outputs(x: int) -> list:
+        return [x, {"y": x}]
+
+    cache_clear()
+    outputs = make_outputs(1)
+    outputs.append(2)
+    outputs[1]["y"] = 3
+    assert make_outputs(1) == [1, {"y": 1}]
+
+
+def test_raw_lazy_outputs_are_copied_from_the_cache() -> None:
+    from hilt.eager import lazy
+    from hilt.eager.core import cute_apply
+
+    @cute_apply(raw=True)
+    def make_outputs(x: int) -> list:
+        return [x, {"y": x}]
+
+    cache_clear()
+    make_outputs(1)
+    with lazy():
+        node = make_outputs(1)
+    outputs = node.value
+    outputs.append(2)
+    outputs[1]["y"] = 3
+    assert make_outputs(1) == [1, {"y": 1}]
@@ -0,0 +1,41 @@
+import pytest
+from pathlib import Path
+
+pytest.importorskip("cutlass")
+pytest.importorskip("torch")
+
+from hilt.eager.cache import DiskCache
+
+
+def test_disk_cache_clear_keeps_unrelated_files(tmp_path: Path) -> None:
+    unrelated = tmp_path / "unrelated.txt"
+    unrelated.write_text("keep me")
+    nested = tmp_path / "project" / "ab" / "model.pkl"
+    nested.parent.mkdir(parents=True)
+    nested.write_bytes(b"keep me too")
+
+    cache = DiskCache(tmp_path)
+    cache.insert("ab" + "0" * 62, [1, 2, 3])
+    assert cache.lookup("ab" + "0" * 62) == (True, [1, 2, 3])
+
+    cache.clear()
+    assert cache.lookup("ab" + "0" * 62) == (False, None)
+    assert unrelated.read_text() == "keep me"
+    assert nested.read_bytes() == b"keep me too"
+    assert not cache.namespace.exists()
+
+
+def test_disk_cache_insert_warns_on_write_failures(tmp_path: Path) -> None:
+    # a file where the namespace directory should be
+    (tmp_path / "v1").write_text("not a directory")
+    cache = DiskCache(tmp_path)
+    with pytest.warns(RuntimeWarning, match="Cannot write"):
+        cache.insert("ab" + "0" * 62, [1, 2, 3])
+    assert cache.lookup("ab" + "0" * 62) == (False, None)
+
+
+def test_disk_cache_insert_warns_on_pickling_failures(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path)
+    with pytest.warns(RuntimeWarning, match="Cannot pickle"):
+        cache.insert("ab" + "0" * 62, lambda: None)
+    assert cache.lookup("ab" + "0" * 62) == (False, None)
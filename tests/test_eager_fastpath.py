@@ -0,0 +1,45 @@
+import random
+import pytest
+
+pytest.importorskip("cutlass")
+pytest.importorskip("torch")
+
+import cutlass.cute as cute
+from hilt.eager import fastpath
+from hilt.eager.core import cute_apply
+
+
+@pytest.mark.parametrize("name", list(fastpath.FASTPATH_FUNCTIONS.keys()))
+def test_fastpath_matches_jit(name: str) -> None:
+    report, = fastpath.differential_test([name], num_trials=32, seed=0)
+    assert report.mismatches == []
+    # the fast path would otherwise never be exercised
+    assert report.num_unsupported < report.num_trials
+
+
+@pytest.mark.parametrize("name", ["coalesce", "blocked_product", "logical_divide"])
+def test_dispatch_matches_jit(name: str) -> None:
+    rng = random.Random(1)
+    trials = [fastpath._random_args(name, rng) for _ in range(8)]
+    args_list = [args for args, _ in trials]
+    kwargs_list = [kwargs for _, kwargs in trials]
+    jit_fn = cute_apply()(getattr(cute, name))
+    fn = fastpath.dispatch(name, jit_fn)
+
+    expected = [fastpath._as_comparable(output) for output in jit_fn.batch(args_list, kwargs_list)]
+
+    enabled = fastpath.is_fastpath_enabled()
+    fastpath.set_fastpath_enabled(True)
+    try:
+        outputs = [fastpath._as_comparable(fn(*args, **kwargs)) for args, kwargs in trials]
+        batch_outputs = [fastpath._as_comparable(output) for output in fn.batch(args_list, kwargs_list)]
+    finally:
+        fastpath.set_fastpath_enabled(enabled)
+    assert outputs == expected
+    assert batch_outputs == expected
+
+
+def test_make_layout_zeroes_the_strides_of_size_one_modes() -> None:
+    found, layout = fastpath.try_fastpath("make_layout", ((1, 4),), {})
+    assert found
+    assert (layout.shape, layout.stride) == ((1, 4), (0, 1))
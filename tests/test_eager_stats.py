@@ -0,0 +1,23 @@
+import pytest
+
+pytest.importorskip("cutlass")
+pytest.importorskip("torch")
+
+import cutlass.cute as cute
+from hilt.eager import stats
+from hilt.eager.core import cute_apply, cache_clear
+from hilt.eager.instrumentation import get_function_name
+
+
+def test_batch_records_each_phase_once() -> None:
+    @cute_apply()
+    def make_layout(m: int, n: int) -> cute.Layout:
+        return cute.make_layout((m, n))
+
+    cache_clear()
+    with stats() as recorder:
+        make_layout.batch([(2, 4), (4, 8)])
+    function_stats = recorder.summary()[get_function_name(make_layout.cute_apply_fn)]
+    assert function_stats.calls == 2
+    assert function_stats.phases["pack"].count == 1
+    assert function_stats.phases["unpack"].count == 1
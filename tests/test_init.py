@@ -0,0 +1,22 @@
+import ast
+import pytest
+from pathlib import Path
+
+import hilt
+
+PACKAGE_DIR = Path(hilt.__file__).parent
+
+
+def _get_all(module_name: str) -> list[str]:
+    # parsed rather than imported, as submodules pull in CUTLASS DSL and matplotlib
+    tree = ast.parse((PACKAGE_DIR / f"{module_name}.py").read_text())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(target, "id", None) == "__all__" for target in node.targets):
+            return ast.literal_eval(node.value)
+    raise AssertionError(f"{module_name} has no `__all__`")
+
+
+@pytest.mark.parametrize("module_name", list(hilt._lazy_exports.keys()))
+def test_lazy_exports_match_all(module_name: str) -> None:
+    assert hilt._lazy_exports[module_name] == _get_all(module_name)
+    assert module_name in hilt._lazy_submodules
@@ -0,0 +1,112 @@
+import random
+import pytest
+
+pycute_utils = pytest.importorskip("hilt.pycute_utils")
+
+
+def _random_shape(rng: random.Random, depth: int) -> pycute_utils.IntTuple:
+    if depth == 0 or rng.random() < 0.5:
+        return rng.randint(1, 4)
+    return tuple(_random_shape(rng, depth - 1) for _ in range(rng.randint(1, 3)))
+
+
+def _random_stride(rng: random.Random, shape: pycute_utils.IntTuple, negative: bool) -> pycute_utils.IntTuple:
+    if pycute_utils.is_tuple(shape):
+        return tuple(_random_stride(rng, s, negative) for s in shape)
+    stride = rng.choice([0, 1, 1, 2, 3, 4, 6, 8, 12, 16])
+    return -stride if negative and rng.random() < 0.5 else stride
+
+
+def _random_compact_stride(rng: random.Random, shape: pycute_utils.IntTuple) -> pycute_utils.IntTuple:
+    # the prefix products of the modes, in a random order, i.e., a bijection onto `[0, size)`
+    flat_shape = pycute_utils.flatten(shape)
+    order = list(range(len(flat_shape)))
+    rng.shuffle(order)
+    flat_stride = [0] * len(flat_shape)
+    stride = 1
+    for i in order:
+        flat_stride[i] = stride
+        stride *= flat_shape[i]
+    flat_stride = iter(flat_stride)
+
+    def _nest(s: pycute_utils.IntTuple) -> pycute_utils.IntTuple:
+        return tuple(_nest(x) for x in s) if pycute_utils.is_tuple(s) else next(flat_stride)
+
+    return _nest(shape)
+
+
+def _random_layouts(seed: int, count: int) -> list[pycute_utils.Layout]:
+    rng = random.Random(seed)
+    layouts = []
+    while len(layouts) < count:
+        shape = _random_shape(rng, depth=3)
+        if pycute_utils.product(shape) > 512:
+            continue
+        kind = len(layouts) % 3
+        if kind == 0:
+            stride = _random_compact_stride(rng, shape)
+        else:
+            stride = _random_stride(rng, shape, negative=kind == 2)
+        layouts.append(pycute_utils.Layout(shape, stride))
+    return layouts
+
+
+def _enumerate(layout: pycute_utils.LayoutBase) -> list[int]:
+    return [layout(i) for i in range(pycute_utils.size(layout))]
+
+
+def _get_top_modes(layout: pycute_utils.LayoutBase) -> list[pycute_utils.LayoutBase]:
+    shape = pycute_utils.get_shape(layout)
+    if not pycute_utils.is_tuple(shape):
+        return [layout]
+    return [layout[i] for i in range(len(shape))]
+
+
+LAYOUTS = _random_layouts(seed=0, count=300) + [
+    pycute_utils.Layout((2, 2), (3, 2)),
+    pycute_utils.Layout((4, 8), (0, 1)),
+    pycute_utils.make_swizzled_layout((3, 3, 3), pycute_utils.Layout((16, 64), (64, 1))),
+    pycute_utils.make_swizzled_layout((2, 0, 3), pycute_utils.Layout((8, 8), (1, 8))),
+]
+
+
+@pytest.mark.parametrize("layout", LAYOUTS, ids=str)
+def test_layout_checks_match_enumeration(layout: pycute_utils.LayoutBase) -> None:
+    indices = _enumerate(layout)
+    num_indices = len(indices)
+    assert pycute_utils.is_injective(layout) == (len(set(indices)) == num_indices)
+    for tile_size in (num_indices // 2, num_indices, num_indices + 1):
+        assert pycute_utils.is_surjective(layout, tile_size) == set(range(tile_size)).issubset(indices)
+    assert pycute_utils.is_bijective(layout) == (sorted(indices) == list(range(num_indices)))
+
+    width = 1
+    while width < num_indices and indices[width] == indices[0] + width:
+        width += 1
+    assert pycute_utils.max_contiguous_width(layout) == width
+
+    contiguity = tuple(
+        all(b - a == 1 for a, b in zip(mode_indices, mode_indices[1:]))
+        for mode_indices in map(_enumerate, _get_top_modes(layout))
+    )
+    assert pycute_utils.is_mode_contiguous(layout) == contiguity
+
+
+@pytest.mark.parametrize("layout", _random_layouts(seed=1, count=100), ids=str)
+def test_evaluate_layout_matches_pycute_beyond_size(layout: pycute_utils.Layout) -> None:
+    # as in CuTe, indices beyond the size run along the last mode rather than wrapping around
+    indices = list(range(3 * pycute_utils.size(layout)))
+    assert pycute_utils.evaluate_layout(layout, indices).tolist() == [layout(i) for i in indices]
+
+
+@pytest.mark.parametrize("layout", [
+    pycute_utils.ComposedLayout(pycute_utils.Layout(4, 2), 0, pycute_utils.Layout(8, 1)),
+    pycute_utils.ComposedLayout(pycute_utils.Layout((4, 8), (8, 1)), 3, pycute_utils.Layout((8, 8), (8, 1))),
+    pycute_utils.ComposedLayout(
+        pycute_utils.Layout((2, 2), (1, 16)),
+        0,
+        pycute_utils.make_swizzled_layout((1, 0, 2), pycute_utils.Layout((4, 4), (4, 1))),
+    ),
+], ids=str)
+def test_to_index_array_of_composed_layouts_matches_pycute(layout: pycute_utils.ComposedLayout) -> None:
+    # the inner codomain exceeds the domain of the outer layout
+    assert pycute_utils.to_index_array(layout).reshape(-1, order="F").tolist() == _enumerate(layout)
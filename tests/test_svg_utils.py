@@ -0,0 +1,28 @@
+import re
+import pytest
+from pathlib import Path
+
+pycute_utils = pytest.importorskip("hilt.pycute_utils")
+svg_utils = pytest.importorskip("hilt.svg_utils")
+
+
+def _get_labels(svg: str) -> list[int]:
+    return [int(label) for label in re.findall(r'em">(\d+)</tspan>', svg)]
+
+
+@pytest.mark.parametrize("layout", [
+    pycute_utils.Layout((4, 8), (8, 1)),
+    pycute_utils.make_swizzled_layout((3, 3, 3), pycute_utils.Layout((16, 64), (64, 1))),
+])
+def test_iter_layout_svg_matches_to_index_array(layout: pycute_utils.LayoutBase) -> None:
+    svg = "".join(svg_utils.iter_layout_svg(layout, label_map=str, headers=False))
+    assert _get_labels(svg) == pycute_utils.to_index_array(layout).reshape(-1).tolist()
+
+
+def test_visualize_layout_streams_svg_and_html(tmp_path: Path) -> None:
+    layout = pycute_utils.make_swizzled_layout((2, 0, 2), pycute_utils.Layout((8, 8), (8, 1)))
+    path = pycute_utils.visualize_layout(layout, format="svg", path=tmp_path / "layout.svg")
+    assert path.read_text().startswith("<svg")
+    path = pycute_utils.visualize_layout(layout, format="html", path=tmp_path / "html", tile_size=4)
+    assert path.name == "index.html"
+    assert len(list((tmp_path / "html" / "tiles").glob("*.svg"))) == 4